@@ -0,0 +1,70 @@
+import argparse
+import random
+import string
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from core.search_index import SearchIndex  # noqa: E402
+
+
+def _random_word(rng: random.Random) -> str:
+    return "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 9)))
+
+
+def _make_blobs(rng: random.Random, size: int) -> list[str]:
+    return [" ".join(_random_word(rng) for _ in range(rng.randint(2, 6))) for _ in range(size)]
+
+
+def _bench(fn, queries: list[str], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for query in queries:
+            fn(query)
+        best = min(best, time.perf_counter() - start)
+    return best / len(queries) * 1e6
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare linear search-blob scans with the trigram index")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"{'rows':>8}  {'build ms':>9}  {'scan us/q':>10}  {'index us/q':>11}  {'avg hits':>8}")
+    for size in args.sizes:
+        rng = random.Random(args.seed)
+        blobs = _make_blobs(rng, size)
+        # Real-looking queries: 4-6 character slices taken from existing titles.
+        queries = []
+        for _ in range(args.queries):
+            blob = rng.choice(blobs)
+            start = rng.randrange(max(1, len(blob) - 6))
+            queries.append(blob[start:start + rng.randint(4, 6)])
+
+        start = time.perf_counter()
+        index = SearchIndex(blobs)
+        build_ms = (time.perf_counter() - start) * 1e3
+
+        def scan(query):
+            return [row for row, blob in enumerate(blobs) if query in blob]
+
+        def lookup(query):
+            # Bypass the incremental cache so every query is measured cold.
+            candidates = index.candidates(query)
+            return [row for row in candidates if query in blobs[row]]
+
+        scan_us = _bench(scan, queries, args.repeat)
+        index_us = _bench(lookup, queries, args.repeat)
+        hits = sum(len(lookup(q)) for q in queries) / len(queries)
+        print(f"{size:>8}  {build_ms:>9.1f}  {scan_us:>10.1f}  {index_us:>11.1f}  {hits:>8.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
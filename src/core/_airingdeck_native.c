@@ -1,234 +1,525 @@
 #define PY_SSIZE_T_CLEAN
 #include <Python.h>
 
-static PyObject *filter_contains_indices(PyObject *self, PyObject *args) {
-    PyObject *entries = NULL;
+static int get_column(PyObject *obj, Py_buffer *view, char format, const char *name) {
+    if (PyObject_GetBuffer(obj, view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) < 0) {
+        return -1;
+    }
+    const char *fmt = view->format;
+    if (fmt != NULL && (fmt[0] == '@' || fmt[0] == '=' || fmt[0] == '<')) {
+        ++fmt;
+    }
+    if (view->ndim != 1 || fmt == NULL || fmt[0] != format || fmt[1] != '\0') {
+        PyBuffer_Release(view);
+        PyErr_Format(PyExc_TypeError, "%s must be a 1-d array of type '%c'", name, format);
+        return -1;
+    }
+    return 0;
+}
+
+#define FUZZY_SEPARATOR 0x1F
+#define FUZZY_MAX_QUERY 32
+
+typedef struct {
+    int row;
+    int score;
+} ranked_row;
+
+static int fuzzy_max_errors(Py_ssize_t query_len) {
+    if (query_len <= 3 || query_len > FUZZY_MAX_QUERY) {
+        return 0;
+    }
+    return query_len <= 6 ? 1 : 2;
+}
+
+/* Smallest edit distance between the query and any substring of text[start:end]. */
+static int approx_substring_distance(int kind, const void *data, Py_ssize_t start, Py_ssize_t end,
+                                     const Py_UCS4 *query, int query_len) {
+    int prev[FUZZY_MAX_QUERY + 1];
+    int cur[FUZZY_MAX_QUERY + 1];
+    for (int i = 0; i <= query_len; ++i) {
+        prev[i] = i;
+    }
+    int best = query_len;
+    for (Py_ssize_t pos = start; pos < end; ++pos) {
+        Py_UCS4 c = PyUnicode_READ(kind, data, pos);
+        cur[0] = 0;
+        for (int i = 1; i <= query_len; ++i) {
+            int cost = prev[i - 1] + (query[i - 1] != c);
+            int del = prev[i] + 1;
+            int ins = cur[i - 1] + 1;
+            int value = cost < del ? cost : del;
+            cur[i] = value < ins ? value : ins;
+        }
+        if (cur[query_len] < best) {
+            best = cur[query_len];
+        }
+        memcpy(prev, cur, sizeof(int) * (size_t)(query_len + 1));
+    }
+    return best;
+}
+
+static int score_field(PyObject *text, int kind, const void *data, Py_ssize_t start, Py_ssize_t end,
+                       PyObject *query_obj, const Py_UCS4 *query, Py_ssize_t query_len, int max_errors) {
+    if (end - start <= 0) {
+        return 0;
+    }
+    Py_ssize_t found = PyUnicode_Find(text, query_obj, start, end, 1);
+    if (found == -2) {
+        PyErr_Clear();
+        return 0;
+    }
+    if (found >= 0) {
+        Py_ssize_t offset = found - start;
+        int score = 1000 - (int)(offset < 100 ? offset : 100);
+        if (offset == 0 || PyUnicode_READ(kind, data, found - 1) == ' ') {
+            score += 50;
+        }
+        return score;
+    }
+
+    Py_ssize_t matched = 0;
+    Py_ssize_t first = -1;
+    Py_ssize_t last = -1;
+    for (Py_ssize_t pos = start; pos < end && matched < query_len; ++pos) {
+        if (PyUnicode_READ(kind, data, pos) == query[matched]) {
+            if (matched == 0) {
+                first = pos;
+            }
+            last = pos;
+            ++matched;
+        }
+    }
+    if (matched == query_len) {
+        Py_ssize_t gaps = (last - first + 1) - query_len;
+        return 600 - (int)(gaps < 300 ? gaps : 300);
+    }
+
+    if (max_errors > 0) {
+        int distance = approx_substring_distance(kind, data, start, end, query, (int)query_len);
+        if (distance <= max_errors) {
+            return 400 - 100 * distance;
+        }
+    }
+    return 0;
+}
+
+static int compare_ranked(const void *a, const void *b) {
+    const ranked_row *left = (const ranked_row *)a;
+    const ranked_row *right = (const ranked_row *)b;
+    if (left->score != right->score) {
+        return right->score - left->score;
+    }
+    return left->row - right->row;
+}
+
+static PyObject *fuzzy_rank_indices(PyObject *self, PyObject *args) {
+    PyObject *texts = NULL;
     PyObject *query_obj = NULL;
+    Py_ssize_t limit = 0;
 
-    if (!PyArg_ParseTuple(args, "OO", &entries, &query_obj)) {
+    if (!PyArg_ParseTuple(args, "OO|n", &texts, &query_obj, &limit)) {
         return NULL;
     }
-
-    if (!PyList_Check(entries)) {
-        PyErr_SetString(PyExc_TypeError, "entries must be a list");
+    if (!PyList_Check(texts)) {
+        PyErr_SetString(PyExc_TypeError, "texts must be a list");
         return NULL;
     }
-
     if (!PyUnicode_Check(query_obj)) {
         PyErr_SetString(PyExc_TypeError, "query must be a string");
         return NULL;
     }
 
     Py_ssize_t query_len = PyUnicode_GET_LENGTH(query_obj);
-    Py_ssize_t count = PyList_GET_SIZE(entries);
-
-    PyObject *result = PyList_New(0);
-    if (result == NULL) {
+    Py_ssize_t count = PyList_GET_SIZE(texts);
+    if (query_len == 0 || count == 0) {
+        return PyList_New(0);
+    }
+    if (count > INT_MAX) {
+        PyErr_SetString(PyExc_OverflowError, "too many rows");
+        return NULL;
+    }
+    Py_UCS4 *query = PyUnicode_AsUCS4Copy(query_obj);
+    if (query == NULL) {
         return NULL;
     }
+    int max_errors = fuzzy_max_errors(query_len);
 
-    if (query_len == 0) {
-        for (Py_ssize_t i = 0; i < count; ++i) {
-            PyObject *idx = PyLong_FromSsize_t(i);
-            if (idx == NULL || PyList_Append(result, idx) < 0) {
-                Py_XDECREF(idx);
-                Py_DECREF(result);
-                return NULL;
+    ranked_row *ranked = PyMem_Malloc(sizeof(ranked_row) * (size_t)count);
+    if (ranked == NULL) {
+        PyMem_Free(query);
+        return PyErr_NoMemory();
+    }
+    Py_ssize_t hits = 0;
+    for (Py_ssize_t row = 0; row < count; ++row) {
+        PyObject *text = PyList_GET_ITEM(texts, row); /* borrowed */
+        if (!PyUnicode_Check(text)) {
+            continue;
+        }
+        int kind = PyUnicode_KIND(text);
+        const void *data = PyUnicode_DATA(text);
+        Py_ssize_t length = PyUnicode_GET_LENGTH(text);
+        int best = 0;
+        Py_ssize_t start = 0;
+        for (Py_ssize_t pos = 0; pos <= length; ++pos) {
+            if (pos < length && PyUnicode_READ(kind, data, pos) != FUZZY_SEPARATOR) {
+                continue;
+            }
+            int score = score_field(text, kind, data, start, pos, query_obj, query, query_len, max_errors);
+            if (score > best) {
+                best = score;
             }
-            Py_DECREF(idx);
+            start = pos + 1;
+        }
+        if (best > 0) {
+            ranked[hits].row = (int)row;
+            ranked[hits].score = best;
+            ++hits;
         }
-        return result;
     }
+    PyMem_Free(query);
 
-    for (Py_ssize_t i = 0; i < count; ++i) {
-        PyObject *entry = PyList_GET_ITEM(entries, i); /* borrowed */
-        if (!PyDict_Check(entry)) {
-            continue;
-        }
+    qsort(ranked, (size_t)hits, sizeof(ranked_row), compare_ranked);
+    if (limit > 0 && hits > limit) {
+        hits = limit;
+    }
 
-        PyObject *blob = PyDict_GetItemString(entry, "_search_blob"); /* borrowed */
-        if (blob == NULL || !PyUnicode_Check(blob)) {
-            continue;
+    PyObject *result = PyList_New(hits);
+    for (Py_ssize_t i = 0; result != NULL && i < hits; ++i) {
+        PyObject *pair = Py_BuildValue("(ii)", ranked[i].row, ranked[i].score);
+        if (pair == NULL) {
+            Py_CLEAR(result);
+            break;
         }
+        PyList_SET_ITEM(result, i, pair);
+    }
+    PyMem_Free(ranked);
+    return result;
+}
 
-        Py_ssize_t found = PyUnicode_Find(blob, query_obj, 0, PyUnicode_GET_LENGTH(blob), 1);
-        if (found >= 0) {
-            PyObject *idx = PyLong_FromSsize_t(i);
-            if (idx == NULL || PyList_Append(result, idx) < 0) {
-                Py_XDECREF(idx);
-                Py_DECREF(result);
-                return NULL;
+typedef struct {
+    double key;
+    int row;
+} keyed_row;
+
+static int keyed_before(const keyed_row *left, const keyed_row *right, int descending) {
+    /* Strict ordering only: equal keys keep their input order (stable). */
+    return descending ? left->key > right->key : left->key < right->key;
+}
+
+static void merge_sort_keyed(keyed_row *items, keyed_row *scratch, Py_ssize_t count, int descending) {
+    /* Bottom-up merge sort: stable and O(n log n) without recursion. */
+    for (Py_ssize_t width = 1; width < count; width *= 2) {
+        for (Py_ssize_t left = 0; left < count; left += 2 * width) {
+            Py_ssize_t mid = left + width < count ? left + width : count;
+            Py_ssize_t right = left + 2 * width < count ? left + 2 * width : count;
+            Py_ssize_t i = left, j = mid, k = left;
+            while (i < mid && j < right) {
+                if (keyed_before(&items[j], &items[i], descending)) {
+                    scratch[k++] = items[j++];
+                } else {
+                    scratch[k++] = items[i++];
+                }
+            }
+            while (i < mid) {
+                scratch[k++] = items[i++];
+            }
+            while (j < right) {
+                scratch[k++] = items[j++];
             }
-            Py_DECREF(idx);
         }
+        memcpy(items, scratch, sizeof(keyed_row) * (size_t)count);
     }
-
-    return result;
 }
 
-static int matches_query(PyObject *entry, PyObject *query_obj, int use_query) {
-    if (!use_query) {
-        return 1;
+static int get_key_column(PyObject *obj, Py_buffer *view, char *format) {
+    if (PyObject_GetBuffer(obj, view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) < 0) {
+        return -1;
     }
-    PyObject *blob = PyDict_GetItemString(entry, "_search_blob"); /* borrowed */
-    if (blob == NULL || !PyUnicode_Check(blob)) {
-        return 0;
+    const char *fmt = view->format;
+    if (fmt != NULL && (fmt[0] == '@' || fmt[0] == '=' || fmt[0] == '<')) {
+        ++fmt;
     }
-    Py_ssize_t found = PyUnicode_Find(blob, query_obj, 0, PyUnicode_GET_LENGTH(blob), 1);
-    return found >= 0;
+    if (view->ndim != 1 || fmt == NULL || fmt[1] != '\0' ||
+        (fmt[0] != 'q' && fmt[0] != 'i' && fmt[0] != 'd')) {
+        PyBuffer_Release(view);
+        PyErr_SetString(PyExc_TypeError, "keys must be a 1-d array of type 'q', 'i' or 'd'");
+        return -1;
+    }
+    *format = fmt[0];
+    return 0;
 }
 
-static int matches_only_today(PyObject *entry, int only_today, int today_weekday) {
-    if (!only_today) {
-        return 1;
+static double read_key(const Py_buffer *view, char format, int row) {
+    if (format == 'q') {
+        return (double)((const long long *)view->buf)[row];
     }
-    PyObject *day_obj = PyDict_GetItemString(entry, "calendar_day"); /* borrowed */
-    if (day_obj == NULL || !PyLong_Check(day_obj)) {
-        return 0;
+    if (format == 'i') {
+        return (double)((const int *)view->buf)[row];
     }
-    long day = PyLong_AsLong(day_obj);
-    if (PyErr_Occurred()) {
-        PyErr_Clear();
-        return 0;
+    return ((const double *)view->buf)[row];
+}
+
+static PyObject *keyed_rows_to_list(const keyed_row *items, Py_ssize_t count) {
+    PyObject *result = PyList_New(count);
+    for (Py_ssize_t i = 0; result != NULL && i < count; ++i) {
+        PyObject *idx = PyLong_FromLong(items[i].row);
+        if (idx == NULL) {
+            Py_CLEAR(result);
+            break;
+        }
+        PyList_SET_ITEM(result, i, idx);
     }
-    return (int)day == today_weekday;
+    return result;
 }
 
-static int matches_genre(PyObject *media, PyObject *genre_obj, int use_genre) {
-    if (!use_genre) {
-        return 1;
+static PyObject *sort_indices_by_key(PyObject *self, PyObject *args) {
+    PyObject *rows_obj = NULL;
+    PyObject *keys_obj = NULL;
+    int descending = 0;
+
+    if (!PyArg_ParseTuple(args, "OOp", &rows_obj, &keys_obj, &descending)) {
+        return NULL;
     }
-    if (!PyDict_Check(media)) {
-        return 0;
+
+    Py_buffer rows_view, keys_view;
+    char key_format = 0;
+    if (get_column(rows_obj, &rows_view, 'i', "rows") < 0) {
+        return NULL;
     }
-    PyObject *genres = PyDict_GetItemString(media, "genres"); /* borrowed */
-    if (genres == NULL || !PyList_Check(genres)) {
-        return 0;
+    if (get_key_column(keys_obj, &keys_view, &key_format) < 0) {
+        PyBuffer_Release(&rows_view);
+        return NULL;
     }
 
-    Py_ssize_t genres_count = PyList_GET_SIZE(genres);
-    for (Py_ssize_t j = 0; j < genres_count; ++j) {
-        PyObject *genre = PyList_GET_ITEM(genres, j); /* borrowed */
-        if (!PyUnicode_Check(genre)) {
-            continue;
-        }
-        PyObject *lower = PyObject_CallMethod(genre, "lower", NULL);
-        if (lower == NULL) {
-            PyErr_Clear();
-            continue;
-        }
-        int is_match = PyObject_RichCompareBool(lower, genre_obj, Py_EQ);
-        Py_DECREF(lower);
-        if (is_match < 0) {
-            PyErr_Clear();
-            continue;
-        }
-        if (is_match == 1) {
-            return 1;
-        }
+    const int *rows = (const int *)rows_view.buf;
+    Py_ssize_t count = rows_view.len / (Py_ssize_t)sizeof(int);
+    Py_ssize_t key_len = keys_view.len / keys_view.itemsize;
+    keyed_row *items = PyMem_Malloc(sizeof(keyed_row) * (size_t)(count > 0 ? count : 1) * 2);
+    if (items == NULL) {
+        PyBuffer_Release(&rows_view);
+        PyBuffer_Release(&keys_view);
+        return PyErr_NoMemory();
     }
-    return 0;
-}
 
-static int matches_min_score(PyObject *media, int min_score) {
-    if (min_score <= 0) {
-        return 1;
+    int out_of_range = 0;
+    for (Py_ssize_t i = 0; i < count; ++i) {
+        int row = rows[i];
+        if (row < 0 || row >= key_len) {
+            out_of_range = 1;
+            break;
+        }
+        items[i].key = read_key(&keys_view, key_format, row);
+        items[i].row = row;
     }
-    if (!PyDict_Check(media)) {
-        return 0;
+    PyBuffer_Release(&rows_view);
+    PyBuffer_Release(&keys_view);
+    if (out_of_range) {
+        PyMem_Free(items);
+        PyErr_SetString(PyExc_IndexError, "row out of range for keys");
+        return NULL;
     }
-    PyObject *score_obj = PyDict_GetItemString(media, "averageScore"); /* borrowed */
-    if (score_obj == NULL || score_obj == Py_None) {
-        return 0;
+
+    merge_sort_keyed(items, items + count, count, descending);
+
+    PyObject *result = keyed_rows_to_list(items, count);
+    PyMem_Free(items);
+    return result;
+}
+
+static PyObject *int32_view(const int *values, Py_ssize_t count) {
+    /* Immutable int32 buffer (memoryview over bytes) instead of a list of ints. */
+    PyObject *data = PyBytes_FromStringAndSize((const char *)values, count * (Py_ssize_t)sizeof(int));
+    if (data == NULL) {
+        return NULL;
     }
-    double score = PyFloat_AsDouble(score_obj);
-    if (PyErr_Occurred()) {
-        PyErr_Clear();
-        return 0;
+    PyObject *raw = PyMemoryView_FromObject(data);
+    Py_DECREF(data);
+    if (raw == NULL) {
+        return NULL;
     }
-    return score >= (double)min_score;
+    PyObject *view = PyObject_CallMethod(raw, "cast", "s", "i");
+    Py_DECREF(raw);
+    return view;
 }
 
-static PyObject *filter_advanced_indices(PyObject *self, PyObject *args) {
-    PyObject *entries = NULL;
-    PyObject *query_obj = NULL;
-    PyObject *genre_obj = NULL;
+static PyObject *filter_sort_buckets(PyObject *self, PyObject *args) {
+    PyObject *rows_obj = NULL;
+    PyObject *weekday_obj = NULL;
+    PyObject *score_obj = NULL;
+    PyObject *mask_obj = NULL;
+    PyObject *keys_obj = NULL;
+    unsigned long long genre_mask = 0;
     int min_score = 0;
     int only_today = 0;
     int today_weekday = -1;
+    int descending = 0;
 
-    if (!PyArg_ParseTuple(args, "OOOiii", &entries, &query_obj, &genre_obj, &min_score, &only_today, &today_weekday)) {
+    if (!PyArg_ParseTuple(args, "OOOOOKipip", &rows_obj, &weekday_obj, &score_obj, &mask_obj, &keys_obj,
+                          &genre_mask, &min_score, &only_today, &today_weekday, &descending)) {
         return NULL;
     }
 
-    if (!PyList_Check(entries)) {
-        PyErr_SetString(PyExc_TypeError, "entries must be a list");
+    Py_buffer rows_view, weekday_view, score_view, mask_view, keys_view;
+    char key_format = 0;
+    int use_keys = keys_obj != Py_None;
+    if (get_column(rows_obj, &rows_view, 'i', "rows") < 0) {
         return NULL;
     }
-    if (!PyUnicode_Check(query_obj)) {
-        PyErr_SetString(PyExc_TypeError, "query must be a string");
+    if (get_column(weekday_obj, &weekday_view, 'b', "weekday") < 0) {
+        PyBuffer_Release(&rows_view);
         return NULL;
     }
-    if (!PyUnicode_Check(genre_obj)) {
-        PyErr_SetString(PyExc_TypeError, "selected_genre must be a string");
+    if (get_column(score_obj, &score_view, 'i', "score") < 0) {
+        PyBuffer_Release(&rows_view);
+        PyBuffer_Release(&weekday_view);
         return NULL;
     }
-
-    int use_query = PyUnicode_GET_LENGTH(query_obj) > 0;
-    int use_genre = PyUnicode_GET_LENGTH(genre_obj) > 0 &&
-                    PyUnicode_CompareWithASCIIString(genre_obj, "all genres") != 0;
-
-    Py_ssize_t count = PyList_GET_SIZE(entries);
-    PyObject *result = PyList_New(0);
-    if (result == NULL) {
+    if (get_column(mask_obj, &mask_view, 'Q', "genre_mask") < 0) {
+        PyBuffer_Release(&rows_view);
+        PyBuffer_Release(&weekday_view);
+        PyBuffer_Release(&score_view);
+        return NULL;
+    }
+    if (use_keys && get_key_column(keys_obj, &keys_view, &key_format) < 0) {
+        PyBuffer_Release(&rows_view);
+        PyBuffer_Release(&weekday_view);
+        PyBuffer_Release(&score_view);
+        PyBuffer_Release(&mask_view);
         return NULL;
     }
 
-    for (Py_ssize_t i = 0; i < count; ++i) {
-        PyObject *entry = PyList_GET_ITEM(entries, i); /* borrowed */
-        if (!PyDict_Check(entry)) {
-            continue;
-        }
+    const int *rows = (const int *)rows_view.buf;
+    const signed char *weekday = (const signed char *)weekday_view.buf;
+    const int *score = (const int *)score_view.buf;
+    const unsigned long long *masks = (const unsigned long long *)mask_view.buf;
+    Py_ssize_t row_count = rows_view.len / (Py_ssize_t)sizeof(int);
+    Py_ssize_t table_len = weekday_view.len;
+    if (score_view.len / (Py_ssize_t)sizeof(int) < table_len) {
+        table_len = score_view.len / (Py_ssize_t)sizeof(int);
+    }
+    if (mask_view.len / (Py_ssize_t)sizeof(unsigned long long) < table_len) {
+        table_len = mask_view.len / (Py_ssize_t)sizeof(unsigned long long);
+    }
+    if (use_keys && keys_view.len / keys_view.itemsize < table_len) {
+        table_len = keys_view.len / keys_view.itemsize;
+    }
 
-        if (!matches_only_today(entry, only_today, today_weekday)) {
-            continue;
+    size_t slots = (size_t)(row_count > 0 ? row_count : 1);
+    keyed_row *items = PyMem_Malloc(sizeof(keyed_row) * slots * 2);
+    /* Output layout: the combined rows, then the seven day slices back to back. */
+    int *out = PyMem_Malloc(sizeof(int) * slots * 2);
+    Py_ssize_t kept = 0;
+    Py_ssize_t day_counts[7] = {0, 0, 0, 0, 0, 0, 0};
+    if (items != NULL && out != NULL) {
+        /* Only C memory is touched below: the columns are immutable snapshot
+           buffers pinned by the views above, so the GIL can be released. */
+        Py_BEGIN_ALLOW_THREADS
+        for (Py_ssize_t i = 0; i < row_count; ++i) {
+            int row = rows[i];
+            if (row < 0 || row >= table_len) {
+                continue;
+            }
+            int day = weekday[row];
+            if (day < 0 || day > 6) {
+                continue;
+            }
+            if (only_today && day != today_weekday) {
+                continue;
+            }
+            if (genre_mask != 0 && (masks[row] & genre_mask) == 0) {
+                continue;
+            }
+            if (min_score > 0 && score[row] < min_score) {
+                continue;
+            }
+            items[kept].key = use_keys ? read_key(&keys_view, key_format, row) : 0.0;
+            items[kept].row = row;
+            ++kept;
+            ++day_counts[day];
         }
-        if (!matches_query(entry, query_obj, use_query)) {
-            continue;
+        if (use_keys) {
+            merge_sort_keyed(items, items + kept, kept, descending);
         }
-
-        PyObject *media = PyDict_GetItemString(entry, "media"); /* borrowed */
-        if (!matches_genre(media, genre_obj, use_genre)) {
-            continue;
+        Py_ssize_t fill[7];
+        Py_ssize_t offset = kept;
+        for (int day = 0; day < 7; ++day) {
+            fill[day] = offset;
+            offset += day_counts[day];
         }
-        if (!matches_min_score(media, min_score)) {
-            continue;
+        /* The combined rows are sorted, so splitting them keeps every day sorted. */
+        for (Py_ssize_t i = 0; i < kept; ++i) {
+            out[i] = items[i].row;
+            out[fill[weekday[items[i].row]]++] = items[i].row;
         }
+        Py_END_ALLOW_THREADS
+    }
+
+    PyBuffer_Release(&rows_view);
+    PyBuffer_Release(&weekday_view);
+    PyBuffer_Release(&score_view);
+    PyBuffer_Release(&mask_view);
+    if (use_keys) {
+        PyBuffer_Release(&keys_view);
+    }
+    PyMem_Free(items);
+    if (items == NULL || out == NULL) {
+        PyMem_Free(out);
+        return PyErr_NoMemory();
+    }
 
-        PyObject *idx = PyLong_FromSsize_t(i);
-        if (idx == NULL || PyList_Append(result, idx) < 0) {
-            Py_XDECREF(idx);
-            Py_DECREF(result);
-            return NULL;
+    PyObject *buffer = int32_view(out, kept * 2);
+    PyMem_Free(out);
+    if (buffer == NULL) {
+        return NULL;
+    }
+    PyObject *combined = PySequence_GetSlice(buffer, 0, kept);
+    PyObject *days = PyTuple_New(7);
+    PyObject *counts = PyList_New(7);
+    int failed = combined == NULL || days == NULL || counts == NULL;
+    Py_ssize_t offset = kept;
+    for (int day = 0; !failed && day < 7; ++day) {
+        PyObject *bucket = PySequence_GetSlice(buffer, offset, offset + day_counts[day]);
+        PyObject *count = PyLong_FromSsize_t(day_counts[day]);
+        if (bucket == NULL || count == NULL) {
+            Py_XDECREF(bucket);
+            Py_XDECREF(count);
+            failed = 1;
+            break;
         }
-        Py_DECREF(idx);
+        PyTuple_SET_ITEM(days, day, bucket);
+        PyList_SET_ITEM(counts, day, count);
+        offset += day_counts[day];
     }
+    Py_DECREF(buffer);
 
-    return result;
+    if (failed) {
+        Py_XDECREF(combined);
+        Py_XDECREF(days);
+        Py_XDECREF(counts);
+        return NULL;
+    }
+    return Py_BuildValue("(NNN)", days, combined, counts);
 }
 
 static PyMethodDef AiringDeckNativeMethods[] = {
     {
-        "filter_contains_indices",
-        filter_contains_indices,
+        "fuzzy_rank_indices",
+        fuzzy_rank_indices,
+        METH_VARARGS,
+        "Rank texts against query (substring, subsequence, then edit distance); return (row, score) pairs."
+    },
+    {
+        "sort_indices_by_key",
+        sort_indices_by_key,
         METH_VARARGS,
-        "Return entry indices where entry['_search_blob'] contains query."
+        "Stable sort of row numbers by a numeric key column; returns the permuted rows."
     },
     {
-        "filter_advanced_indices",
-        filter_advanced_indices,
+        "filter_sort_buckets",
+        filter_sort_buckets,
         METH_VARARGS,
-        "Return indices matching query/genre/min_score/only_today filters."
+        "Filter rows once (GIL released), sort by a key column and split by weekday; rows come back as int32 memoryviews."
     },
     {NULL, NULL, 0, NULL}
 };
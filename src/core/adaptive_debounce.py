@@ -0,0 +1,66 @@
+"""Filter debounce sized from measured model-update latency.
+
+A fixed debounce delays every keystroke on small lists and is too short on
+huge ones. Recent ``_update_ui_models`` timings decide instead: when the p95
+is well under a frame the update runs right away, otherwise keystrokes are
+coalesced over a window proportional to that p95.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from typing import Optional
+
+
+class AdaptiveDebounce:
+    """Rolling latency samples and the debounce window derived from them."""
+
+    # p95 below this applies each keystroke immediately.
+    IMMEDIATE_BELOW_MS = 8.0
+    # Coalescing window bounds and its size relative to the p95.
+    MIN_WINDOW_MS = 60
+    MAX_WINDOW_MS = 400
+    WINDOW_FACTOR = 2.0
+    # Before any sample exists, lists up to this many rows apply immediately.
+    SMALL_LIST_ROWS = 400
+    DEFAULT_WINDOW_MS = 260
+
+    def __init__(self, samples: int = 32):
+        self._samples: deque[float] = deque(maxlen=max(1, int(samples)))
+        self.last_ms: Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def record(self, seconds: float):
+        self.last_ms = max(0.0, float(seconds)) * 1000.0
+        self._samples.append(self.last_ms)
+
+    def p95_ms(self) -> Optional[float]:
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, math.ceil(0.95 * len(ordered)) - 1)]
+
+    def interval_ms(self, row_count: int) -> int:
+        """Debounce for the next keystroke; ``0`` means apply now."""
+        p95 = self.p95_ms()
+        if p95 is None:
+            return 0 if row_count <= self.SMALL_LIST_ROWS else self.DEFAULT_WINDOW_MS
+        if p95 < self.IMMEDIATE_BELOW_MS:
+            return 0
+        return int(min(self.MAX_WINDOW_MS, max(self.MIN_WINDOW_MS, p95 * self.WINDOW_FACTOR)))
+
+    def clear(self):
+        self._samples.clear()
+        self.last_ms = None
+
+    def stats(self, row_count: int) -> dict[str, float]:
+        p95 = self.p95_ms()
+        return {
+            "debounceMs": self.interval_ms(row_count),
+            "p95Ms": round(p95, 2) if p95 is not None else -1,
+            "lastMs": round(self.last_ms, 2) if self.last_ms is not None else -1,
+            "samples": len(self._samples),
+        }
@@ -1,3 +1,5 @@
+from bisect import bisect_left
+
 from PySide6.QtCore import QAbstractListModel, Qt, QModelIndex, Property, Signal
 
 class AnimeModel(QAbstractListModel):
@@ -10,6 +12,9 @@ class AnimeModel(QAbstractListModel):
     IsTodayRole = Qt.UserRole + 4
     ProgressRole = Qt.UserRole + 5
     RatingDisplayRole = Qt.UserRole + 6
+
+    # Above this many single-row moves a reset is cheaper for attached views.
+    MAX_ROW_MOVES = 16
     
     countChanged = Signal()
     
@@ -17,6 +22,7 @@ class AnimeModel(QAbstractListModel):
         super().__init__(parent)
         self._entries = []
         self._signature = ()
+        self._row_values = []
 
     @Property(int, notify=countChanged)
     def count(self):
@@ -57,40 +63,199 @@ class AnimeModel(QAbstractListModel):
         return None
 
     def update_data(self, new_entries):
-        """Aggiorna il modello con nuovi dati"""
-        new_signature = tuple(self._entry_key(entry) for entry in new_entries)
+        """Aggiorna il modello con nuovi dati.
+
+        Keyed diff against the current rows: removed, inserted and moved rows
+        are signalled individually, and ``dataChanged`` is emitted only for
+        rows whose role values changed, with only those roles. Rows on the
+        longest run that kept its relative order stay put; only the others
+        are moved, and a reorder needing more than ``MAX_ROW_MOVES`` moves
+        falls back to a model reset.
+        """
+        new_keys = [self._entry_key(entry) for entry in new_entries]
         old_count = len(self._entries)
-        new_count = len(new_entries)
-
-        # If row identity/order is unchanged, update in-place and notify only role changes.
-        if self._signature == new_signature:
-            if new_count == 0:
-                self._entries = new_entries
-                return
-            self._entries = new_entries
-            top_left = self.index(0, 0)
-            bottom_right = self.index(new_count - 1, 0)
-            self.dataChanged.emit(
-                top_left,
-                bottom_right,
-                [
-                    self.MediaRole,
-                    self.DisplayTitleRole,
-                    self.AiringTimeRole,
-                    self.IsTodayRole,
-                    self.ProgressRole,
-                    self.RatingDisplayRole,
-                ],
-            )
+
+        stable = None
+        if len(set(new_keys)) == len(new_keys):
+            stable = self._stable_keys(new_keys)
+            kept = len(set(self._signature).intersection(new_keys))
+            if kept - len(stable) > self.MAX_ROW_MOVES:
+                stable = None
+
+        if stable is None:
+            # Duplicate keys cannot be diffed reliably, and a large reshuffle
+            # is cheaper for views as one reset than as many single moves.
+            self.beginResetModel()
+            self._entries = list(new_entries)
+            self._signature = tuple(new_keys)
+            self._row_values = [self._role_values(entry) for entry in self._entries]
+            self.endResetModel()
+            if old_count != len(self._entries):
+                self.countChanged.emit()
             return
 
-        self.beginResetModel()
-        self._entries = new_entries
-        self._signature = new_signature
-        self.endResetModel()
-        if old_count != new_count:
+        self._remove_missing_rows(set(new_keys))
+        self._move_rows(new_keys, stable)
+        self._insert_rows(new_entries, new_keys)
+
+        self._entries = list(new_entries)
+        self._signature = tuple(new_keys)
+        self._emit_changed_roles()
+        if old_count != len(self._entries):
             self.countChanged.emit()
 
+    def _stable_keys(self, new_keys):
+        """Keys on the longest increasing run of old positions, in new order."""
+        old_rows = {key: row for row, key in enumerate(self._signature)}
+        kept = [key for key in new_keys if key in old_rows]
+        tails = []
+        tail_at = []
+        previous = [-1] * len(kept)
+        for i, key in enumerate(kept):
+            pos = bisect_left(tails, old_rows[key])
+            if pos == len(tails):
+                tails.append(old_rows[key])
+                tail_at.append(i)
+            else:
+                tails[pos] = old_rows[key]
+                tail_at[pos] = i
+            previous[i] = tail_at[pos - 1] if pos else -1
+        stable = set()
+        i = tail_at[-1] if tail_at else -1
+        while i >= 0:
+            stable.add(kept[i])
+            i = previous[i]
+        return stable
+
+    def _remove_missing_rows(self, wanted_keys):
+        keys = list(self._signature)
+        row = len(keys) - 1
+        while row >= 0:
+            if keys[row] in wanted_keys:
+                row -= 1
+                continue
+            last = row
+            while row - 1 >= 0 and keys[row - 1] not in wanted_keys:
+                row -= 1
+            self.beginRemoveRows(QModelIndex(), row, last)
+            del self._entries[row:last + 1]
+            del self._row_values[row:last + 1]
+            del keys[row:last + 1]
+            self._signature = tuple(keys)
+            self.endRemoveRows()
+            row -= 1
+
+    def _move_rows(self, new_keys, stable):
+        # Place each out-of-order row right after its nearest already placed
+        # predecessor; stable rows never move.
+        keys = list(self._signature)
+        present = set(keys)
+        anchor = None
+        for key in new_keys:
+            if key not in present:
+                continue
+            if key in stable:
+                anchor = key
+                continue
+            source = keys.index(key)
+            dest = keys.index(anchor) + 1 if anchor is not None else 0
+            anchor = key
+            if dest in (source, source + 1):
+                continue
+            # Qt expects the destination index as it was before the move.
+            self.beginMoveRows(QModelIndex(), source, source, QModelIndex(), dest)
+            target = dest - 1 if source < dest else dest
+            keys.insert(target, keys.pop(source))
+            self._entries.insert(target, self._entries.pop(source))
+            self._row_values.insert(target, self._row_values.pop(source))
+            self._signature = tuple(keys)
+            self.endMoveRows()
+
+    def _insert_rows(self, new_entries, new_keys):
+        keys = list(self._signature)
+        known = set(keys)
+        row = 0
+        while row < len(new_keys):
+            if new_keys[row] in known:
+                row += 1
+                continue
+            last = row
+            while last + 1 < len(new_keys) and new_keys[last + 1] not in known:
+                last += 1
+            self.beginInsertRows(QModelIndex(), row, last)
+            inserted = new_entries[row:last + 1]
+            keys[row:row] = new_keys[row:last + 1]
+            self._entries[row:row] = inserted
+            self._row_values[row:row] = [None] * len(inserted)
+            self._signature = tuple(keys)
+            self.endInsertRows()
+            row = last + 1
+
+    def _emit_changed_roles(self):
+        start = None
+        roles = set()
+        for row, entry in enumerate(self._entries):
+            values = self._role_values(entry)
+            previous = self._row_values[row]
+            self._row_values[row] = values
+            changed = None
+            if previous is not None:
+                changed = {role for role, value in values.items() if previous.get(role) != value}
+            if changed:
+                if start is None:
+                    start = row
+                roles |= changed
+                continue
+            if start is not None:
+                self._emit_data_changed(start, row - 1, roles)
+                start = None
+                roles = set()
+        if start is not None:
+            self._emit_data_changed(start, len(self._entries) - 1, roles)
+
+    def refresh_roles(self, roles):
+        """Re-read ``roles`` of the current rows in place (no diff, no re-sort).
+
+        Used when only derived strings changed, e.g. countdowns on a minute
+        tick; emits ``dataChanged`` for the affected rows and roles only.
+        """
+        roles = tuple(roles)
+        start = None
+        changed_roles = set()
+        for row, entry in enumerate(self._entries):
+            values = self._role_values(entry)
+            cached = self._row_values[row]
+            changed = {role for role in roles if cached.get(role) != values[role]}
+            for role in changed:
+                cached[role] = values[role]
+            if changed:
+                if start is None:
+                    start = row
+                changed_roles |= changed
+                continue
+            if start is not None:
+                self._emit_data_changed(start, row - 1, changed_roles)
+                start = None
+                changed_roles = set()
+        if start is not None:
+            self._emit_data_changed(start, len(self._entries) - 1, changed_roles)
+
+    def _emit_data_changed(self, first, last, roles):
+        self.dataChanged.emit(self.index(first, 0), self.index(last, 0), sorted(roles))
+
+    def _role_values(self, entry):
+        media = entry.get('media', {})
+        airing = media.get('nextAiringEpisode') or {}
+        return {
+            # Media is exposed as a whole map; track identity plus the fields updated in place.
+            self.MediaRole: (id(media), airing.get('airingAt'), airing.get('episode')),
+            self.DisplayTitleRole: entry.get('display_title', "Unknown"),
+            self.AiringTimeRole: entry.get('airing_time_formatted', "TBA"),
+            self.IsTodayRole: entry.get('is_today', False),
+            self.ProgressRole: entry.get('progress', 0),
+            self.RatingDisplayRole: entry.get('rating_display', "--"),
+        }
+
     def _entry_key(self, entry):
         media = entry.get("media", {})
         media_id = media.get("id")
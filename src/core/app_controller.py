@@ -3,10 +3,11 @@ import os
 import re
 import subprocess
 import tempfile
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
 from pathlib import Path
 from urllib.parse import unquote, urlparse
-from PySide6.QtCore import QObject, Signal, Slot, Property, QThreadPool, QSettings, QTimer, QUrl
+from PySide6.QtCore import QObject, Signal, Slot, Property, QThreadPool, QSettings, QTimer, QUrl, Qt
 from PySide6.QtQml import QQmlApplicationEngine
 from PySide6.QtWidgets import QApplication, QSystemTrayIcon
 from PySide6.QtGui import QDesktopServices
@@ -14,9 +15,34 @@ import requests
 from services.auth_service import AuthService
 from services.anilist_service import AniListService
 from services.update_service import UpdateService
-from core.worker import Worker
+from services.response_cache import ResponseCache, default_cache_dir
+from services.cover_cache import CoverCache
+from core.worker import Worker, current_task_cancelled
 from core.anime_model import AnimeModel
-from core.native_accel import filter_entries_advanced, is_native_available
+from core.list_processing import (
+    PreparedList,
+    apply_default_anilist_rating,
+    apply_entry_rating,
+    derive_entry_fields,
+    display_title,
+    fetch_prepared_delta,
+    fetch_prepared_list,
+    format_countdown,
+    format_rating_display,
+    next_countdown_change,
+    prepare_anime_list,
+    refresh_time_fields,
+)
+from core.list_snapshot import read_snapshot, snapshot_variant, write_snapshot
+from core.adaptive_debounce import AdaptiveDebounce
+from core.cover_prefetch import CoverPrefetcher, prefetch_order
+from core.deadline_queue import DeadlineQueue
+from core.entry_table import EntryTable
+from core.filter_refinement import FilterConstraints, FilterRefiner
+from core.notification_schedule import NotificationSchedule
+from core.task_scheduler import TaskPriority, TaskScheduler
+from core.view_cache import ViewCache
+from core.native_accel import filter_sort_buckets, is_native_available
 from version import APP_VERSION
 
 
@@ -41,6 +67,8 @@ class AppController(QObject):
     sortFieldChanged = Signal()
     sortAscendingChanged = Signal()
     availableGenresChanged = Signal()
+    genreCountsChanged = Signal()
+    pipelineStatsChanged = Signal()
     appLanguageChanged = Signal()
     notificationsEnabledChanged = Signal()
     notificationLeadMinutesChanged = Signal()
@@ -51,7 +79,17 @@ class AppController(QObject):
     showPrivacyNoticeChanged = Signal()
     updateChecksEnabledChanged = Signal()
     diagnosticsEnabledChanged = Signal()
+    coverPrefetchBudgetMbChanged = Signal()
     MAX_SYNC_RETRY_DELAY_MS = 60000
+    FULL_RESYNC_INTERVAL_SEC = 6 * 3600
+    NOTIFICATION_LEAD_CHOICES = (5, 15, 30, 60)
+    # Recent filter/sort results kept for flipping between views.
+    VIEW_CACHE_SIZE = 8
+    DEFAULT_COVER_PREFETCH_BUDGET_MB = 50
+    MAX_COVER_PREFETCH_BUDGET_MB = 1024
+    # Longest time a task may wait in the scheduler queue before it is dropped.
+    SYNC_TASK_DEADLINE_SEC = 180
+    UPDATE_CHECK_DEADLINE_SEC = 60
     
     def __init__(self, engine: QQmlApplicationEngine):
         super().__init__()
@@ -69,10 +107,12 @@ class AppController(QObject):
         self._sort_field = "airing_time"
         self._sort_ascending = True
         self._available_genres = ["All genres"]
+        self._genre_counts = {}
         self._app_language = "it"
         self._notifications_enabled = True
         self._notification_lead_minutes = 15
-        self._notified_episode_times = {}
+        self._notification_extra_leads = []
+        self._notification_schedule = NotificationSchedule(late_grace_sec=self.NOTIFICATION_LATE_GRACE_SEC)
         self._last_notification_media_id = None
         self._anilist_cache_enabled = False
         self._tray_icon = None
@@ -84,6 +124,12 @@ class AppController(QObject):
         self._active_sync_user_visible = True
         self._pending_sync_retry_user_id = None
         self._pending_sync_retry_user_visible = True
+        self._stream_sync_pages = False
+        self._streamed_page_count = 0
+        self._list_sync_watermark = 0
+        self._last_full_sync_ts = 0
+        self._last_full_sync_user_id = None
+        self._pending_full_sync_user_id = None
         self._update_available = False
         self._update_check_in_progress = False
         self._update_latest_version = ""
@@ -105,14 +151,22 @@ class AppController(QObject):
         self._day_models = [AnimeModel(self) for _ in range(7)]
         
         # Cache for performance
-        self._weekly_schedule_cache = [[] for _ in range(7)]
-        self._full_airing_entries = []
+        self._entry_table = EntryTable()
         self._ui_model_key = None
         self._data_revision = 0
+        self._filter_refiner = FilterRefiner()
+        self._view_cache = ViewCache(self.VIEW_CACHE_SIZE)
+        self._view_cache_revision = 0
         
         # Thread pool
         self._thread_pool = QThreadPool()
         logger.info("Multithreading with maximum %d threads", self._thread_pool.maxThreadCount())
+        self._scheduler = TaskScheduler(self._thread_pool, parent=self)
+        self._sync_task = None
+        # Bumped for every sync started; results tagged with an older value are dropped.
+        self._sync_generation = 0
+        if self._dev_profile_mode:
+            self._scheduler.statsChanged.connect(self.pipelineStatsChanged)
         logger.info("Native filter acceleration: %s", "enabled" if is_native_available() else "fallback python")
 
         # Persistent Settings
@@ -128,14 +182,24 @@ class AppController(QObject):
             self._app_language = "it"
         self._notifications_enabled = self._settings.value("notifications_enabled", True, type=bool)
         self._notification_lead_minutes = self._settings.value("notification_lead_minutes", 15, type=int)
-        if self._notification_lead_minutes not in {5, 15, 30, 60}:
+        if self._notification_lead_minutes not in self.NOTIFICATION_LEAD_CHOICES:
             self._notification_lead_minutes = 15
+        self._notification_extra_leads = self._parse_lead_minutes(
+            self._settings.value("notification_extra_lead_minutes", "", type=str)
+        )
         self._dismissed_update_version = self._settings.value("dismissed_update_version", "", type=str)
         self._update_checks_enabled = self._settings.value("update_checks_enabled", True, type=bool)
         self._diagnostics_enabled = self._settings.value("diagnostics_enabled", False, type=bool)
         self._privacy_notice_seen = self._settings.value("privacy_notice_seen", False, type=bool)
         self._show_privacy_notice = not self._privacy_notice_seen
         self._anilist_cache_enabled = self._env_bool("AIRINGDECK_ANILIST_CACHE_ENABLED", False)
+        self._response_cache = ResponseCache(default_cache_dir() / "anilist_responses.sqlite3")
+        self._snapshot_path = default_cache_dir() / "anime_list.snapshot"
+        self._cover_cache = CoverCache(default_cache_dir() / "covers")
+        self._cover_prefetcher = CoverPrefetcher(self._cover_cache, parent=self)
+        self._cover_prefetch_budget_mb = self._clamp_prefetch_budget(
+            self._settings.value("cover_prefetch_budget_mb", self.DEFAULT_COVER_PREFETCH_BUDGET_MB, type=int)
+        )
         if not self._anilist_cache_enabled:
             self._clear_offline_cache()
             logger.info("AniList offline cache disabled (AIRINGDECK_ANILIST_CACHE_ENABLED=0)")
@@ -144,26 +208,43 @@ class AppController(QObject):
         self._daily_counts = [0] * 7
         self._full_anime_list = [] # Store original non-filtered list
         
-        # Countdown Timer (Update every minute)
-        self._update_timer = QTimer(self)
-        self._update_timer.setInterval(60000) # 60 seconds
-        self._update_timer.timeout.connect(self._on_minute_tick)
-        self._update_timer.start()
+        # Notification Timer: one-shot, armed for the earliest notification fire time
+        self._notification_timer = QTimer(self)
+        self._notification_timer.setSingleShot(True)
+        self._notification_timer.setTimerType(Qt.PreciseTimer)
+        self._notification_timer.timeout.connect(self._on_notification_deadline)
+
+        # Countdown Timer: one-shot, armed for the earliest countdown text change
+        self._countdown_queue = DeadlineQueue()
+        self._countdown_timer = QTimer(self)
+        self._countdown_timer.setSingleShot(True)
+        self._countdown_timer.setTimerType(Qt.PreciseTimer)
+        self._countdown_timer.timeout.connect(self._on_countdown_deadline)
 
         self._sync_retry_timer = QTimer(self)
         self._sync_retry_timer.setSingleShot(True)
         self._sync_retry_timer.timeout.connect(self._on_sync_retry_timeout)
 
-        # Debounced filter updates to reduce model churn while typing.
+        # Debounced filter updates to reduce model churn while typing; the
+        # window follows the measured _update_ui_models latency.
+        self._filter_debounce = AdaptiveDebounce()
         self._filter_update_timer = QTimer(self)
         self._filter_update_timer.setSingleShot(True)
-        self._filter_update_timer.setInterval(260)
+        self._filter_update_timer.setInterval(AdaptiveDebounce.DEFAULT_WINDOW_MS)
         self._filter_update_timer.timeout.connect(self._apply_pending_filter)
         
         # Initialize services
         self._auth_service = AuthService()
         self._anilist_service = AniListService()
         self._update_service = UpdateService()
+        set_cancel_check = getattr(self._anilist_service, "set_cancel_check", None)
+        if callable(set_cancel_check):
+            # Superseded syncs stop before their next AniList request.
+            set_cancel_check(current_task_cancelled)
+        if self._anilist_cache_enabled:
+            attach_cache = getattr(self._anilist_service, "set_response_cache", None)
+            if callable(attach_cache):
+                attach_cache(self._response_cache)
         
         # Connect signals
         self._auth_service.auth_completed.connect(self._on_auth_completed)
@@ -224,24 +305,50 @@ class AppController(QObject):
             except (TypeError, ValueError) as exc:
                 logger.warning("Ignoring invalid cached user info: %s", exc)
                 
-        # Load Anime List
-        cached_list = self._settings.value("cached_anime_list")
-        if cached_list:
-            try:
-                anime_data = json.loads(cached_list)
+        user_id = self._user_info.get("id")
+        if user_id:
+            snapshot_entries = read_snapshot(self._snapshot_path, int(user_id), self._snapshot_variant())
+            if snapshot_entries is not None:
+                self._on_anime_list_snapshot(snapshot_entries)
+                return
+
+        # Fall back to cached AniList responses (stale is fine: a sync follows).
+        read_cached_list = getattr(self._anilist_service, "get_cached_watching_anime", None)
+        if user_id and callable(read_cached_list):
+            anime_data = read_cached_list(int(user_id))
+            if anime_data is not None:
                 self._on_anime_list_result(anime_data, from_cache=True)
-            except (TypeError, ValueError) as exc:
-                logger.warning("Ignoring invalid cached anime list: %s", exc)
 
     def _save_offline_cache(self):
         """Save current state to persistent storage"""
         if not self._anilist_cache_enabled:
             return
         import json
+        # The anime list itself is persisted write-through by the response cache.
         self._settings.setValue("cached_user_info", json.dumps(self._user_info))
-        self._settings.setValue("cached_anime_list", json.dumps(self._full_anime_list))
+
+    def _snapshot_variant(self) -> int:
+        return snapshot_variant(self._use_english_title, self._app_language)
+
+    def _save_list_snapshot(self):
+        if not self._anilist_cache_enabled:
+            return
+        user_id = self._user_info.get("id")
+        if not user_id:
+            return
+        try:
+            write_snapshot(self._snapshot_path, self._full_anime_list, int(user_id), self._snapshot_variant())
+        except OSError as exc:
+            logger.warning("Failed to write list snapshot: %s", exc)
 
     def _clear_offline_cache(self):
+        self._response_cache.purge()
+        try:
+            self._snapshot_path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as exc:
+            logger.warning("Failed to remove list snapshot: %s", exc)
         remove = getattr(self._settings, "remove", None)
         if callable(remove):
             remove("cached_user_info")
@@ -329,7 +436,7 @@ class AppController(QObject):
         worker = Worker(self._anilist_service.get_viewer_info)
         worker.signals.result.connect(self._on_user_info_result)
         worker.signals.error.connect(self._on_error)
-        self._thread_pool.start(worker)
+        self._scheduler.start(worker, TaskPriority.USER_SYNC, key="viewer-info")
 
     def _on_user_info_result(self, user):
         """Handle user info result"""
@@ -422,6 +529,7 @@ class AppController(QObject):
             return
         self._app_language = value
         self._settings.setValue("app_language", value)
+        self._refresh_display_titles()
         self._update_countdowns()
         self.appLanguageChanged.emit()
         self.statusMessageChanged.emit()
@@ -439,6 +547,8 @@ class AppController(QObject):
         self._settings.setValue("notifications_enabled", value)
         if not value:
             self._last_notification_media_id = None
+            self._notification_schedule.clear()
+            self._notification_timer.stop()
         self.notificationsEnabledChanged.emit()
         if value:
             self._check_episode_notifications()
@@ -453,7 +563,7 @@ class AppController(QObject):
             value = int(value)
         except (TypeError, ValueError):
             value = 15
-        if value not in {5, 15, 30, 60}:
+        if value not in self.NOTIFICATION_LEAD_CHOICES:
             value = 15
         if self._notification_lead_minutes == value:
             return
@@ -463,6 +573,64 @@ class AppController(QObject):
         if self._notifications_enabled:
             self._check_episode_notifications()
 
+    @Property(int, notify=coverPrefetchBudgetMbChanged)
+    def coverPrefetchBudgetMb(self):
+        """Megabytes of cover art downloaded ahead of time per sync (0 disables it)."""
+        return self._cover_prefetch_budget_mb
+
+    @coverPrefetchBudgetMb.setter
+    def coverPrefetchBudgetMb(self, value):
+        value = self._clamp_prefetch_budget(value)
+        if self._cover_prefetch_budget_mb == value:
+            return
+        self._cover_prefetch_budget_mb = value
+        self._settings.setValue("cover_prefetch_budget_mb", value)
+        if value == 0:
+            self._cover_prefetcher.cancel()
+        self.coverPrefetchBudgetMbChanged.emit()
+
+    @classmethod
+    def _clamp_prefetch_budget(cls, value) -> int:
+        try:
+            value = int(value)
+        except (TypeError, ValueError):
+            return cls.DEFAULT_COVER_PREFETCH_BUDGET_MB
+        return min(cls.MAX_COVER_PREFETCH_BUDGET_MB, max(0, value))
+
+    @property
+    def cover_cache(self) -> CoverCache:
+        return self._cover_cache
+
+    @Property('QVariantList', notify=notificationLeadMinutesChanged)
+    def notificationExtraLeadMinutes(self):
+        return list(self._notification_extra_leads)
+
+    @notificationExtraLeadMinutes.setter
+    def notificationExtraLeadMinutes(self, value):
+        leads = self._parse_lead_minutes(value)
+        if leads == self._notification_extra_leads:
+            return
+        self._notification_extra_leads = leads
+        self._settings.setValue("notification_extra_lead_minutes", ",".join(str(lead) for lead in leads))
+        self.notificationLeadMinutesChanged.emit()
+        if self._notifications_enabled:
+            self._check_episode_notifications()
+
+    @classmethod
+    def _parse_lead_minutes(cls, value) -> list:
+        """Extra reminder leads from a list or a comma separated string."""
+        if isinstance(value, str):
+            value = value.split(",")
+        leads = set()
+        for item in value or []:
+            try:
+                lead = int(str(item).strip())
+            except (TypeError, ValueError):
+                continue
+            if lead in cls.NOTIFICATION_LEAD_CHOICES:
+                leads.add(lead)
+        return sorted(leads)
+
     @Property('QVariantMap', notify=userInfoChanged)
     def userInfo(self):
         return self._user_info
@@ -489,7 +657,12 @@ class AppController(QObject):
         if value == self._pending_filter_text:
             return
         self._pending_filter_text = value
-        self._filter_update_timer.start()
+        interval = self._filter_debounce.interval_ms(len(self._entry_table))
+        if interval <= 0:
+            self._filter_update_timer.stop()
+            self._apply_pending_filter()
+            return
+        self._filter_update_timer.start(interval)
 
     def _apply_pending_filter(self):
         if self._filter_text == self._pending_filter_text:
@@ -503,6 +676,10 @@ class AppController(QObject):
     def availableGenres(self):
         return self._available_genres
 
+    @Property('QVariantMap', notify=genreCountsChanged)
+    def genreCounts(self):
+        return self._genre_counts
+
     @Property(str, notify=selectedGenreChanged)
     def selectedGenre(self):
         return self._selected_genre
@@ -558,7 +735,7 @@ class AppController(QObject):
 
     @sortField.setter
     def sortField(self, value):
-        allowed = {"airing_time", "title", "progress", "score"}
+        allowed = {"airing_time", "title", "progress", "score", "relevance"}
         value = value if value in allowed else "airing_time"
         if self._sort_field == value:
             return
@@ -602,7 +779,7 @@ class AppController(QObject):
             self._settings.setValue("use_english_title", value)
             
             # Recalculate all titles immediately
-            self._update_countdowns() 
+            self._refresh_display_titles()
             
             # Emit signals for UI components
             self.useEnglishTitleChanged.emit()
@@ -629,6 +806,17 @@ class AppController(QObject):
     def devProfileMode(self):
         return self._dev_profile_mode
 
+    @Property('QVariantMap', notify=pipelineStatsChanged)
+    def pipelineStats(self):
+        """Filter pipeline counters for the dev-profile overlay."""
+        return {
+            "viewCache": self._view_cache.stats(),
+            "refined": self._filter_refiner.refined,
+            "rescanned": self._filter_refiner.rescanned,
+            "debounce": self._filter_debounce.stats(len(self._entry_table)),
+            "scheduler": self._scheduler.stats(),
+        }
+
     @Property(bool, notify=showPrivacyNoticeChanged)
     def showPrivacyNotice(self):
         return self._show_privacy_notice
@@ -724,7 +912,12 @@ class AppController(QObject):
         worker.signals.result.connect(self._on_update_check_result)
         worker.signals.error.connect(self._on_update_check_error)
         worker.signals.finished.connect(self._on_update_check_finished)
-        self._thread_pool.start(worker)
+        self._scheduler.start(
+            worker,
+            TaskPriority.UPDATE_CHECK,
+            key="update-check",
+            timeout_sec=self.UPDATE_CHECK_DEADLINE_SEC,
+        )
 
     def _on_update_check_result(self, payload):
         if not isinstance(payload, dict):
@@ -889,7 +1082,7 @@ class AppController(QObject):
         worker.signals.result.connect(self._on_update_install_result)
         worker.signals.error.connect(self._on_update_install_error)
         worker.signals.finished.connect(self._on_update_install_finished)
-        self._thread_pool.start(worker)
+        self._scheduler.start(worker, TaskPriority.UPDATE_CHECK, key="update-install")
 
     @Slot()
     def openUpdatePage(self):
@@ -951,17 +1144,29 @@ class AppController(QObject):
         logger.info("Logout requested")
         self._auth_service.clear_token()
         self._anilist_service.set_token("")
-        
+        close_service = getattr(self._anilist_service, "close", None)
+        if callable(close_service):
+            close_service()
+
         self._is_authenticated = False
         self._user_info = {}
         self._full_anime_list = []
         self._anime_by_id = {}
-        self._notified_episode_times.clear()
+        self._notification_schedule.clear(forget_sent=True)
+        self._notification_timer.stop()
         self._last_notification_media_id = None
+        self._cover_prefetcher.cancel()
+        if self._sync_task is not None:
+            # A cancelled sync emits neither result nor error; free the slot here.
+            self._supersede_sync()
+            self._sync_in_progress = False
         self._selected_anime = None
         self._daily_counts = [0] * 7
-        self._weekly_schedule_cache = [[] for _ in range(7)]
-        self._full_airing_entries = []
+        self._entry_table = EntryTable()
+        self._schedule_countdowns()
+        self._list_sync_watermark = 0
+        self._last_full_sync_ts = 0
+        self._last_full_sync_user_id = None
         self._clear_offline_cache()
         self._cancel_pending_sync_retry()
         self._sync_retry_attempts = 0
@@ -972,6 +1177,9 @@ class AppController(QObject):
         if self._available_genres != ["All genres"]:
             self._available_genres = ["All genres"]
             self.availableGenresChanged.emit()
+        if self._genre_counts:
+            self._genre_counts = {}
+            self.genreCountsChanged.emit()
         self._update_ui_models()
         
         self.authenticated.emit(False)
@@ -1041,7 +1249,8 @@ class AppController(QObject):
                 self._set_loading(False, self._msg_missing_profile_for_sync())
             return False
 
-        if self._sync_in_progress:
+        # A user-visible request replaces a background sync instead of waiting for it.
+        if self._sync_in_progress and not (user_visible and not self._active_sync_user_visible):
             self._sync_queued = True
             self._set_loading(True, self._msg_sync_queued())
             return False
@@ -1051,25 +1260,106 @@ class AppController(QObject):
         self._start_sync_worker(int(user_id), user_visible=user_visible)
         return True
 
+    def _supersede_sync(self):
+        """Invalidate the running sync: its worker drops the result and stops requesting."""
+        self._sync_generation += 1
+        if self._sync_task is not None:
+            self._sync_task.cancel()
+            self._sync_task = None
+
+    def _is_stale_sync_signal(self) -> bool:
+        sender = self.sender()
+        if sender is None:
+            return False
+        generation = sender.property("syncGeneration")
+        if generation is None or int(generation) == self._sync_generation:
+            return False
+        logger.info("Discarding result of superseded sync (generation %s, current %d)", generation, self._sync_generation)
+        return True
+
     def _start_sync_worker(self, user_id: int, user_visible: bool = True):
+        if self._sync_in_progress:
+            logger.info("Superseding running sync (generation %d)", self._sync_generation)
+        self._supersede_sync()
+        # The finished sync restarts the prefetch with its own cover order.
+        self._cover_prefetcher.cancel()
         self._sync_in_progress = True
         self._active_sync_user_visible = user_visible
         if user_visible:
             self._set_loading(True, self._msg_syncing_anime_list())
-        worker = Worker(self._anilist_service.get_watching_anime, user_id)
-        worker.signals.result.connect(self._on_sync_worker_result)
+        # Stream pages into the models only for the first paint; refreshing an
+        # already populated calendar page by page would make it shrink and regrow.
+        self._stream_sync_pages = False
+        self._streamed_page_count = 0
+        now_ts = int(datetime.now().timestamp())
+        fetch_delta = getattr(self._anilist_service, "get_watching_anime_delta", None)
+        if (
+            callable(fetch_delta)
+            and self._full_anime_list
+            and self._list_sync_watermark > 0
+            and self._last_full_sync_user_id == user_id
+            and now_ts - self._last_full_sync_ts < self.FULL_RESYNC_INTERVAL_SEC
+        ):
+            worker = Worker(
+                fetch_prepared_delta,
+                fetch_delta,
+                user_id,
+                self._list_sync_watermark,
+                self._stale_airing_media_ids(now_ts),
+                self._use_english_title,
+                self._app_language,
+            )
+            worker.signals.result.connect(self._on_sync_worker_delta_result)
+        else:
+            fetch_pages = getattr(self._anilist_service, "iter_watching_anime_pages", None)
+            self._stream_sync_pages = callable(fetch_pages) and not self._full_anime_list
+            # Fields are derived inside the worker; the GUI thread only swaps structures.
+            worker = Worker(
+                fetch_prepared_list,
+                fetch_pages if callable(fetch_pages) else self._anilist_service.get_watching_anime,
+                user_id,
+                self._use_english_title,
+                self._app_language,
+            )
+            worker.signals.progress.connect(self._on_sync_worker_page)
+            worker.signals.result.connect(self._on_sync_worker_result)
+            self._pending_full_sync_user_id = user_id
         worker.signals.error.connect(self._on_sync_worker_error)
-        self._thread_pool.start(worker)
+        worker.signals.setProperty("syncGeneration", self._sync_generation)
+        priority = TaskPriority.USER_SYNC if user_visible else TaskPriority.BACKGROUND_SYNC
+        self._sync_task = self._scheduler.start(worker, priority, timeout_sec=self.SYNC_TASK_DEADLINE_SEC)
+
+    def _on_sync_worker_result(self, result):
+        if self._is_stale_sync_signal():
+            return
+        self._sync_in_progress = False
+        self._stream_sync_pages = False
+        self._sync_retry_attempts = 0
+        self._cancel_pending_sync_retry()
+        if isinstance(result, PreparedList) and self._prepared_matches_settings(result.use_english_title, result.language):
+            self._apply_prepared_list(result, show_status=self._active_sync_user_visible)
+        else:
+            # Raw payload, or title/language settings changed while the worker ran.
+            entries = result.entries if isinstance(result, PreparedList) else result
+            self._on_anime_list_result(entries, show_status=self._active_sync_user_visible)
+        self._last_full_sync_user_id = self._pending_full_sync_user_id
+        self._last_full_sync_ts = int(datetime.now().timestamp())
+        self._drain_queued_sync_request()
 
-    def _on_sync_worker_result(self, anime_list):
+    def _on_sync_worker_delta_result(self, delta):
+        if self._is_stale_sync_signal():
+            return
         self._sync_in_progress = False
         self._sync_retry_attempts = 0
         self._cancel_pending_sync_retry()
-        self._on_anime_list_result(anime_list, show_status=self._active_sync_user_visible)
+        self._on_anime_list_delta(delta or {}, show_status=self._active_sync_user_visible)
         self._drain_queued_sync_request()
 
     def _on_sync_worker_error(self, err):
+        if self._is_stale_sync_signal():
+            return
         self._sync_in_progress = False
+        self._stream_sync_pages = False
         err_text = self._extract_error_text(err)
         lower = err_text.lower()
         user_id = self._user_info.get("id")
@@ -1115,6 +1405,9 @@ class AppController(QObject):
         self._start_sync_worker(int(user_id), user_visible=True)
 
     def _is_transient_sync_error(self, lower_error: str) -> bool:
+        if "tasktimeout" in lower_error:
+            # Starved in the scheduler queue; retrying would just queue again.
+            return False
         return (
             "timeout" in lower_error
             or "connectionerror" in lower_error
@@ -1143,132 +1436,136 @@ class AppController(QObject):
 
     def _get_display_title(self, media):
         """Standardized title selection based on settings"""
-        titles = media.get('title', {})
-        if self._use_english_title:
-            return titles.get('english') or titles.get('romaji') or self._tr("Titolo sconosciuto", "Unknown Title")
-        return titles.get('romaji') or titles.get('english') or self._tr("Titolo sconosciuto", "Unknown Title")
+        return display_title(media, self._use_english_title, self._app_language)
 
     def _format_rating_display(self, score_value, score_scale) -> str:
-        try:
-            value = float(score_value)
-            scale = int(score_scale)
-        except (TypeError, ValueError):
-            return "--"
-        if value <= 0:
-            return "--"
-        if scale == 10:
-            return f"{value:.1f}/10"
-        return f"{int(round(value))}/100"
+        return format_rating_display(score_value, score_scale)
 
     def _apply_entry_rating(self, entry, score_value, score_scale):
-        display = self._format_rating_display(score_value, score_scale)
-        sort_score = -1.0
-        if display != "--":
-            try:
-                value = float(score_value)
-                scale = float(score_scale)
-                if scale > 0:
-                    sort_score = (value / scale) * 100.0
-            except (TypeError, ValueError):
-                sort_score = -1.0
-        entry["rating_value"] = score_value if display != "--" else None
-        entry["rating_scale"] = score_scale if display != "--" else None
-        entry["rating_display"] = display
-        entry["rating_sort_score"] = sort_score
+        apply_entry_rating(entry, score_value, score_scale)
 
     def _apply_default_anilist_rating(self, entry):
-        media = entry.get("media", {})
-        score = media.get("averageScore")
-        try:
-            value = float(score)
-        except (TypeError, ValueError):
-            value = None
-        if value is None or value <= 0:
-            self._apply_entry_rating(entry, None, None)
-            return
-        self._apply_entry_rating(entry, value, 100)
+        apply_default_anilist_rating(entry)
+
+    def _format_countdown(self, airing_at):
+        """Format countdown with support for days, hours, minutes"""
+        return format_countdown(airing_at, self._app_language)
 
-    def _refresh_entry_ratings(self):
+    def _refresh_display_titles(self):
+        """Re-derive titles after a title or language setting change."""
         if not self._full_anime_list:
             return
-        changed = False
         for entry in self._full_anime_list:
-            before = (
-                entry.get("rating_display"),
-                entry.get("rating_sort_score"),
-            )
-            self._apply_default_anilist_rating(entry)
-            after = (
-                entry.get("rating_display"),
-                entry.get("rating_sort_score"),
-            )
-            if before != after:
-                changed = True
+            entry['display_title'] = self._get_display_title(entry.get('media', {}))
+        self._entry_table.refresh_titles()
+        self._data_revision += 1
+        self._ui_model_key = None
+        self._update_ui_models()
+        self.animeListChanged.emit()
 
-        if changed:
-            self._data_revision += 1
-            self._ui_model_key = None
-            self._update_ui_models()
-            self.animeListChanged.emit()
-            self.selectedAnimeChanged.emit()
+    def _update_countdowns(self):
+        """Recompute every countdown string and re-arm the countdown deadlines.
+
+        Countdown text feeds no filter or sort key, so the rows stay where
+        they are: strings are updated in place and the models repaint only
+        the AiringTimeRole cells that changed. A weekday rollover (is_today)
+        goes through the full pipeline instead.
+        """
+        table = self._entry_table
+        if not table.airing_rows:
+            return
 
-    def _format_countdown(self, airing_at):
-        """Format countdown with support for days, hours, minutes"""
         now = datetime.now()
-        dt = datetime.fromtimestamp(airing_at)
-        diff = dt - now
-        
-        time_str = dt.strftime("%H:%M")
-        seconds = diff.total_seconds()
-        
-        if seconds <= -3600: # Over an hour ago
-            return self._tr(f"Già uscito alle {time_str}", f"Aired at {time_str}")
-        elif seconds <= 0: # Within the last hour
-            return self._tr("In onda ora", "Airing now")
-        
-        days = int(seconds // 86400)
-        hours = int((seconds % 86400) // 3600)
-        minutes = int((seconds % 3600) // 60)
-        
-        if days > 0:
-            return f"{time_str} (in {days}d {hours}h)"
-        elif hours > 0:
-            return f"{time_str} (in {hours}h {minutes}m)"
-        else:
-            return f"{time_str} (in {minutes}m)"
-
-    def _update_countdowns(self):
-        """Timer callback to refresh countdown strings"""
-        if not self._full_anime_list:
+        today_weekday = now.weekday()
+        if self._ui_model_key is not None and self._ui_model_key[-1] != today_weekday:
+            for entry in table.entries:
+                refresh_time_fields(entry, self._app_language, today_weekday)
+            self._data_revision += 1
+            self._update_ui_models()
+            self._schedule_countdowns()
             return
-            
+
         any_changed = False
-        for entry in self._full_anime_list:
-            media = entry.get('media', {})
-            airing = media.get('nextAiringEpisode')
-            
-            # Update Titles (in case setting changed)
-            new_title = self._get_display_title(media)
-            if entry.get('display_title') != new_title:
-                entry['display_title'] = new_title
+        entries = table.entries
+        airing_at = table.airing_at
+        language = self._app_language
+        for row in table.airing_rows:
+            entry = entries[row]
+            new_countdown = format_countdown(airing_at[row], language, now)
+            if entry.get('airing_time_formatted') != new_countdown:
+                entry['airing_time_formatted'] = new_countdown
                 any_changed = True
 
-            # Update Countdown
-            if airing:
-                new_countdown = self._format_countdown(airing['airingAt'])
-                if entry.get('airing_time_formatted') != new_countdown:
-                    entry['airing_time_formatted'] = new_countdown
-                    any_changed = True
-
         if any_changed:
-            self._data_revision += 1
-            self._ui_model_key = None
-            self._update_ui_models()
-            self.animeListChanged.emit()
+            self._refresh_countdown_cells()
+        self._schedule_countdowns()
+
+    # Key of the midnight deadline in the countdown queue (rows use ints).
+    _DAY_ROLLOVER_KEY = "day"
+    # Longest single one-shot timer interval; the timer just re-arms after it.
+    # Kept short because the timer is monotonic while deadlines are wall-clock
+    # times: after a suspend or a clock change labels are stale for at most this.
+    _MAX_TIMER_WAIT_MS = 60 * 1000
+
+    def _schedule_countdowns(self):
+        """Rebuild the countdown deadlines for the current table and arm the timer."""
+        queue = self._countdown_queue
+        queue.clear()
+        table = self._entry_table
+        if table.airing_rows:
+            now_ts = time.time()
+            airing_at = table.airing_at
+            for row in table.airing_rows:
+                deadline = next_countdown_change(airing_at[row], now_ts)
+                if deadline is not None:
+                    queue.schedule(row, deadline)
+            tomorrow = datetime.now().date() + timedelta(days=1)
+            queue.schedule(self._DAY_ROLLOVER_KEY, datetime.combine(tomorrow, datetime.min.time()).timestamp())
+        self._arm_countdown_timer()
+
+    def _arm_countdown_timer(self):
+        deadline = self._countdown_queue.next_deadline()
+        if deadline is None:
+            self._countdown_timer.stop()
+            return
+        wait_ms = int(max(0.0, deadline - time.time()) * 1000)
+        self._countdown_timer.start(min(wait_ms, self._MAX_TIMER_WAIT_MS))
 
-    def _on_minute_tick(self):
-        self._update_countdowns()
-        self._check_episode_notifications()
+    def _on_countdown_deadline(self):
+        """Refresh only the rows whose countdown text changes now."""
+        now = datetime.now()
+        now_ts = now.timestamp()
+        due = self._countdown_queue.pop_due(now_ts)
+        if self._DAY_ROLLOVER_KEY in due:
+            # New weekday: is_today and today's bucket change; recompute everything.
+            self._update_countdowns()
+            return
+
+        table = self._entry_table
+        airing_at = table.airing_at
+        any_changed = False
+        for row in due:
+            if row >= len(table.entries):
+                continue
+            entry = table.entries[row]
+            new_countdown = format_countdown(airing_at[row], self._app_language, now)
+            if entry.get('airing_time_formatted') != new_countdown:
+                entry['airing_time_formatted'] = new_countdown
+                any_changed = True
+            deadline = next_countdown_change(airing_at[row], now_ts)
+            if deadline is not None:
+                self._countdown_queue.schedule(row, deadline)
+        if any_changed:
+            self._refresh_countdown_cells()
+        self._arm_countdown_timer()
+
+    def _refresh_countdown_cells(self):
+        roles = (AnimeModel.AiringTimeRole,)
+        for model in self._day_models:
+            model.refresh_roles(roles)
+        self._all_anime_model.refresh_roles(roles)
+        if self._selected_anime is not None:
+            self.selectedAnimeChanged.emit()
 
     def _update_ui_models(self):
         """Sync Python data to QML models with filtering"""
@@ -1289,117 +1586,141 @@ class AppController(QObject):
             return
         self._ui_model_key = model_key
 
-        filtered_counts = [0] * 7
-        # Update Individual Day Models
+        started = time.perf_counter()
+        table = self._entry_table
+        constraints = FilterConstraints(
+            query,
+            table.genre_mask_for(selected_genre),
+            int(self._min_score or 0),
+            bool(self._only_today),
+            today_weekday,
+        )
+        if self._view_cache_revision != self._data_revision:
+            self._view_cache.clear()
+            self._view_cache_revision = self._data_revision
+        cached = self._view_cache.get(model_key)
+        if cached is not None:
+            day_rows, airing_rows, filtered_counts = cached
+        else:
+            day_rows, airing_rows, filtered_counts = self._filter_and_sort(table, query, selected_genre, constraints)
+            self._view_cache.put(model_key, (day_rows, airing_rows, filtered_counts))
+
+        self._filter_refiner.remember(self._data_revision, constraints, airing_rows)
         for i in range(7):
-            day_list = self._weekly_schedule_cache[i]
-            if self._only_today and i != today_weekday:
-                filtered_day = []
-            else:
-                filtered_day = self._apply_filters(day_list, query, selected_genre)
-                filtered_day = self._sort_entries(filtered_day)
-            self._day_models[i].update_data(filtered_day)
-            filtered_counts[i] = len(filtered_day)
+            self._day_models[i].update_data(table.entries_for(day_rows[i]))
 
         # Update Full Model (Airing Only)
-        full_airing = self._full_airing_entries
-        if self._only_today:
-            full_airing = [e for e in full_airing if e.get("calendar_day") == today_weekday]
-        full_airing = self._apply_filters(full_airing, query, selected_genre)
-        full_airing = self._sort_entries(full_airing)
-        self._all_anime_model.update_data(full_airing)
+        self._all_anime_model.update_data(table.entries_for(airing_rows))
         if filtered_counts != self._daily_counts:
             self._daily_counts = filtered_counts
             self.dailyCountsChanged.emit()
-
-    def _apply_filters(self, entries, query: str, selected_genre: str):
-        return filter_entries_advanced(
-            entries,
-            query,
+        self._filter_debounce.record(time.perf_counter() - started)
+        if self._dev_profile_mode:
+            self.pipelineStatsChanged.emit()
+
+    def _filter_and_sort(self, table, query: str, selected_genre: str, constraints):
+        """Day buckets, combined rows and per-day counts for the current filters."""
+        exact_query = bool(query) and bool(table.search_index.search(query))
+        rows = self._filter_refiner.base_rows(self._data_revision, constraints, table.airing_rows, exact_query)
+        sort_field = self._sort_field
+        search_query = query
+        if query and (sort_field == "relevance" or not exact_query):
+            # Scores are only needed to rank, or to pick fuzzy matches when
+            # nothing matches exactly (usually a typo).
+            relevance = table.relevance(query)
+            rows = [row for row in rows if row in relevance]
+            search_query = ""
+            if sort_field == "relevance":
+                # Relevance scores are per query, not a table column: pre-sort
+                # and let the fused filter keep that order.
+                rows = self._sort_rows(rows, query)
+                sort_field = None
+
+        # One filter pass over all airing rows fills every day model.
+        return filter_sort_buckets(
+            table,
+            rows,
+            search_query,
             selected_genre,
             self._min_score,
             self._only_today,
-            datetime.now().weekday(),
+            constraints.today_weekday,
+            sort_field,
+            descending=not self._sort_ascending,
         )
 
-    def _sort_entries(self, entries):
-        if len(entries) < 2:
-            return entries
-
-        reverse = not self._sort_ascending
-
-        if self._sort_field == "title":
-            return sorted(entries, key=lambda e: (e.get("display_title") or "").lower(), reverse=reverse)
-        if self._sort_field == "progress":
-            return sorted(entries, key=lambda e: int(e.get("progress") or 0), reverse=reverse)
-        if self._sort_field == "score":
-            return sorted(
-                entries,
-                key=lambda e: float(e.get("rating_sort_score", e.get("media", {}).get("averageScore") or -1)),
-                reverse=reverse,
-            )
-
-        # Default: airing_time
-        def airing_key(entry):
-            nxt = entry.get("media", {}).get("nextAiringEpisode")
-            airing_at = nxt.get("airingAt") if nxt else None
-            return airing_at if airing_at is not None else 10**18
-
-        return sorted(entries, key=airing_key, reverse=reverse)
+    def _sort_rows(self, rows, query: str = ""):
+        return self._entry_table.sort_rows(rows, self._sort_field, self._sort_ascending, query)
 
-    def _on_anime_list_result(self, anime_list, from_cache=False, show_status=True):
-        """Handle anime list result and process for calendar"""
+    def _reset_list_state(self, anime_list):
         self._full_anime_list = anime_list
         self._data_revision += 1
         self._ui_model_key = None
         self._anime_by_id = {}
         self._daily_counts = [0] * 7
-        self._weekly_schedule_cache = [[] for _ in range(7)]
-        self._full_airing_entries = []
-        genre_set = set()
-        
-        today_weekday = datetime.now().weekday()
-        
-        for entry in self._full_anime_list:
-            media = entry.get('media', {})
-            media_id = media.get("id")
-            if media_id is not None:
-                self._anime_by_id[media_id] = entry
-            airing = media.get('nextAiringEpisode')
-            
-            # Centralize Title
-            entry['display_title'] = self._get_display_title(media)
-            self._apply_default_anilist_rating(entry)
-            titles = media.get("title", {})
-            romaji = titles.get("romaji") or ""
-            english = titles.get("english") or ""
-            entry["_search_blob"] = f"{romaji} {english}".lower()
-            
-            if airing:
-                airing_at = airing['airingAt']
-                dt = datetime.fromtimestamp(airing_at)
-                weekday = dt.weekday()
-                
-                entry['calendar_day'] = weekday
-                entry['is_today'] = (weekday == today_weekday)
-                entry['airing_time_formatted'] = self._format_countdown(airing_at)
-                
-                self._daily_counts[weekday] += 1
-                self._weekly_schedule_cache[weekday].append(entry)
-                self._full_airing_entries.append(entry)
-            else:
-                entry['calendar_day'] = -1
-                entry['airing_time_formatted'] = self._tr("Da annunciare", "TBA")
-                entry['is_today'] = False
+        self._entry_table = EntryTable()
 
-            for genre in media.get("genres", []):
-                if genre:
-                    genre_set.add(genre)
+    def _prepared_matches_settings(self, use_english_title: bool, language: str) -> bool:
+        return use_english_title == self._use_english_title and language == self._app_language
 
+    def _on_sync_worker_page(self, page):
+        """Fill the day models progressively while the first sync is streaming."""
+        if not self._stream_sync_pages or not page or self._is_stale_sync_signal():
+            return
+        if not self._streamed_page_count:
+            self._reset_list_state([])
+        self._streamed_page_count += 1
+        self._full_anime_list.extend(page)
+        prepared = prepare_anime_list(
+            self._full_anime_list, self._use_english_title, self._app_language, derive=False
+        )
+        self._entry_table = prepared.table
+        self._anime_by_id = prepared.by_id
+        self._daily_counts = prepared.daily_counts
+        self._data_revision += 1
+        self._ui_model_key = None
+        self._update_ui_models()
+        self._schedule_countdowns()
+        self.animeListChanged.emit()
+
+    def _on_anime_list_result(self, anime_list, from_cache=False, show_status=True):
+        """Handle anime list result and process for calendar"""
+        prepared = prepare_anime_list(anime_list, self._use_english_title, self._app_language)
+        self._apply_prepared_list(prepared, from_cache=from_cache, show_status=show_status)
+
+    def _start_cover_prefetch(self):
+        """Warm the cover cache, today's and tomorrow's cards first; replaces older runs."""
+        budget_bytes = self._cover_prefetch_budget_mb * 1024 * 1024
+        if budget_bytes <= 0:
+            return
+        urls = prefetch_order(self._entry_table, datetime.now().weekday())
+        self._cover_prefetcher.start(urls, budget_bytes, self._scheduler.lane(TaskPriority.PREFETCH))
+
+    def _on_anime_list_snapshot(self, entries):
+        """Populate the calendar from snapshot rows whose fields are already derived."""
+        today_weekday = datetime.now().weekday()
+        for entry in entries:
+            refresh_time_fields(entry, self._app_language, today_weekday)
+        prepared = prepare_anime_list(
+            entries, self._use_english_title, self._app_language, today_weekday, derive=False
+        )
+        self._apply_prepared_list(prepared, from_cache=True)
+
+    def _apply_prepared_list(self, prepared: PreparedList, from_cache=False, show_status=True):
+        """Swap prebuilt list structures into the controller state."""
+        self._reset_list_state(prepared.entries)
+        self._anime_by_id = prepared.by_id
+        self._daily_counts = prepared.daily_counts
+        self._entry_table = prepared.table
+        self._list_sync_watermark = prepared.watermark
+        self._finish_list_update(len(prepared.entries), prepared.genres, from_cache=from_cache, show_status=show_status)
+
+    def _finish_list_update(self, count: int, genres, from_cache=False, show_status=True):
         if not from_cache:
-            self._save_offline_cache()
+            self._save_list_snapshot()
+            self._start_cover_prefetch()
 
-        new_genres = ["All genres"] + sorted(genre_set)
+        new_genres = ["All genres"] + list(genres)
         if new_genres != self._available_genres:
             self._available_genres = new_genres
             if self._selected_genre not in self._available_genres:
@@ -1408,13 +1729,98 @@ class AppController(QObject):
                 self.selectedGenreChanged.emit()
             self.availableGenresChanged.emit()
 
+        # Bitmask popcount over the airing rows; no per-entry genre strings.
+        genre_counts = self._entry_table.genre_counts(self._entry_table.airing_rows)
+        if genre_counts != self._genre_counts:
+            self._genre_counts = genre_counts
+            self.genreCountsChanged.emit()
+
         self._update_ui_models()
+        self._schedule_countdowns()
         self.animeListChanged.emit()
-        self._refresh_entry_ratings()
         self._check_episode_notifications()
         if show_status:
-            self._set_loading(False, self._msg_synced_count(len(anime_list)))
-        logger.info("Synced %d anime. Day counts: %s", len(anime_list), self._daily_counts)
+            self._set_loading(False, self._msg_synced_count(count))
+        logger.info("Synced %d anime. Day counts: %s", count, self._daily_counts)
+
+    @staticmethod
+    def _max_updated_at(entries) -> int:
+        watermark = 0
+        for entry in entries:
+            try:
+                watermark = max(watermark, int(entry.get("updatedAt") or 0))
+            except (TypeError, ValueError):
+                continue
+        return watermark
+
+    def _stale_airing_media_ids(self, now_ts: int):
+        """Media whose known next episode already aired and needs fresh schedule data."""
+        table = self._entry_table
+        ids = table.ids
+        airing_at = table.airing_at
+        return [ids[row] for row in table.airing_rows if ids[row] >= 0 and airing_at[row] <= now_ts]
+
+    def _on_anime_list_delta(self, delta, show_status=True):
+        """Merge a delta sync into the current list, re-deriving only touched entries."""
+        changed_by_id = {}
+        for entry in delta.get("changed") or []:
+            media_id = entry.get("media", {}).get("id")
+            if media_id is not None:
+                changed_by_id[media_id] = entry
+        remaining_ids = delta.get("media_ids")
+        remaining_ids = set(remaining_ids) if remaining_ids is not None else None
+        changed_ids = list(changed_by_id)
+        touched = list(changed_by_id.values())
+
+        for media_id, next_airing in (delta.get("airing") or {}).items():
+            entry = self._anime_by_id.get(media_id)
+            if entry is None or media_id in changed_by_id:
+                continue
+            media = entry.get("media", {})
+            if media.get("nextAiringEpisode") != next_airing:
+                media["nextAiringEpisode"] = next_airing
+                touched.append(entry)
+
+        merged = []
+        removed = 0
+        for entry in self._full_anime_list:
+            media_id = entry.get("media", {}).get("id")
+            if remaining_ids is not None and media_id is not None and media_id not in remaining_ids:
+                removed += 1
+                continue
+            replacement = changed_by_id.pop(media_id, None)
+            merged.append(replacement if replacement is not None else entry)
+        merged.extend(changed_by_id.values())
+
+        self._list_sync_watermark = max(self._list_sync_watermark, self._max_updated_at(touched))
+        if not touched and not removed:
+            self._start_cover_prefetch()
+            if show_status:
+                self._set_loading(False, self._msg_synced_count(len(self._full_anime_list)))
+            logger.info("Delta sync: no changes")
+            return
+
+        # Changed entries usually arrive derived from the worker; schedule-only
+        # updates and results built with stale settings are derived here.
+        today_weekday = datetime.now().weekday()
+        derived_ok = self._prepared_matches_settings(delta.get("use_english_title"), delta.get("language"))
+        derived_ids = set(changed_ids) if derived_ok else set()
+        for entry in touched:
+            if entry.get("media", {}).get("id") not in derived_ids:
+                derive_entry_fields(entry, self._use_english_title, self._app_language, today_weekday)
+
+        # Re-bucket from already derived fields; no per-entry re-derivation.
+        prepared = prepare_anime_list(
+            merged, self._use_english_title, self._app_language, today_weekday, derive=False
+        )
+        watermark = self._list_sync_watermark
+        self._apply_prepared_list(prepared, show_status=show_status)
+        self._list_sync_watermark = max(watermark, prepared.watermark)
+        if self._selected_anime is not None:
+            selected_id = self._selected_anime.get("media", {}).get("id")
+            self._selected_anime = self._anime_by_id.get(selected_id)
+            self.selectedAnimeChanged.emit()
+        logger.info("Delta sync: %d updated, %d removed", len(touched), removed)
 
     def _init_tray_icon(self):
         if not QSystemTrayIcon.isSystemTrayAvailable():
@@ -1450,57 +1856,72 @@ class AppController(QObject):
         self._tray_icon.showMessage(summary, body, QSystemTrayIcon.Information, 8000)
         logger.info("Test notification dispatched")
 
-    def _prune_notified_episode_cache(self, now_ts: int):
-        threshold = now_ts - 7200
-        self._notified_episode_times = {
-            key: airing_at
-            for key, airing_at in self._notified_episode_times.items()
-            if airing_at >= threshold
-        }
+    # Alerts due within this window are shown together as one notification.
+    NOTIFICATION_COALESCE_SEC = 60
+    # Titles listed in a batched notification before "+N more".
+    NOTIFICATION_BATCH_LINES = 4
+    # Alerts of an episode that aired at most this long ago are still shown.
+    NOTIFICATION_LATE_GRACE_SEC = 15 * 60
+    # The monotonic timer stands still during suspend; re-check the wall clock this often.
+    NOTIFICATION_MAX_WAIT_MS = 5 * 60 * 1000
+
+    def _notification_leads(self):
+        return sorted({int(self._notification_lead_minutes), *self._notification_extra_leads})
 
     def _check_episode_notifications(self):
-        if not self._notifications_enabled:
+        """Sync the alert schedule with the current list and fire what is due."""
+        if not self._notifications_enabled or self._tray_icon is None:
             return
-        if self._tray_icon is None:
+        table = self._entry_table
+        ids = table.ids
+        episodes = table.episode
+        airing_at = table.airing_at
+        self._notification_schedule.update(
+            ((ids[row], episodes[row], airing_at[row]) for row in table.airing_rows),
+            self._notification_leads(),
+            time.time(),
+        )
+        self._on_notification_deadline()
+
+    def _on_notification_deadline(self):
+        if not self._notifications_enabled or self._tray_icon is None:
             return
-        if not self._full_airing_entries:
+        alerts = self._notification_schedule.pop_due(time.time(), self.NOTIFICATION_COALESCE_SEC)
+        if alerts:
+            self._show_episode_alerts(alerts)
+        deadline = self._notification_schedule.next_deadline()
+        if deadline is None:
+            self._notification_timer.stop()
             return
-
-        now_ts = int(datetime.now().timestamp())
-        self._prune_notified_episode_cache(now_ts)
-        lead_seconds = max(60, int(self._notification_lead_minutes) * 60)
-
-        for entry in self._full_airing_entries:
-            media = entry.get("media", {})
-            airing = media.get("nextAiringEpisode")
-            if not airing:
-                continue
-            airing_at = int(airing.get("airingAt") or 0)
-            if airing_at <= now_ts:
-                continue
-            delta = airing_at - now_ts
-            if delta > lead_seconds:
-                continue
-
-            media_id = media.get("id")
-            episode = int(airing.get("episode") or 0)
-            if media_id is None or episode <= 0:
-                continue
-
-            key = f"{media_id}:{episode}:{airing_at}"
-            if key in self._notified_episode_times:
-                continue
-
-            title = entry.get("display_title") or self._tr("Titolo sconosciuto", "Unknown Title")
-            time_str = datetime.fromtimestamp(airing_at).strftime("%H:%M")
-            summary = self._tr("Prossimo episodio", "Upcoming episode")
-            body = self._tr(
-                f"{title}\nEp {episode} alle {time_str}",
-                f"{title}\nEp {episode} at {time_str}",
-            )
-            self._tray_icon.showMessage(summary, body, QSystemTrayIcon.Information, 10000)
-            self._notified_episode_times[key] = airing_at
-            self._last_notification_media_id = int(media_id)
+        wait_ms = int(max(0.0, deadline - time.time()) * 1000)
+        self._notification_timer.start(min(wait_ms, self.NOTIFICATION_MAX_WAIT_MS))
+
+    def _alert_title(self, media_id: int) -> str:
+        row = self._entry_table.row_by_id.get(media_id)
+        entry = self._entry_table.entries[row] if row is not None else {}
+        return entry.get("display_title") or self._tr("Titolo sconosciuto", "Unknown Title")
+
+    def _show_episode_alerts(self, alerts):
+        summary = self._tr("Prossimo episodio", "Upcoming episode")
+        lines = []
+        for alert in alerts:
+            title = self._alert_title(alert.media_id)
+            time_str = datetime.fromtimestamp(alert.airing_at).strftime("%H:%M")
+            lines.append(self._tr(
+                f"{title}\nEp {alert.episode} alle {time_str}",
+                f"{title}\nEp {alert.episode} at {time_str}",
+            ))
+        if len(alerts) == 1:
+            body = lines[0]
+        else:
+            summary = self._tr(f"{len(alerts)} episodi in arrivo", f"{len(alerts)} upcoming episodes")
+            shown = [line.replace("\n", " - ") for line in lines[:self.NOTIFICATION_BATCH_LINES]]
+            hidden = len(lines) - len(shown)
+            if hidden > 0:
+                shown.append(self._tr(f"+{hidden} altri", f"+{hidden} more"))
+            body = "\n".join(shown)
+        self._tray_icon.showMessage(summary, body, QSystemTrayIcon.Information, 10000)
+        self._last_notification_media_id = int(alerts[0].media_id)
 
     def _tr(self, it_text: str, en_text: str) -> str:
         return en_text if self._app_language == "en" else it_text
@@ -0,0 +1,143 @@
+"""Background warm-up of the cover cache after a sync.
+
+Covers are queued in viewing order (today, tomorrow, then the rest of the
+week) and downloaded a few at a time on the shared thread pool. Every
+``start`` begins a new generation: queued URLs of the previous one are
+dropped and the bytes its in-flight jobs download are not counted. Those
+jobs still hold a download slot until they finish, so back-to-back syncs
+never run more than ``max_parallel`` downloads. A run stops queueing
+downloads once it has used its byte budget.
+"""
+
+import logging
+from collections import deque
+from typing import Iterable
+
+from PySide6.QtCore import QObject, Slot
+
+from core.cover_provider import load_cover_image
+from core.worker import Worker
+from services.cover_cache import CoverCache
+
+
+logger = logging.getLogger("airingdeck.covers")
+
+
+def cover_url(media: dict) -> str:
+    """Same preference order as the QML cards."""
+    cover = (media or {}).get("coverImage") or {}
+    return cover.get("extraLarge") or cover.get("large") or cover.get("medium") or ""
+
+
+def prefetch_order(table, today_weekday: int) -> list[str]:
+    """Unique cover URLs of the airing rows, starting from today's weekday."""
+    urls: list[str] = []
+    seen: set[str] = set()
+    entries = table.entries
+    for offset in range(7):
+        for row in table.day_rows[(today_weekday + offset) % 7]:
+            url = cover_url(entries[row].get("media"))
+            if url and url not in seen:
+                seen.add(url)
+                urls.append(url)
+    return urls
+
+
+def _warm_cover(cache: CoverCache, url: str, variant: str) -> int:
+    """Download (if needed) and thumbnail one cover; returns the bytes downloaded."""
+    if cache.contains(url, variant):
+        return 0
+    downloaded = 0 if cache.contains(url) else None
+    _, error = load_cover_image(cache, variant, url)
+    if error:
+        return 0
+    if downloaded is None:
+        original = cache.path_for(url)
+        try:
+            downloaded = original.stat().st_size
+        except OSError:
+            downloaded = 0
+    return downloaded
+
+
+class CoverPrefetcher(QObject):
+    """Bounded-parallel, cancellable cover downloads on a ``QThreadPool``."""
+
+    DEFAULT_MAX_PARALLEL = 2
+    VARIANT = "card"
+
+    def __init__(self, cache: CoverCache, max_parallel: int = DEFAULT_MAX_PARALLEL, parent=None):
+        super().__init__(parent)
+        self._cache = cache
+        self._pool = None
+        self._max_parallel = max(1, int(max_parallel))
+        self._generation = 0
+        self._queue: deque[str] = deque()
+        self._in_flight = 0
+        self._budget_bytes = 0
+        self._used_bytes = 0
+        self.warmed = 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    @property
+    def pending(self) -> int:
+        return len(self._queue)
+
+    @property
+    def used_bytes(self) -> int:
+        return self._used_bytes
+
+    def start(self, urls: Iterable[str], budget_bytes: int, pool) -> int:
+        """Replace any running prefetch with ``urls`` (highest priority first)."""
+        self.cancel()
+        self._pool = pool
+        self._budget_bytes = max(0, int(budget_bytes))
+        if self._budget_bytes:
+            self._queue.extend(urls)
+            self._fill()
+        return self._generation
+
+    def cancel(self):
+        # In-flight jobs keep their slots; _on_job_finished releases them.
+        self._generation += 1
+        self._queue.clear()
+        self._used_bytes = 0
+
+    def _fill(self):
+        while self._queue and self._in_flight < self._max_parallel and self._used_bytes < self._budget_bytes:
+            worker = Worker(self._run_job, self._generation, self._queue.popleft())
+            # Bound slot: delivered on this object's (GUI) thread.
+            worker.signals.result.connect(self._on_job_done)
+            # ``finished`` also fires for jobs cancelled by the scheduler.
+            worker.signals.finished.connect(self._on_job_finished)
+            self._in_flight += 1
+            self._pool.start(worker)
+        if self._queue and self._used_bytes >= self._budget_bytes:
+            logger.info("Cover prefetch stopped at budget (%d bytes); %d skipped", self._used_bytes, len(self._queue))
+            self._queue.clear()
+
+    def _run_job(self, generation: int, url: str) -> tuple[int, int]:
+        if generation != self._generation:
+            return generation, 0
+        try:
+            return generation, _warm_cover(self._cache, url, self.VARIANT)
+        except Exception:
+            logger.warning("Cover prefetch failed for %s", url, exc_info=True)
+            return generation, 0
+
+    @Slot(object)
+    def _on_job_done(self, outcome):
+        generation, downloaded = outcome
+        if generation != self._generation:
+            return
+        self._used_bytes += int(downloaded or 0)
+        self.warmed += 1
+
+    @Slot()
+    def _on_job_finished(self):
+        self._in_flight = max(0, self._in_flight - 1)
+        if self._pool is not None:
+            self._fill()
@@ -0,0 +1,190 @@
+"""``image://covers/<variant>/<url>`` provider backed by ``CoverCache``.
+
+QML asks for a variant (the size a card, the sidebar or the avatar actually
+draws) and the percent-encoded image URL. The provider serves the stored
+thumbnail when there is one; otherwise it downloads the original once,
+downscales it, and stores the thumbnail for next time. All of this runs on
+the provider's own thread pool, so the GUI thread never decodes or waits
+on the network, and cached covers keep working offline.
+"""
+
+import logging
+from typing import Optional, Tuple
+from urllib.parse import unquote
+
+from PySide6.QtCore import QBuffer, QByteArray, QIODevice, QRunnable, QSize, Qt, QThreadPool
+from PySide6.QtGui import QImage
+from PySide6.QtQuick import QQuickAsyncImageProvider, QQuickImageResponse, QQuickTextureFactory
+
+from core.decoded_image_cache import DecodedImageCache
+from services.cover_cache import CoverCache
+
+
+logger = logging.getLogger("airingdeck.covers")
+
+PROVIDER_ID = "covers"
+
+# Pixel sizes of the stored thumbnails: 2x the logical size each view draws.
+THUMBNAIL_SIZES = {
+    "card": QSize(360, 380),
+    "sidebar": QSize(800, 450),
+    "avatar": QSize(128, 128),
+}
+# Variants that fill their frame (cropped) rather than fitting inside it.
+_CROPPED_VARIANTS = {"card", "avatar"}
+THUMBNAIL_JPEG_QUALITY = 85
+
+
+def parse_cover_id(image_id: str) -> Tuple[str, str]:
+    """``"card/https%3A..."`` -> ``("card", "https://...")``."""
+    variant, _, encoded = (image_id or "").partition("/")
+    return variant, unquote(encoded)
+
+
+def scale_cover(image: QImage, variant: str) -> QImage:
+    target = THUMBNAIL_SIZES.get(variant)
+    if target is None or image.isNull():
+        return image
+    if image.width() <= target.width() and image.height() <= target.height():
+        return image
+    mode = Qt.KeepAspectRatioByExpanding if variant in _CROPPED_VARIANTS else Qt.KeepAspectRatio
+    scaled = image.scaled(target, mode, Qt.SmoothTransformation)
+    if variant in _CROPPED_VARIANTS and (scaled.width() > target.width() or scaled.height() > target.height()):
+        x = max(0, (scaled.width() - target.width()) // 2)
+        y = max(0, (scaled.height() - target.height()) // 2)
+        scaled = scaled.copy(x, y, min(scaled.width(), target.width()), min(scaled.height(), target.height()))
+    return scaled
+
+
+def encode_thumbnail(image: QImage) -> bytes:
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.WriteOnly)
+    if image.hasAlphaChannel():
+        image.save(buffer, "PNG")
+    else:
+        image.save(buffer, "JPG", THUMBNAIL_JPEG_QUALITY)
+    buffer.close()
+    return bytes(data)
+
+
+def load_cover_image(cache: CoverCache, variant: str, url: str) -> Tuple[QImage, str]:
+    """Thumbnail for ``variant`` of ``url`` as ``(image, error)``; runs off the GUI thread."""
+    if variant not in THUMBNAIL_SIZES or not url:
+        return QImage(), f"Unknown cover request: {variant}/{url}"
+
+    data = cache.load(url, variant)
+    if data is not None:
+        image = QImage.fromData(data)
+        if not image.isNull():
+            return image, ""
+
+    original = cache.fetch(url)
+    if original is None:
+        return QImage(), f"Cover unavailable: {url}"
+    image = QImage.fromData(original)
+    if image.isNull():
+        return QImage(), f"Cover could not be decoded: {url}"
+    thumbnail = scale_cover(image, variant)
+    cache.store(url, encode_thumbnail(thumbnail), variant)
+    return thumbnail, ""
+
+
+class _CoverResponse(QQuickImageResponse):
+    def __init__(self):
+        super().__init__()
+        self._image = QImage()
+        self._error = ""
+        self.cancelled = False
+
+    def textureFactory(self) -> QQuickTextureFactory:
+        return QQuickTextureFactory.textureFactoryForImage(self._image)
+
+    def errorString(self) -> str:
+        return self._error
+
+    def cancel(self):
+        self.cancelled = True
+
+    def complete(self, image: QImage, error: str):
+        self._image = image
+        self._error = error
+        self.finished.emit()
+
+
+class _CoverJob(QRunnable):
+    def __init__(
+        self,
+        cache: CoverCache,
+        decoded: DecodedImageCache,
+        response: _CoverResponse,
+        image_id: str,
+        requested: QSize,
+    ):
+        super().__init__()
+        self._cache = cache
+        self._decoded = decoded
+        self._response = response
+        self._image_id = image_id
+        self._requested = QSize(requested)
+
+    def run(self):
+        response = self._response
+        if response.cancelled:
+            response.complete(QImage(), "Cancelled")
+            return
+        variant, url = parse_cover_id(self._image_id)
+        requested = self._requested
+        # The cover URL identifies the media's artwork; the size is what QML draws.
+        key = (url, variant, requested.width(), requested.height())
+        image = self._decoded.get(key)
+        if image is not None:
+            response.complete(image, "")
+            return
+        try:
+            image, error = load_cover_image(self._cache, variant, url)
+        except Exception as exc:
+            logger.warning("Cover load failed for %s", self._image_id, exc_info=True)
+            image, error = QImage(), str(exc)
+        if not image.isNull() and requested.isValid() and requested.width() > 0 and requested.height() > 0:
+            if image.width() > requested.width() and image.height() > requested.height():
+                image = image.scaled(requested, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+        if not error:
+            self._decoded.put(key, image)
+        response.complete(image, error)
+
+
+class CoverImageProvider(QQuickAsyncImageProvider):
+    """Async provider for ``image://covers/...`` URLs.
+
+    Decoded images are kept in a ``DecodedImageCache``; views that disable
+    Qt's pixmap cache (the sidebar) get repeat requests served without a
+    JPEG decode. Both the lookup and any decode run on the provider's pool.
+    """
+
+    DEFAULT_MAX_THREADS = 4
+
+    def __init__(
+        self,
+        cache: CoverCache,
+        decoded: Optional[DecodedImageCache] = None,
+        max_threads: int = DEFAULT_MAX_THREADS,
+    ):
+        super().__init__()
+        self._cache = cache
+        self._decoded = decoded if decoded is not None else DecodedImageCache()
+        self._pool = QThreadPool()
+        self._pool.setMaxThreadCount(max(1, int(max_threads)))
+
+    @property
+    def cache(self) -> CoverCache:
+        return self._cache
+
+    @property
+    def decoded(self) -> DecodedImageCache:
+        return self._decoded
+
+    def requestImageResponse(self, image_id: str, requested_size: QSize) -> QQuickImageResponse:
+        response = _CoverResponse()
+        self._pool.start(_CoverJob(self._cache, self._decoded, response, image_id, requested_size))
+        return response
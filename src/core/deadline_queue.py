@@ -0,0 +1,60 @@
+"""Min-heap of per-key deadlines driving one-shot timers.
+
+Rescheduling or discarding a key leaves its old heap item behind; stale
+items are skipped lazily when they reach the top, so every operation stays
+O(log n) and the owner only ever arms a single timer for ``next_deadline``.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+from typing import Hashable, Optional
+
+
+class DeadlineQueue:
+    def __init__(self):
+        self._heap: list[tuple[float, int, Hashable]] = []
+        self._deadlines: dict[Hashable, float] = {}
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._deadlines
+
+    def schedule(self, key: Hashable, deadline: float):
+        self._deadlines[key] = deadline
+        heapq.heappush(self._heap, (deadline, next(self._counter), key))
+
+    def discard(self, key: Hashable):
+        self._deadlines.pop(key, None)
+
+    def clear(self):
+        self._heap.clear()
+        self._deadlines.clear()
+
+    def _drop_stale(self):
+        heap = self._heap
+        while heap:
+            deadline, _, key = heap[0]
+            if self._deadlines.get(key) == deadline:
+                return
+            heapq.heappop(heap)
+
+    def next_deadline(self) -> Optional[float]:
+        self._drop_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: float) -> list[Hashable]:
+        """Remove and return every key whose deadline is ``<= now``, earliest first."""
+        due = []
+        heap = self._heap
+        while True:
+            self._drop_stale()
+            if not heap or heap[0][0] > now:
+                return due
+            _, _, key = heapq.heappop(heap)
+            del self._deadlines[key]
+            due.append(key)
@@ -0,0 +1,71 @@
+"""In-memory cache of decoded cover images, bounded by total pixels.
+
+Entry counts say little about memory when a sidebar cover is 30x the pixels
+of an avatar, so the bound is the sum of ``width * height`` over the cached
+images (about 4 bytes each). Shared by the provider's worker threads.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+from PySide6.QtGui import QImage
+
+
+class DecodedImageCache:
+    """Least-recently-used ``QImage`` store with a pixel budget."""
+
+    # ~96 MB of 32-bit pixels: a few hundred card thumbnails plus sidebar covers.
+    DEFAULT_MAX_PIXELS = 24 * 1024 * 1024
+
+    def __init__(self, max_pixels: int = DEFAULT_MAX_PIXELS):
+        self._max_pixels = max(1, int(max_pixels))
+        self._images: OrderedDict[Hashable, QImage] = OrderedDict()
+        self._pixels = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._images)
+
+    @property
+    def pixels(self) -> int:
+        with self._lock:
+            return self._pixels
+
+    @staticmethod
+    def _cost(image: QImage) -> int:
+        return max(1, image.width() * image.height())
+
+    def get(self, key: Hashable) -> Optional[QImage]:
+        with self._lock:
+            image = self._images.get(key)
+            if image is None:
+                self.misses += 1
+                return None
+            self._images.move_to_end(key)
+            self.hits += 1
+            return image
+
+    def put(self, key: Hashable, image: QImage):
+        if image is None or image.isNull():
+            return
+        cost = self._cost(image)
+        if cost > self._max_pixels:
+            return
+        with self._lock:
+            previous = self._images.pop(key, None)
+            if previous is not None:
+                self._pixels -= self._cost(previous)
+            self._images[key] = image
+            self._pixels += cost
+            while self._pixels > self._max_pixels:
+                _, evicted = self._images.popitem(last=False)
+                self._pixels -= self._cost(evicted)
+
+    def clear(self):
+        with self._lock:
+            self._images.clear()
+            self._pixels = 0
@@ -0,0 +1,338 @@
+"""Columnar (structure-of-arrays) view over the anime list.
+
+The per-tick and per-keystroke passes (filters, sorts, countdowns and
+notifications) only need a handful of scalar fields per row. Reading them
+from nested entry dicts costs several hash lookups per row; here they live
+in parallel ``array`` columns indexed by row number, and buckets are kept as
+arrays of row numbers. The entry dicts are still kept in ``entries`` because
+the QML models expose the full ``media`` map.
+"""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from typing import Any, Iterable, Optional, Sequence
+
+from core.native_accel import FUZZY_FIELD_SEPARATOR, fuzzy_rank, sort_rows_by_key
+from core.search_index import SearchIndex
+
+
+# Sort key used for rows without a known next episode (sorted last).
+NO_AIRING_AT = 1 << 62
+# Sort fields backed by a numeric column (relevance is computed per query).
+SORT_FIELDS = ("airing_time", "title", "progress", "score")
+# Fuzzy (typo) results kept when a query has no exact match.
+FUZZY_TOP_K = 50
+
+
+def _int_or(value: Any, default: int) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _title_key(entry: dict[str, Any]) -> str:
+    return sys.intern((entry.get("display_title") or "").casefold())
+
+
+def _float_or(value: Any, default: float) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+class GenreIndex:
+    """Integer ids for the genres of one list revision.
+
+    Every genre gets one bit, so an entry's genres collapse to one integer
+    mask and "has genre X" is a single AND. Lookups are case-insensitive.
+    """
+
+    __slots__ = ("names", "bits")
+
+    def __init__(self, names: Iterable[str] = ()):
+        self.names: list[str] = sorted({name for name in names if name})
+        self.bits: dict[str, int] = {}
+        for bit, name in enumerate(self.names):
+            self.bits.setdefault(name.lower(), 1 << bit)
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[dict[str, Any]]) -> "GenreIndex":
+        return cls(
+            genre
+            for entry in entries
+            for genre in (entry.get("media") or {}).get("genres") or []
+        )
+
+    @property
+    def fits_native(self) -> bool:
+        """Masks fit the native ``uint64`` column."""
+        return len(self.names) <= 64
+
+    def mask_of(self, genres: Iterable[str]) -> int:
+        mask = 0
+        bits = self.bits
+        for genre in genres or ():
+            if genre:
+                mask |= bits.get(genre.lower(), 0)
+        return mask
+
+    def mask_for(self, selected_genre: str) -> Optional[int]:
+        """Bit for a lower-cased genre name; ``None`` means "no genre filter"."""
+        if not selected_genre or selected_genre == "all genres":
+            return None
+        return self.bits.get(selected_genre, 0)
+
+    def counts(self, masks: Sequence[int], rows: Optional[Iterable[int]] = None) -> dict[str, int]:
+        """Entries per genre over ``rows`` (all rows by default)."""
+        per_bit = [0] * len(self.names)
+        for row in (range(len(masks)) if rows is None else rows):
+            mask = masks[row]
+            while mask:
+                low = mask & -mask
+                per_bit[low.bit_length() - 1] += 1
+                mask ^= low
+        return {name: per_bit[bit] for bit, name in enumerate(self.names)}
+
+
+def _frozen(column: array) -> memoryview:
+    """Read-only copy of an ``array`` column with the same element format."""
+    return memoryview(column.tobytes()).cast(column.typecode)
+
+
+class ColumnSnapshot:
+    """Immutable copies of the columns the native filter and sort read.
+
+    Built once per list revision; the buffers cannot change underneath the
+    native kernel, so it can run with the GIL released.
+    """
+
+    __slots__ = ("weekday", "score", "genre_mask", "sort_keys")
+
+    def __init__(self, table: "EntryTable"):
+        self.weekday = _frozen(table.weekday)
+        self.score = _frozen(table.score)
+        self.genre_mask = _frozen(table.genre_mask)
+        self.sort_keys: dict[str, memoryview] = {
+            field: _frozen(table.sort_column(field)) for field in SORT_FIELDS
+        }
+
+    def sort_key(self, sort_field: str) -> memoryview:
+        return self.sort_keys.get(sort_field, self.sort_keys["airing_time"])
+
+
+class EntryTable:
+    """Parallel columns for every entry of the list, addressed by row number."""
+
+    __slots__ = (
+        "entries",
+        "ids",
+        "airing_at",
+        "episode",
+        "weekday",
+        "score",
+        "sort_score",
+        "progress",
+        "genre_mask",
+        "title_keys",
+        "_title_rank",
+        "_snapshot",
+        "search_blobs",
+        "fuzzy_texts",
+        "genre_index",
+        "day_rows",
+        "airing_rows",
+        "row_by_id",
+        "_search_index",
+        "_relevance_query",
+        "_relevance",
+    )
+
+    def __init__(self):
+        self.entries: list[dict[str, Any]] = []
+        self.ids = array("q")
+        self.airing_at = array("q")
+        self.episode = array("i")
+        self.weekday = array("b")
+        self.score = array("i")
+        self.sort_score = array("d")
+        self.progress = array("i")
+        self.genre_mask: Sequence[int] = array("Q")
+        self.title_keys: list[str] = []
+        self._title_rank: Optional[array] = None
+        self._snapshot: Optional[ColumnSnapshot] = None
+        self.search_blobs: list[str] = []
+        self.fuzzy_texts: list[str] = []
+        self.genre_index = GenreIndex()
+        self.day_rows = [array("i") for _ in range(7)]
+        self.airing_rows = array("i")
+        self.row_by_id: dict[int, int] = {}
+        self._search_index: Optional[SearchIndex] = None
+        self._relevance_query = ""
+        self._relevance: dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @classmethod
+    def from_entries(cls, entries: list[dict[str, Any]]) -> "EntryTable":
+        """Build the columns from derived entries (``calendar_day``, ``display_title``...)."""
+        table = cls()
+        table.entries = entries
+        table.genre_index = GenreIndex.from_entries(entries)
+        if not table.genre_index.fits_native:
+            # AniList has ~20 genres; wider masks use Python ints (no native path).
+            table.genre_mask = []
+
+        for row, entry in enumerate(entries):
+            table._append_row(row, entry)
+        return table
+
+    def _append_row(self, row: int, entry: dict[str, Any]):
+        media = entry.get("media") or {}
+        airing = media.get("nextAiringEpisode") or {}
+        media_id = _int_or(media.get("id"), -1)
+        airing_at = _int_or(airing.get("airingAt"), 0) if airing else 0
+        weekday = _int_or(entry.get("calendar_day"), -1)
+        if not 0 <= weekday < 7:
+            weekday = -1
+
+        mask = self.genre_index.mask_of(media.get("genres"))
+
+        self.ids.append(media_id)
+        self.airing_at.append(airing_at if airing_at > 0 else NO_AIRING_AT)
+        self.episode.append(_int_or(airing.get("episode"), 0))
+        self.weekday.append(weekday)
+        self.score.append(int(_float_or(media.get("averageScore"), -1.0)))
+        self.sort_score.append(
+            _float_or(entry.get("rating_sort_score", media.get("averageScore") or -1), -1.0)
+        )
+        self.progress.append(_int_or(entry.get("progress"), 0))
+        self.genre_mask.append(mask)
+        self.title_keys.append(_title_key(entry))
+        self.search_blobs.append(entry.get("_search_blob") or "")
+        titles = media.get("title") or {}
+        self.fuzzy_texts.append(
+            FUZZY_FIELD_SEPARATOR.join(
+                text.lower()
+                for text in (titles.get("romaji"), titles.get("english"), titles.get("native"), *(media.get("synonyms") or ()))
+                if text
+            )
+        )
+
+        if media_id >= 0:
+            self.row_by_id[media_id] = row
+        if weekday >= 0:
+            self.day_rows[weekday].append(row)
+            self.airing_rows.append(row)
+
+    def daily_counts(self) -> list[int]:
+        return [len(rows) for rows in self.day_rows]
+
+    def entries_for(self, rows: Iterable[int]) -> list[dict[str, Any]]:
+        entries = self.entries
+        return [entries[row] for row in rows]
+
+    @property
+    def genres(self) -> list[str]:
+        return self.genre_index.names
+
+    def genre_mask_for(self, selected_genre: str) -> Optional[int]:
+        return self.genre_index.mask_for(selected_genre)
+
+    def genre_counts(self, rows: Optional[Iterable[int]] = None) -> dict[str, int]:
+        return self.genre_index.counts(self.genre_mask, rows)
+
+    @property
+    def search_index(self) -> SearchIndex:
+        """Trigram index over ``search_blobs``, built on the first text query."""
+        if self._search_index is None:
+            self._search_index = SearchIndex(self.search_blobs)
+        return self._search_index
+
+    def relevance(self, query: str) -> dict[int, int]:
+        """Match score per row for ``query`` (rows that do not match are absent).
+
+        Exact substring hits come from the trigram index and are only ranked.
+        When nothing matches exactly (usually a typo), every row is ranked by
+        the fuzzy matcher across romaji, english, native and synonyms and the
+        best ``FUZZY_TOP_K`` are kept.
+        """
+        if query == self._relevance_query and query:
+            return self._relevance
+        exact_rows = self.search_index.search(query)
+        if exact_rows is None:
+            scores = {}
+        elif exact_rows:
+            texts = self.fuzzy_texts
+            ranked = fuzzy_rank([texts[row] for row in exact_rows], query)
+            scores = {row: 0 for row in exact_rows}
+            for position, score in ranked:
+                scores[exact_rows[position]] = score
+        else:
+            scores = dict(fuzzy_rank(self.fuzzy_texts, query, FUZZY_TOP_K))
+        self._relevance_query = query
+        self._relevance = scores
+        return scores
+
+    def refresh_titles(self):
+        """Re-read ``display_title`` after a title-language change."""
+        self.title_keys = [_title_key(entry) for entry in self.entries]
+        self._title_rank = None
+        self._snapshot = None
+
+    def freeze(self) -> Optional[ColumnSnapshot]:
+        """Build the column snapshot now instead of on the first filter."""
+        if self._snapshot is None and isinstance(self.genre_mask, array):
+            self._snapshot = ColumnSnapshot(self)
+        return self._snapshot
+
+    @property
+    def snapshot(self) -> Optional[ColumnSnapshot]:
+        """Frozen columns for the native kernel; ``None`` when masks exceed 64 bits."""
+        return self.freeze()
+
+    @property
+    def title_rank(self) -> array:
+        """Position of each row's title in alphabetical order (equal titles share a rank).
+
+        Lets title sorts run on a numeric column instead of comparing strings.
+        """
+        if self._title_rank is None:
+            keys = self.title_keys
+            rank = array("i", bytes(4 * len(keys)))
+            previous = None
+            position = -1
+            for row in sorted(range(len(keys)), key=keys.__getitem__):
+                if keys[row] != previous:
+                    position += 1
+                    previous = keys[row]
+                rank[row] = position
+            self._title_rank = rank
+        return self._title_rank
+
+    def sort_column(self, sort_field: str) -> array:
+        """Numeric key column for ``sort_field`` (airing time by default)."""
+        if sort_field == "title":
+            return self.title_rank
+        if sort_field == "progress":
+            return self.progress
+        if sort_field == "score":
+            return self.sort_score
+        return self.airing_at
+
+    def sort_rows(self, rows: Iterable[int], sort_field: str, ascending: bool, query: str = "") -> list[int]:
+        rows = list(rows)
+        if len(rows) < 2:
+            return rows
+
+        if sort_field == "relevance" and query:
+            # Best match first (when ascending); ties keep airing order.
+            relevance = self.relevance(query)
+            rows = sort_rows_by_key(rows, self.airing_at)
+            rows.sort(key=lambda row: relevance.get(row, 0), reverse=ascending)
+            return rows
+        return sort_rows_by_key(rows, self.sort_column(sort_field), descending=not ascending)
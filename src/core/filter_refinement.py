@@ -0,0 +1,78 @@
+"""Reuse the previous filter result when the filter only gets narrower.
+
+Typing one more character, raising the minimum score, picking a genre from
+"All genres" or switching "only today" on can only remove rows, so the new
+result is a subset of the previous one and only those rows need checking.
+Cached rows are tied to the list revision; any other change rescans.
+"""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+
+@dataclass(frozen=True)
+class FilterConstraints:
+    query: str
+    genre_mask: Optional[int]
+    min_score: int
+    only_today: bool
+    today_weekday: int
+
+    def narrows(self, previous: "FilterConstraints", exact_query: bool) -> bool:
+        """Every row passing ``self`` also passes ``previous``.
+
+        ``exact_query`` tells whether ``self.query`` has exact substring hits;
+        without them the search falls back to fuzzy matching, which may return
+        rows the previous query did not.
+        """
+        if self.today_weekday != previous.today_weekday:
+            return False
+        if previous.query and (self.query != previous.query and not (exact_query and previous.query in self.query)):
+            return False
+        if previous.genre_mask is not None and self.genre_mask != previous.genre_mask:
+            return False
+        if self.min_score < previous.min_score:
+            return False
+        return self.only_today or not previous.only_today
+
+
+class FilterRefiner:
+    """The last filter result (in row order) and what produced it."""
+
+    __slots__ = ("_revision", "_constraints", "_rows", "refined", "rescanned")
+
+    def __init__(self):
+        self._revision: Optional[int] = None
+        self._constraints: Optional[FilterConstraints] = None
+        self._rows = array("i")
+        self.refined = 0
+        self.rescanned = 0
+
+    def clear(self):
+        self._revision = None
+        self._constraints = None
+        self._rows = array("i")
+
+    def base_rows(
+        self,
+        revision: int,
+        constraints: FilterConstraints,
+        all_rows: Sequence[int],
+        exact_query: bool,
+    ) -> Sequence[int]:
+        """Rows that still need checking: the previous result or ``all_rows``."""
+        previous = self._constraints
+        if previous is not None and revision == self._revision and constraints.narrows(previous, exact_query):
+            self.refined += 1
+            return self._rows
+        self.rescanned += 1
+        return all_rows
+
+    def remember(self, revision: int, constraints: FilterConstraints, rows: Sequence[int]):
+        # Row order keeps stable sorts breaking ties exactly like a full scan.
+        self._revision = revision
+        self._constraints = constraints
+        self._rows = array("i", sorted(rows))
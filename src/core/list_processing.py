@@ -0,0 +1,235 @@
+"""Pure list post-processing shared by the GUI thread and sync workers.
+
+Nothing here touches Qt objects, so these helpers can run inside a
+``Worker`` and hand the GUI thread structures that are ready to swap in.
+"""
+
+from __future__ import annotations
+
+import inspect
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Optional
+
+from core.entry_table import EntryTable
+
+
+def translate(language: str, it_text: str, en_text: str) -> str:
+    return en_text if language == "en" else it_text
+
+
+def display_title(media: dict[str, Any], use_english_title: bool, language: str) -> str:
+    """Standardized title selection based on settings"""
+    titles = media.get('title', {})
+    unknown = translate(language, "Titolo sconosciuto", "Unknown Title")
+    if use_english_title:
+        return titles.get('english') or titles.get('romaji') or unknown
+    return titles.get('romaji') or titles.get('english') or unknown
+
+
+def format_rating_display(score_value, score_scale) -> str:
+    try:
+        value = float(score_value)
+        scale = int(score_scale)
+    except (TypeError, ValueError):
+        return "--"
+    if value <= 0:
+        return "--"
+    if scale == 10:
+        return f"{value:.1f}/10"
+    return f"{int(round(value))}/100"
+
+
+def apply_entry_rating(entry: dict[str, Any], score_value, score_scale):
+    display = format_rating_display(score_value, score_scale)
+    sort_score = -1.0
+    if display != "--":
+        try:
+            value = float(score_value)
+            scale = float(score_scale)
+            if scale > 0:
+                sort_score = (value / scale) * 100.0
+        except (TypeError, ValueError):
+            sort_score = -1.0
+    entry["rating_value"] = score_value if display != "--" else None
+    entry["rating_scale"] = score_scale if display != "--" else None
+    entry["rating_display"] = display
+    entry["rating_sort_score"] = sort_score
+
+
+def apply_default_anilist_rating(entry: dict[str, Any]):
+    media = entry.get("media", {})
+    score = media.get("averageScore")
+    try:
+        value = float(score)
+    except (TypeError, ValueError):
+        value = None
+    if value is None or value <= 0:
+        apply_entry_rating(entry, None, None)
+        return
+    apply_entry_rating(entry, value, 100)
+
+
+def format_countdown(airing_at, language: str, now: Optional[datetime] = None) -> str:
+    """Format countdown with support for days, hours, minutes"""
+    now = now or datetime.now()
+    dt = datetime.fromtimestamp(airing_at)
+    diff = dt - now
+
+    time_str = dt.strftime("%H:%M")
+    seconds = diff.total_seconds()
+
+    if seconds <= -3600:  # Over an hour ago
+        return translate(language, f"Già uscito alle {time_str}", f"Aired at {time_str}")
+    elif seconds <= 0:  # Within the last hour
+        return translate(language, "In onda ora", "Airing now")
+
+    days = int(seconds // 86400)
+    hours = int((seconds % 86400) // 3600)
+    minutes = int((seconds % 3600) // 60)
+
+    if days > 0:
+        return f"{time_str} (in {days}d {hours}h)"
+    elif hours > 0:
+        return f"{time_str} (in {hours}h {minutes}m)"
+    else:
+        return f"{time_str} (in {minutes}m)"
+
+
+def next_countdown_change(airing_at: int, now_ts: float) -> Optional[int]:
+    """Timestamp at which ``format_countdown`` output changes next (``None``: never).
+
+    Mirrors the formatting granularity: hours while more than a day away,
+    minutes within a day, then the "airing now" and "aired at" transitions.
+    """
+    seconds = airing_at - now_ts
+    if seconds <= -3600:
+        return None
+    if seconds <= 0:
+        return airing_at + 3600
+    if seconds > 86400:
+        hours = int(seconds // 3600)
+        return airing_at - hours * 3600 + 1
+    minutes = int(seconds // 60)
+    if minutes == 0:
+        return airing_at
+    return airing_at - minutes * 60 + 1
+
+
+def refresh_time_fields(entry: dict[str, Any], language: str, today_weekday: int):
+    """Recompute the fields that depend on the current time only."""
+    airing = entry.get('media', {}).get('nextAiringEpisode')
+    entry['is_today'] = entry.get('calendar_day', -1) == today_weekday
+    if airing:
+        entry['airing_time_formatted'] = format_countdown(airing['airingAt'], language)
+    else:
+        entry['airing_time_formatted'] = translate(language, "Da annunciare", "TBA")
+
+
+def derive_entry_fields(entry: dict[str, Any], use_english_title: bool, language: str, today_weekday: int):
+    media = entry.get('media', {})
+    airing = media.get('nextAiringEpisode')
+
+    # Centralize Title
+    entry['display_title'] = display_title(media, use_english_title, language)
+    apply_default_anilist_rating(entry)
+    titles = media.get("title") or {}
+    # Same titles the fuzzy ranker scores, so exact and fuzzy matches agree.
+    search_titles = (titles.get("romaji"), titles.get("english"), titles.get("native"), *(media.get("synonyms") or ()))
+    entry["_search_blob"] = " ".join(text for text in search_titles if text).lower()
+    entry['calendar_day'] = datetime.fromtimestamp(airing['airingAt']).weekday() if airing else -1
+    refresh_time_fields(entry, language, today_weekday)
+
+
+@dataclass
+class PreparedList:
+    """Derived list structures ready to be swapped into the controller."""
+
+    entries: list[dict[str, Any]]
+    use_english_title: bool
+    language: str
+    table: EntryTable = field(default_factory=EntryTable)
+    by_id: dict[Any, dict[str, Any]] = field(default_factory=dict)
+    daily_counts: list[int] = field(default_factory=lambda: [0] * 7)
+    genres: list[str] = field(default_factory=list)
+    watermark: int = 0
+
+
+def prepare_anime_list(
+    entries: list[dict[str, Any]],
+    use_english_title: bool,
+    language: str,
+    today_weekday: Optional[int] = None,
+    derive: bool = True,
+) -> PreparedList:
+    """Build the columnar table; with ``derive`` also compute every display field."""
+    if today_weekday is None:
+        today_weekday = datetime.now().weekday()
+    watermark = 0
+    for entry in entries:
+        if derive:
+            derive_entry_fields(entry, use_english_title, language, today_weekday)
+        try:
+            watermark = max(watermark, int(entry.get("updatedAt") or 0))
+        except (TypeError, ValueError):
+            pass
+
+    table = EntryTable.from_entries(entries)
+    # Freeze the filter columns here, usually on the sync worker thread.
+    table.freeze()
+    return PreparedList(
+        entries=entries,
+        use_english_title=use_english_title,
+        language=language,
+        table=table,
+        by_id={table.ids[row]: entries[row] for row in table.row_by_id.values()},
+        daily_counts=table.daily_counts(),
+        genres=table.genres,
+        watermark=watermark,
+    )
+
+
+def fetch_prepared_list(
+    fetch: Callable[[int], Any],
+    user_id: int,
+    use_english_title: bool,
+    language: str,
+):
+    """Worker body: fetch the list and derive all UI fields off the GUI thread.
+
+    Streaming fetchers are relayed page by page (already derived), and the
+    generator returns a ``PreparedList`` for the whole collection.
+    """
+    today_weekday = datetime.now().weekday()
+    result = fetch(user_id)
+    derived = False
+    if inspect.isgenerator(result):
+        while True:
+            try:
+                page = next(result)
+            except StopIteration as stop:
+                result = stop.value
+                break
+            for entry in page:
+                derive_entry_fields(entry, use_english_title, language, today_weekday)
+            yield page
+        derived = True
+    return prepare_anime_list(result or [], use_english_title, language, today_weekday, derive=not derived)
+
+
+def fetch_prepared_delta(
+    fetch_delta: Callable[..., dict[str, Any]],
+    user_id: int,
+    updated_since: int,
+    stale_media_ids: list[int],
+    use_english_title: bool,
+    language: str,
+) -> dict[str, Any]:
+    """Worker body for delta syncs: changed entries come back already derived."""
+    delta = fetch_delta(user_id, updated_since, stale_media_ids) or {}
+    today_weekday = datetime.now().weekday()
+    for entry in delta.get("changed") or []:
+        derive_entry_fields(entry, use_english_title, language, today_weekday)
+    delta["use_english_title"] = use_english_title
+    delta["language"] = language
+    return delta
@@ -0,0 +1,211 @@
+"""Binary snapshot of the derived anime list rows.
+
+Layout (little endian)::
+
+    header   HEADER struct (magic, version, variant, user id, row count, text length)
+    rows     row_count * ROW struct (numeric columns + text offsets)
+    text     one UTF-8 blob holding every string column
+
+Text offsets are code-point offsets into the decoded blob, so loading is a
+single ``mmap`` + one ``iter_unpack`` over the rows + one UTF-8 decode; no
+JSON and no per-field parsing. ``variant`` encodes the settings the derived
+fields depend on (title language), so a mismatch invalidates the snapshot.
+"""
+
+from __future__ import annotations
+
+import logging
+import mmap
+import os
+import struct
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+
+logger = logging.getLogger("airingdeck.snapshot")
+
+MAGIC = b"ADSN"
+FORMAT_VERSION = 3
+HEADER = struct.Struct("<4sHHqII")
+TEXT_FIELDS = (
+    "display_title",
+    "search_blob",
+    "romaji",
+    "english",
+    "native",
+    "synonyms",
+    "cover_extra_large",
+    "cover_large",
+    "cover_medium",
+    "site_url",
+    "genres",
+    "status",
+    "rating_display",
+)
+# media_id, airing_at, updated_at, episode, progress, average_score, calendar_day,
+# rating_sort_score, then (offset, length) for every text field.
+ROW = struct.Struct("<qqqiiibd" + "II" * len(TEXT_FIELDS))
+LIST_SEPARATOR = "\x1f"
+
+
+def snapshot_variant(use_english_title: bool, app_language: str) -> int:
+    return (1 if use_english_title else 0) | (2 if app_language == "en" else 0)
+
+
+def _int_or(value: Any, default: int) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def write_snapshot(path: Path, entries: list[dict[str, Any]], user_id: int, variant: int) -> None:
+    """Persist derived rows atomically with owner-only permissions."""
+    path = Path(path)
+    text_parts: list[str] = []
+    text_len = 0
+    rows = bytearray()
+
+    for entry in entries:
+        media = entry.get("media") or {}
+        titles = media.get("title") or {}
+        cover = media.get("coverImage") or {}
+        airing = media.get("nextAiringEpisode") or {}
+        texts = (
+            entry.get("display_title") or "",
+            entry.get("_search_blob") or "",
+            titles.get("romaji") or "",
+            titles.get("english") or "",
+            titles.get("native") or "",
+            LIST_SEPARATOR.join(s for s in (media.get("synonyms") or []) if s),
+            cover.get("extraLarge") or "",
+            cover.get("large") or "",
+            cover.get("medium") or "",
+            media.get("siteUrl") or "",
+            LIST_SEPARATOR.join(g for g in (media.get("genres") or []) if g),
+            entry.get("status") or "",
+            entry.get("rating_display") or "--",
+        )
+        refs: list[int] = []
+        for text in texts:
+            refs.append(text_len)
+            refs.append(len(text))
+            text_parts.append(text)
+            text_len += len(text)
+
+        calendar_day = _int_or(entry.get("calendar_day"), -1)
+        sort_score = entry.get("rating_sort_score")
+        rows += ROW.pack(
+            _int_or(media.get("id"), -1),
+            _int_or(airing.get("airingAt"), 0),
+            _int_or(entry.get("updatedAt"), 0),
+            _int_or(airing.get("episode"), 0),
+            _int_or(entry.get("progress"), 0),
+            _int_or(media.get("averageScore"), -1),
+            calendar_day if -1 <= calendar_day < 7 else -1,
+            -1.0 if sort_score is None else float(sort_score),
+            *refs,
+        )
+
+    # surrogatepass: API text may carry lone surrogates; they round-trip as one code point.
+    text_blob = "".join(text_parts).encode("utf-8", "surrogatepass")
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, variant, int(user_id), len(entries), len(text_blob))
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    fd = os.open(str(tmp_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o600)
+    with os.fdopen(fd, "wb") as fh:
+        fh.write(header)
+        fh.write(rows)
+        fh.write(text_blob)
+    os.replace(tmp_path, path)
+
+
+def read_snapshot(path: Path, user_id: int, variant: int) -> Optional[list[dict[str, Any]]]:
+    """Load entries from a snapshot; ``None`` if missing, foreign or outdated."""
+    path = Path(path)
+    try:
+        with path.open("rb") as fh:
+            if os.fstat(fh.fileno()).st_size < HEADER.size:
+                return None
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                view = memoryview(mapped)
+                try:
+                    return _decode(view, user_id, variant)
+                finally:
+                    view.release()
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, struct.error, UnicodeDecodeError) as exc:
+        logger.warning("Ignoring unreadable list snapshot: %s", exc)
+        return None
+
+
+def _decode(view: memoryview, user_id: int, variant: int) -> Optional[list[dict[str, Any]]]:
+    magic, version, stored_variant, stored_user, row_count, text_size = HEADER.unpack_from(view, 0)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        return None
+    if stored_variant != variant or stored_user != int(user_id):
+        return None
+    rows_end = HEADER.size + row_count * ROW.size
+    if rows_end + text_size != len(view):
+        return None
+
+    text = str(view[rows_end:], "utf-8", "surrogatepass")
+    now_ts = int(time.time())
+    entries: list[dict[str, Any]] = []
+    for row in ROW.iter_unpack(view[HEADER.size:rows_end]):
+        media_id, airing_at, updated_at, episode, progress, average_score, calendar_day, sort_score = row[:8]
+        refs = row[8:]
+        (
+            display_title,
+            search_blob,
+            romaji,
+            english,
+            native,
+            synonyms,
+            cover_extra_large,
+            cover_large,
+            cover_medium,
+            site_url,
+            genres,
+            status,
+            rating_display,
+        ) = [text[refs[i]:refs[i] + refs[i + 1]] for i in range(0, len(refs), 2)]
+
+        next_airing = None
+        if airing_at > 0:
+            next_airing = {
+                "episode": episode,
+                "airingAt": airing_at,
+                "timeUntilAiring": airing_at - now_ts,
+            }
+        has_rating = rating_display != "--"
+        entries.append({
+            "status": status or None,
+            "progress": progress,
+            "updatedAt": updated_at,
+            "media": {
+                "id": media_id if media_id >= 0 else None,
+                "title": {"romaji": romaji or None, "english": english or None, "native": native or None},
+                "synonyms": synonyms.split(LIST_SEPARATOR) if synonyms else [],
+                "coverImage": {
+                    "extraLarge": cover_extra_large or None,
+                    "large": cover_large or None,
+                    "medium": cover_medium or None,
+                },
+                "nextAiringEpisode": next_airing,
+                "genres": genres.split(LIST_SEPARATOR) if genres else [],
+                "averageScore": average_score if average_score >= 0 else None,
+                "siteUrl": site_url or None,
+            },
+            "display_title": display_title,
+            "_search_blob": search_blob,
+            "calendar_day": calendar_day,
+            "rating_value": float(average_score) if has_rating else None,
+            "rating_scale": 100 if has_rating else None,
+            "rating_display": rating_display,
+            "rating_sort_score": sort_score,
+        })
+    return entries
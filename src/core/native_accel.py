@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from typing import Any
+from array import array
+from typing import TYPE_CHECKING, Any, Optional, Sequence
+
+if TYPE_CHECKING:
+    from core.entry_table import EntryTable
 
 try:
     from core import _airingdeck_native as _native
@@ -12,85 +16,197 @@ def is_native_available() -> bool:
     return _native is not None
 
 
-def filter_entries(entries: list[dict[str, Any]], query: str) -> list[dict[str, Any]]:
-    if not query:
-        return entries
-
-    if _native is None:
-        return [entry for entry in entries if query in entry.get("_search_blob", "")]
-
-    try:
-        indices = _native.filter_contains_indices(entries, query)
-    except Exception:
-        return [entry for entry in entries if query in entry.get("_search_blob", "")]
-
-    return [entries[i] for i in indices]
-
-
-def filter_entries_advanced(
-    entries: list[dict[str, Any]],
+def filter_sort_buckets(
+    table: EntryTable,
+    rows,
     query: str,
     selected_genre: str,
     min_score: int,
     only_today: bool,
     today_weekday: int,
-) -> list[dict[str, Any]]:
+    sort_field: Optional[str] = None,
+    descending: bool = False,
+) -> tuple[list[Sequence[int]], Sequence[int], list[int]]:
+    """Filter ``rows`` once and split the survivors by weekday.
+
+    Returns ``(days, combined, counts)``: seven per-weekday row sequences, all
+    surviving rows, and the per-day counts. Rows are sorted (stably) by the
+    column behind ``sort_field``; with ``sort_field=None`` the input order is
+    kept, so callers can pre-sort ``rows`` by keys the kernel cannot see.
+    Rows without a weekday are dropped. Row sequences are int32 buffers
+    (``memoryview`` from the native kernel, ``array('i')`` from the fallback).
+    """
+    genre_mask = table.genre_mask_for((selected_genre or "").strip().lower())
+    if genre_mask == 0:
+        return [array("i") for _ in range(7)], array("i"), [0] * 7
     query = (query or "").strip()
-    selected_genre = (selected_genre or "").strip().lower()
-    min_score = int(min_score or 0)
-    only_today = bool(only_today)
-    today_weekday = int(today_weekday)
-
-    if _native is None:
-        return _filter_entries_advanced_python(
-            entries, query, selected_genre, min_score, only_today, today_weekday
-        )
+    if query:
+        rows = table.search_index.restrict(rows, query)
+    if not isinstance(rows, array):
+        rows = array("i", rows)
+    args = (rows, genre_mask or 0, int(min_score or 0), bool(only_today), int(today_weekday), sort_field, bool(descending))
+
+    snapshot = table.snapshot
+    if _native is None or not hasattr(_native, "filter_sort_buckets") or snapshot is None:
+        return _filter_sort_buckets_python(table, *args)
 
     try:
-        indices = _native.filter_advanced_indices(
-            entries,
-            query,
-            selected_genre,
-            min_score,
-            1 if only_today else 0,
-            today_weekday,
+        days, combined, counts = _native.filter_sort_buckets(
+            rows,
+            snapshot.weekday,
+            snapshot.score,
+            snapshot.genre_mask,
+            None if sort_field is None else snapshot.sort_key(sort_field),
+            genre_mask or 0,
+            int(min_score or 0),
+            bool(only_today),
+            int(today_weekday),
+            bool(descending),
         )
     except Exception:
-        return _filter_entries_advanced_python(
-            entries, query, selected_genre, min_score, only_today, today_weekday
-        )
-
-    return [entries[i] for i in indices]
+        return _filter_sort_buckets_python(table, *args)
+    return list(days), combined, counts
 
 
-def _filter_entries_advanced_python(
-    entries: list[dict[str, Any]],
-    query: str,
-    selected_genre: str,
+def _filter_sort_buckets_python(
+    table: EntryTable,
+    rows,
+    genre_mask: int,
     min_score: int,
     only_today: bool,
     today_weekday: int,
-) -> list[dict[str, Any]]:
-    filtered = entries
+    sort_field: Optional[str],
+    descending: bool,
+) -> tuple[list[Sequence[int]], Sequence[int], list[int]]:
+    weekday = table.weekday
+    if only_today:
+        combined = [row for row in rows if weekday[row] == today_weekday]
+    else:
+        combined = [row for row in rows if 0 <= weekday[row] < 7]
+    if genre_mask:
+        masks = table.genre_mask
+        combined = [row for row in combined if masks[row] & genre_mask]
+    if min_score > 0:
+        scores = table.score
+        combined = [row for row in combined if scores[row] >= min_score]
+    if sort_field is not None:
+        combined = sorted(combined, key=table.sort_column(sort_field).__getitem__, reverse=descending)
+    days = [array("i") for _ in range(7)]
+    for row in combined:
+        days[weekday[row]].append(row)
+    return days, array("i", combined), [len(day) for day in days]
 
-    if query:
-        filtered = [entry for entry in filtered if query in entry.get("_search_blob", "")]
 
-    if selected_genre and selected_genre != "all genres":
-        filtered = [
-            entry
-            for entry in filtered
-            if any((g or "").lower() == selected_genre for g in entry.get("media", {}).get("genres", []))
-        ]
+def sort_rows_by_key(rows: Sequence[int], keys: Sequence[Any], descending: bool = False) -> list[int]:
+    """Stable sort of ``rows`` by ``keys[row]``; returns the permuted row numbers.
 
-    if min_score > 0:
-        filtered = [
-            entry
-            for entry in filtered
-            if (entry.get("media", {}).get("averageScore") or 0) >= min_score
-        ]
+    ``keys`` is a numeric ``array`` column ('q', 'i' or 'd'); the native kernel
+    compares them as doubles, which is exact for timestamps, ranks and scores.
+    Equal keys keep their input order in both directions, like ``list.sort``.
+    """
+    if len(rows) < 2:
+        return list(rows)
 
-    if only_today:
-        filtered = [entry for entry in filtered if int(entry.get("calendar_day", -1)) == today_weekday]
+    if _native is None or not hasattr(_native, "sort_indices_by_key") or not isinstance(keys, array):
+        return sorted(rows, key=keys.__getitem__, reverse=descending)
+
+    try:
+        row_buffer = rows if isinstance(rows, array) and rows.typecode == "i" else array("i", rows)
+        return _native.sort_indices_by_key(row_buffer, keys, bool(descending))
+    except Exception:
+        return sorted(rows, key=keys.__getitem__, reverse=descending)
+
+
+FUZZY_FIELD_SEPARATOR = "\x1f"
+FUZZY_MAX_QUERY = 32
 
-    return filtered
+
+def fuzzy_max_errors(query_len: int) -> int:
+    """Typos tolerated for a query: none up to 3 characters, then 1, then 2."""
+    if query_len <= 3 or query_len > FUZZY_MAX_QUERY:
+        return 0
+    return 1 if query_len <= 6 else 2
+
+
+def fuzzy_rank(texts: list[str], query: str, limit: int = 0) -> list[tuple[int, int]]:
+    """Rank ``texts`` (fields joined by ``FUZZY_FIELD_SEPARATOR``) against ``query``.
+
+    Returns ``(row, score)`` pairs, best first. Per field, a substring hit
+    scores highest (earlier and word-start hits first), then an in-order
+    subsequence (tighter first), then an approximate substring within
+    ``fuzzy_max_errors`` edits. Rows that match nothing are omitted.
+    """
+    query = (query or "").strip().lower()
+    if not query or not texts:
+        return []
+
+    if _native is None or not hasattr(_native, "fuzzy_rank_indices"):
+        return _fuzzy_rank_python(texts, query, limit)
+
+    try:
+        return _native.fuzzy_rank_indices(texts, query, int(limit or 0))
+    except Exception:
+        return _fuzzy_rank_python(texts, query, limit)
+
+
+def _approx_substring_distance(text: str, query: str) -> int:
+    previous = list(range(len(query) + 1))
+    best = len(query)
+    for char in text:
+        current = [0]
+        for i, query_char in enumerate(query, 1):
+            current.append(min(previous[i] + 1, current[i - 1] + 1, previous[i - 1] + (query_char != char)))
+        if current[-1] < best:
+            best = current[-1]
+        previous = current
+    return best
+
+
+def _fuzzy_score_field(text: str, query: str, max_errors: int, query_bigrams: set[str]) -> int:
+    if not text:
+        return 0
+    offset = text.find(query)
+    if offset >= 0:
+        score = 1000 - min(offset, 100)
+        if offset == 0 or text[offset - 1] == " ":
+            score += 50
+        return score
+
+    first = last = -1
+    matched = 0
+    for pos, char in enumerate(text):
+        if char == query[matched]:
+            if matched == 0:
+                first = pos
+            last = pos
+            matched += 1
+            if matched == len(query):
+                return 600 - min((last - first + 1) - len(query), 300)
+
+    if max_errors > 0:
+        # q-gram lemma: each edit destroys at most two query bigrams.
+        shared = sum(1 for gram in query_bigrams if gram in text)
+        if shared < len(query_bigrams) - 2 * max_errors:
+            return 0
+        distance = _approx_substring_distance(text, query)
+        if distance <= max_errors:
+            return 400 - 100 * distance
+    return 0
+
+
+def _fuzzy_rank_python(texts: list[str], query: str, limit: int = 0) -> list[tuple[int, int]]:
+    max_errors = fuzzy_max_errors(len(query))
+    query_bigrams = {query[i:i + 2] for i in range(len(query) - 1)}
+    ranked = []
+    for row, text in enumerate(texts):
+        best = 0
+        for field in (text or "").split(FUZZY_FIELD_SEPARATOR):
+            score = _fuzzy_score_field(field, query, max_errors, query_bigrams)
+            if score > best:
+                best = score
+        if best > 0:
+            ranked.append((row, best))
+    ranked.sort(key=lambda pair: (-pair[1], pair[0]))
+    if limit and limit > 0:
+        ranked = ranked[:limit]
+    return ranked
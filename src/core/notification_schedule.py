@@ -0,0 +1,129 @@
+"""Deadline scheduling for upcoming-episode notifications.
+
+Each (episode, lead time) pair gets a fire time ``airingAt - lead``; the
+pairs live in a ``DeadlineQueue`` so the controller only arms one timer for
+the earliest fire time. Syncs update the queue incrementally: unchanged
+pairs keep their heap items, vanished episodes are discarded.
+
+A timer can fire late (system suspend, coarse timers). Alerts whose episode
+aired at most ``late_grace_sec`` ago are still delivered instead of being
+dropped; older ones are discarded silently.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Iterable
+
+from core.deadline_queue import DeadlineQueue
+
+
+@dataclass(frozen=True)
+class EpisodeAlert:
+    media_id: int
+    episode: int
+    airing_at: int
+    lead_minutes: int
+
+    @property
+    def fire_at(self) -> int:
+        return self.airing_at - self.lead_minutes * 60
+
+    @property
+    def episode_key(self) -> tuple[int, int, int]:
+        return (self.media_id, self.episode, self.airing_at)
+
+
+class NotificationSchedule:
+    """Pending alerts plus a bounded memory of the alerts already shown."""
+
+    DEFAULT_MAX_REMEMBERED = 512
+
+    def __init__(self, max_remembered: int = DEFAULT_MAX_REMEMBERED, late_grace_sec: float = 0.0):
+        self._queue = DeadlineQueue()
+        self._pending: set[EpisodeAlert] = set()
+        # Insertion-ordered so the oldest alerts are forgotten first.
+        self._sent: OrderedDict[EpisodeAlert, None] = OrderedDict()
+        self._max_remembered = max(1, int(max_remembered))
+        self._late_grace_sec = max(0.0, float(late_grace_sec))
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def clear(self, forget_sent: bool = False):
+        self._queue.clear()
+        self._pending.clear()
+        if forget_sent:
+            self._sent.clear()
+
+    def was_sent(self, alert: EpisodeAlert) -> bool:
+        return alert in self._sent
+
+    def _remember(self, alert: EpisodeAlert):
+        self._sent[alert] = None
+        self._sent.move_to_end(alert)
+        while len(self._sent) > self._max_remembered:
+            self._sent.popitem(last=False)
+
+    def update(
+        self,
+        episodes: Iterable[tuple[int, int, int]],
+        lead_minutes: Iterable[int],
+        now_ts: float,
+    ):
+        """Sync pending alerts with ``(media_id, episode, airing_at)`` tuples.
+
+        Only the closest lead whose fire time already passed is kept for an
+        episode (the earlier ones are obsolete); future leads are all kept.
+        Episodes that already aired keep only the alerts still pending, within
+        the late grace period; they never gain new ones.
+        """
+        leads = sorted({max(1, int(lead)) for lead in lead_minutes})
+        wanted: set[EpisodeAlert] = set()
+        for media_id, episode, airing_at in episodes:
+            if media_id < 0 or episode <= 0 or airing_at <= now_ts - self._late_grace_sec:
+                continue
+            aired = airing_at <= now_ts
+            passed_taken = False
+            for lead in leads:
+                alert = EpisodeAlert(media_id, episode, airing_at, lead)
+                if aired:
+                    if alert in self._pending:
+                        wanted.add(alert)
+                    continue
+                if alert.fire_at <= now_ts:
+                    if passed_taken:
+                        continue
+                    passed_taken = True
+                if alert not in self._sent:
+                    wanted.add(alert)
+
+        for alert in self._pending - wanted:
+            self._queue.discard(alert)
+        for alert in wanted - self._pending:
+            self._queue.schedule(alert, alert.fire_at)
+        self._pending = wanted
+
+    def next_deadline(self):
+        return self._queue.next_deadline()
+
+    def pop_due(self, now_ts: float, coalesce_sec: float = 0.0) -> list[EpisodeAlert]:
+        """Alerts due by ``now_ts + coalesce_sec``, one per episode, marked as sent.
+
+        Alerts that would fire within the coalescing window are delivered in
+        the same batch; lead times of an episode collapse to the closest one.
+        Alerts of episodes that aired more than ``late_grace_sec`` ago are
+        dropped.
+        """
+        due = self._queue.pop_due(now_ts + max(0.0, coalesce_sec))
+        by_episode: dict[tuple[int, int, int], EpisodeAlert] = {}
+        for alert in due:
+            self._pending.discard(alert)
+            self._remember(alert)
+            if alert.airing_at <= now_ts - self._late_grace_sec:
+                continue
+            current = by_episode.get(alert.episode_key)
+            if current is None or alert.lead_minutes < current.lead_minutes:
+                by_episode[alert.episode_key] = alert
+        return sorted(by_episode.values(), key=lambda alert: (alert.airing_at, alert.media_id))
@@ -0,0 +1,97 @@
+"""Trigram inverted index over the ``_search_blob`` column.
+
+Every substring match of a query with at least ``GRAM`` characters contains
+all of the query's trigrams, so intersecting their posting lists yields a
+small candidate set that only needs one substring check per row. Shorter
+queries fall back to a scan.
+
+Results are refined incrementally: when the new query contains the previous
+one (typing extends it), the new matches are a subset of the old ones, so
+only the previous matches are re-checked.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Optional, Sequence
+
+
+GRAM = 3
+
+
+def query_grams(query: str) -> set[str]:
+    return {query[i:i + GRAM] for i in range(len(query) - GRAM + 1)}
+
+
+class SearchIndex:
+    """Posting lists (sorted row numbers) keyed by trigram."""
+
+    __slots__ = ("_blobs", "_postings", "_last_query", "_last_matches", "_last_match_set")
+
+    def __init__(self, blobs: Sequence[str]):
+        self._blobs = blobs
+        postings: dict[str, array] = {}
+        for row, blob in enumerate(blobs):
+            for gram in query_grams(blob):
+                posting = postings.get(gram)
+                if posting is None:
+                    posting = postings[gram] = array("i")
+                posting.append(row)
+        self._postings = postings
+        self._last_query = ""
+        self._last_matches: Optional[list[int]] = None
+        self._last_match_set: Optional[set[int]] = None
+
+    def __len__(self) -> int:
+        return len(self._blobs)
+
+    def candidates(self, query: str) -> Optional[list[int]]:
+        """Rows that contain every trigram of ``query``; ``None`` if too short to narrow."""
+        grams = query_grams(query)
+        if not grams:
+            return None
+        postings = []
+        for gram in grams:
+            posting = self._postings.get(gram)
+            if posting is None:
+                return []
+            postings.append(posting)
+        postings.sort(key=len)
+        rows = set(postings[0])
+        for posting in postings[1:]:
+            rows.intersection_update(posting)
+            if not rows:
+                return []
+        return sorted(rows)
+
+    def search(self, query: str) -> Optional[list[int]]:
+        """Sorted rows whose blob contains ``query``; ``None`` means "all rows"."""
+        if not query:
+            return None
+        last_query = self._last_query
+        if query == last_query and self._last_matches is not None:
+            return self._last_matches
+        if self._last_matches is not None and last_query and last_query in query:
+            base = self._last_matches
+        else:
+            base = self.candidates(query)
+            if base is None:
+                base = range(len(self._blobs))
+        blobs = self._blobs
+        matches = [row for row in base if query in blobs[row]]
+        self._last_query = query
+        self._last_matches = matches
+        self._last_match_set = None
+        return matches
+
+    def restrict(self, rows: Sequence[int], query: str) -> list[int]:
+        """Keep the rows (in their order) whose blob contains ``query``."""
+        matches = self.search(query)
+        if matches is None:
+            return list(rows)
+        if len(matches) == len(self._blobs):
+            return list(rows)
+        if self._last_match_set is None:
+            self._last_match_set = set(matches)
+        match_set = self._last_match_set
+        return [row for row in rows if row in match_set]
@@ -0,0 +1,287 @@
+"""Prioritized, cancellable dispatch of ``Worker`` jobs onto a thread pool.
+
+``QThreadPool`` runs whatever was started first, so a slow background sync,
+an update check and cover downloads all compete with the sync the user is
+waiting for. The scheduler keeps its own queue ordered by ``TaskPriority``
+and only hands the pool as many workers as it has threads, so a waiting
+user-visible sync is always next. Low-priority tasks never take the last
+free thread.
+
+Tasks may carry a key: starting a task whose key is already queued or
+running reuses that task and forwards its signals to the new worker
+instead of doing the work twice. A task that has already emitted its result
+or error is never reused, since the new worker would not hear from it.
+
+A deadline bounds the time a task waits in the queue; a task still queued
+past it is reported as ``TaskTimeout`` and never runs. Every dispatch (on
+start, cancel and task completion) sweeps the whole queue for overdue
+tasks, so a low-priority task stuck behind others is reported at the next
+scheduler event rather than only when it reaches the head of the queue.
+Once started, a task always runs to completion or cancellation.
+"""
+
+import heapq
+import itertools
+import logging
+import time
+from collections import deque
+from enum import IntEnum
+from typing import Optional
+
+from PySide6.QtCore import QObject, Signal, Slot
+
+from core.worker import CancellationToken, TaskTimeout, Worker
+
+
+logger = logging.getLogger("airingdeck.scheduler")
+
+
+class TaskPriority(IntEnum):
+    """Lower values run first."""
+
+    USER_SYNC = 0
+    BACKGROUND_SYNC = 1
+    UPDATE_CHECK = 2
+    PREFETCH = 3
+
+
+class ScheduledTask:
+    """Handle returned by ``TaskScheduler.start``."""
+
+    __slots__ = ("worker", "priority", "key", "token", "submitted_at", "started_at", "followers")
+
+    def __init__(self, worker: Worker, priority: TaskPriority, key: Optional[str]):
+        self.worker = worker
+        self.priority = TaskPriority(priority)
+        self.key = key
+        self.token: CancellationToken = worker.token
+        self.submitted_at = time.monotonic()
+        self.started_at: Optional[float] = None
+        # Coalesced workers; kept alive until this task's signals have been delivered.
+        self.followers: list[Worker] = []
+
+    @property
+    def running(self) -> bool:
+        return self.started_at is not None
+
+    def cancel(self):
+        self.token.cancel()
+
+
+class _SchedulerLane:
+    """Pool-shaped adapter that starts every worker at one priority."""
+
+    def __init__(self, scheduler: "TaskScheduler", priority: TaskPriority):
+        self._scheduler = scheduler
+        self._priority = priority
+
+    def maxThreadCount(self) -> int:
+        return self._scheduler.max_concurrent
+
+    def start(self, worker: Worker):
+        self._scheduler.start(worker, self._priority)
+
+
+class TaskScheduler(QObject):
+    """Priority queue in front of a ``QThreadPool``-like ``start(worker)`` pool."""
+
+    statsChanged = Signal()
+
+    RUN_TIME_SAMPLES = 64
+
+    def __init__(self, pool, max_concurrent: Optional[int] = None, parent=None):
+        super().__init__(parent)
+        self._pool = pool
+        if max_concurrent is None:
+            max_concurrent = pool.maxThreadCount()
+        self._max_concurrent = max(1, int(max_concurrent))
+        self._queue: list[tuple[int, int, ScheduledTask]] = []
+        self._sequence = itertools.count()
+        self._running: dict[CancellationToken, ScheduledTask] = {}
+        self._by_key: dict[str, ScheduledTask] = {}
+        self._dispatching = False
+        self._run_ms: deque[float] = deque(maxlen=self.RUN_TIME_SAMPLES)
+        self._wait_ms: deque[float] = deque(maxlen=self.RUN_TIME_SAMPLES)
+        self.completed = 0
+        self.cancelled = 0
+        self.coalesced = 0
+        self.timed_out = 0
+
+    @property
+    def max_concurrent(self) -> int:
+        return self._max_concurrent
+
+    @property
+    def queued(self) -> int:
+        return len(self._queue)
+
+    @property
+    def running(self) -> int:
+        return len(self._running)
+
+    def lane(self, priority: TaskPriority) -> _SchedulerLane:
+        return _SchedulerLane(self, priority)
+
+    def start(
+        self,
+        worker: Worker,
+        priority: TaskPriority,
+        key: Optional[str] = None,
+        timeout_sec: Optional[float] = None,
+    ) -> ScheduledTask:
+        """Queue ``worker``; connect its signals before calling this, as with ``QThreadPool``."""
+        if key is not None:
+            existing = self._by_key.get(key)
+            if existing is not None and not existing.token.cancelled and not existing.worker.settled:
+                self._forward_signals(existing.worker, worker)
+                existing.followers.append(worker)
+                self.coalesced += 1
+                logger.debug("Coalesced task %s into the one already %s", key, "running" if existing.running else "queued")
+                return existing
+        task = ScheduledTask(worker, priority, key)
+        if timeout_sec is not None:
+            task.token.deadline = task.submitted_at + max(0.0, float(timeout_sec))
+        if key is not None:
+            self._by_key[key] = task
+        heapq.heappush(self._queue, (int(task.priority), next(self._sequence), task))
+        self._dispatch()
+        return task
+
+    def cancel(self, key: str) -> bool:
+        task = self._by_key.get(key)
+        if task is None:
+            return False
+        task.cancel()
+        self._forget_key(task)
+        self._purge_cancelled()
+        return True
+
+    def cancel_all(self, min_priority: TaskPriority = TaskPriority.USER_SYNC):
+        """Cancel queued and running tasks at ``min_priority`` or lower."""
+        for _, _, task in self._queue:
+            if task.priority >= min_priority:
+                task.cancel()
+        for task in self._running.values():
+            if task.priority >= min_priority:
+                task.cancel()
+        for task in list(self._by_key.values()):
+            if task.token.cancelled:
+                self._forget_key(task)
+        self._purge_cancelled()
+
+    def _purge_cancelled(self):
+        kept = []
+        for entry in self._queue:
+            if entry[2].token.cancelled:
+                self._drop(entry[2])
+            else:
+                kept.append(entry)
+        heapq.heapify(kept)
+        self._queue = kept
+        self._dispatch()
+
+    @staticmethod
+    def _forward_signals(source: Worker, target: Worker):
+        source.signals.progress.connect(target.signals.progress)
+        source.signals.result.connect(target.signals.result)
+        source.signals.error.connect(target.signals.error)
+        source.signals.finished.connect(target.signals.finished)
+
+    def _forget_key(self, task: ScheduledTask):
+        if task.key is not None and self._by_key.get(task.key) is task:
+            del self._by_key[task.key]
+
+    def _slots_for(self, priority: TaskPriority) -> int:
+        # Keep one thread free for syncs whenever the pool has more than one.
+        if priority > TaskPriority.BACKGROUND_SYNC:
+            return max(1, self._max_concurrent - 1)
+        return self._max_concurrent
+
+    def _dispatch(self):
+        if self._dispatching:
+            return
+        self._dispatching = True
+        try:
+            self._expire_overdue()
+            while self._queue:
+                task = self._queue[0][2]
+                if task.token.cancelled:
+                    heapq.heappop(self._queue)
+                    self._drop(task)
+                    continue
+                if task.token.expired:
+                    heapq.heappop(self._queue)
+                    self._expire(task)
+                    continue
+                if len(self._running) >= self._slots_for(task.priority):
+                    break
+                heapq.heappop(self._queue)
+                task.started_at = time.monotonic()
+                self._wait_ms.append((task.started_at - task.submitted_at) * 1000.0)
+                self._running[task.token] = task
+                # Bound slot: queued to this object's (GUI) thread.
+                task.worker.signals.done.connect(self._on_task_done)
+                self._pool.start(task.worker)
+        finally:
+            self._dispatching = False
+        self.statsChanged.emit()
+
+    def _expire_overdue(self):
+        if not any(entry[2].token.deadline is not None for entry in self._queue):
+            return
+        kept = []
+        for entry in self._queue:
+            task = entry[2]
+            if task.token.expired and not task.token.cancelled:
+                self._expire(task)
+            else:
+                kept.append(entry)
+        if len(kept) != len(self._queue):
+            heapq.heapify(kept)
+            self._queue = kept
+
+    def _drop(self, task: ScheduledTask):
+        """A task cancelled before it ran still reports ``finished`` for cleanup handlers."""
+        self._forget_key(task)
+        self.cancelled += 1
+        task.worker.signals.finished.emit()
+
+    def _expire(self, task: ScheduledTask):
+        self._forget_key(task)
+        self.timed_out += 1
+        logger.warning("Task %s timed out after %.1fs in queue", task.key or task.priority.name, time.monotonic() - task.submitted_at)
+        exc = TaskTimeout("Task deadline exceeded before start")
+        task.worker.signals.error.emit((TaskTimeout, exc, ""))
+        task.worker.signals.finished.emit()
+
+    @Slot(object)
+    def _on_task_done(self, token):
+        task = self._running.pop(token, None)
+        if task is None:
+            return
+        self._forget_key(task)
+        self._run_ms.append((time.monotonic() - task.started_at) * 1000.0)
+        if token.cancelled:
+            self.cancelled += 1
+        else:
+            self.completed += 1
+        self._dispatch()
+
+    def stats(self) -> dict:
+        queued_by_priority = {priority.name: 0 for priority in TaskPriority}
+        for _, _, task in self._queue:
+            queued_by_priority[task.priority.name] += 1
+        run_ms = list(self._run_ms)
+        wait_ms = list(self._wait_ms)
+        return {
+            "queued": len(self._queue),
+            "running": len(self._running),
+            "queuedByPriority": queued_by_priority,
+            "completed": self.completed,
+            "cancelled": self.cancelled,
+            "coalesced": self.coalesced,
+            "timedOut": self.timed_out,
+            "avgRunMs": round(sum(run_ms) / len(run_ms), 2) if run_ms else -1,
+            "maxRunMs": round(max(run_ms), 2) if run_ms else -1,
+            "avgWaitMs": round(sum(wait_ms) / len(wait_ms), 2) if wait_ms else -1,
+        }
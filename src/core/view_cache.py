@@ -0,0 +1,48 @@
+"""Small LRU of recent filter/sort results.
+
+Users flip between a few views (sort fields, a genre, the today toggle);
+keeping the row permutations of the last few makes flipping back a lookup
+instead of a filter and sort pass.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class ViewCache:
+    """Bounded least-recently-used map with hit and miss counters."""
+
+    DEFAULT_CAPACITY = 8
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self._items: OrderedDict[Hashable, Any] = OrderedDict()
+        self._capacity = max(1, int(capacity))
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        value = self._items.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._items.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any):
+        self._items[key] = value
+        self._items.move_to_end(key)
+        while len(self._items) > self._capacity:
+            self._items.popitem(last=False)
+
+    def clear(self):
+        """Drop the entries; the counters keep accumulating for profiling."""
+        self._items.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._items), "capacity": self._capacity}
@@ -1,21 +1,82 @@
+import inspect
+import threading
+import time
 import traceback
 import logging
+from typing import Optional
 from PySide6.QtCore import QRunnable, Slot, Signal, QObject
 
 logger = logging.getLogger("airingdeck.worker")
 
+_current = threading.local()
+
+
+class TaskCancelled(Exception):
+    """Raised inside a worker whose token was cancelled; no result or error is emitted."""
+
+
+class TaskTimeout(TimeoutError):
+    """The task waited in the scheduler queue past its deadline and never ran."""
+
+
+class CancellationToken:
+    """Thread-safe cancel flag with an optional ``time.monotonic()`` start deadline.
+
+    The deadline is only checked by the scheduler before the worker starts;
+    a running worker is never timed out, so its result is never thrown away.
+    """
+
+    def __init__(self, deadline: Optional[float] = None):
+        self._event = threading.Event()
+        self.deadline = deadline
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    @property
+    def expired(self) -> bool:
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    def cancel(self):
+        self._event.set()
+
+    def raise_if_cancelled(self):
+        if self._event.is_set():
+            raise TaskCancelled()
+
+
+def current_task_cancelled() -> bool:
+    """True inside a worker whose token was cancelled; services poll this between requests."""
+    token = getattr(_current, "token", None)
+    return token is not None and token.cancelled
+
+
 class WorkerSignals(QObject):
     """ 
     Defines the signals available from a running worker thread.
+
+    ``done`` carries the worker's token and fires after ``finished``, also
+    when the run was cancelled; the task scheduler uses it for bookkeeping.
     """
     finished = Signal()
     error = Signal(tuple)
     result = Signal(object)
+    progress = Signal(object)
+    done = Signal(object)
 
 class Worker(QRunnable):
     """
     Worker thread
     Inherits from QRunnable to handle worker thread setup, signals and wrap-up.
+
+    If ``fn`` returns a generator, every yielded item is emitted through
+    ``signals.progress`` and the generator's return value becomes the result.
+
+    ``token`` is checked before ``fn`` runs, between generator items and
+    before the result is emitted: a cancelled worker emits neither ``result``
+    nor ``error``. The token's deadline is not checked here, so a worker that
+    started always delivers what it computed.
     """
 
     def __init__(self, fn, *args, **kwargs):
@@ -25,19 +86,56 @@ class Worker(QRunnable):
         self.args = args
         self.kwargs = kwargs
         self.signals = WorkerSignals()
+        self.token = CancellationToken()
+        # Set on the worker thread just before ``result`` or ``error`` is emitted.
+        self.settled = False
 
     @Slot()
     def run(self):
         """
         Initialise the runner function with passed args, kwargs.
         """
+        token = self.token
+        outer_token = getattr(_current, "token", None)
+        _current.token = token
         try:
+            token.raise_if_cancelled()
             result = self.fn(*self.args, **self.kwargs)
+            if inspect.isgenerator(result):
+                result = self._drain(result)
+            token.raise_if_cancelled()
+        except TaskCancelled:
+            logger.debug("Worker '%s' cancelled", self._fn_name())
         except Exception as exc:
-            fn_name = getattr(self.fn, "__name__", self.fn.__class__.__name__)
-            logger.error("Worker '%s' failed", fn_name, exc_info=True)
-            self.signals.error.emit((type(exc), exc, traceback.format_exc()))
+            if token.cancelled:
+                logger.debug("Worker '%s' cancelled", self._fn_name())
+            else:
+                logger.error("Worker '%s' failed", self._fn_name(), exc_info=True)
+                self.settled = True
+                self.signals.error.emit((type(exc), exc, traceback.format_exc()))
         else:
+            self.settled = True
             self.signals.result.emit(result)
         finally:
+            _current.token = outer_token
             self.signals.finished.emit()
+            self.signals.done.emit(token)
+
+    def _fn_name(self) -> str:
+        return getattr(self.fn, "__name__", self.fn.__class__.__name__)
+
+    def _drain(self, generator):
+        while True:
+            self._check_token(generator)
+            try:
+                chunk = next(generator)
+            except StopIteration as stop:
+                return stop.value
+            self.signals.progress.emit(chunk)
+
+    def _check_token(self, generator):
+        try:
+            self.token.raise_if_cancelled()
+        except Exception:
+            generator.close()
+            raise
@@ -12,6 +12,9 @@ from PySide6.QtQuickControls2 import QQuickStyle
 
 # Import controllers
 from core.app_controller import AppController
+from core.cover_provider import PROVIDER_ID, CoverImageProvider
+from services.cover_cache import CoverCache
+from services.response_cache import default_cache_dir
 from version import APP_VERSION
 
 
@@ -74,6 +77,11 @@ def main():
     try:
         controller = AppController(engine)
         engine.rootContext().setContextProperty("appController", controller)
+        # Cover art is served from the controller's disk cache (image://covers/...).
+        add_image_provider = getattr(engine, "addImageProvider", None)
+        if callable(add_image_provider):
+            cover_cache = getattr(controller, "cover_cache", None) or CoverCache(default_cache_dir() / "covers")
+            add_image_provider(PROVIDER_ID, CoverImageProvider(cover_cache))
     except Exception as e:
         QMessageBox.critical(None, "Init Error", f"Failed to initialize controller: {str(e)}")
         return -1
@@ -1,22 +1,101 @@
+import hashlib
 import os
 import logging
+import threading
 import time
-from typing import Optional, List, Dict, Any
+from typing import Callable, Optional, List, Dict, Any, Iterable, Iterator
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from services.response_cache import ResponseCache
 from version import APP_VERSION
 
 
 logger = logging.getLogger("airingdeck.anilist")
 
 
+class RequestAborted(Exception):
+    """The calling task was cancelled; raised between requests and during waits."""
+
+
 class AniListService:
     """Service per interagire con AniList GraphQL API"""
     
     API_URL = "https://graphql.anilist.co"
     DEFAULT_TIMEOUT_SEC = 10.0
     DEFAULT_MIN_INTERVAL_SEC = 2.1
+    DEFAULT_POOL_SIZE = 4
+    DEFAULT_TRANSPORT_RETRIES = 2
+    DEFAULT_PAGE_SIZE = 50
+    MAX_PAGE_SIZE = 50
+    # Follow-up pages of one list fetch sent without pacing, while AniList's
+    # X-RateLimit-Remaining stays above RATE_LIMIT_RESERVE.
+    DEFAULT_PAGE_BURST = 5
+    RATE_LIMIT_RESERVE = 10
+    DEFAULT_LIST_STATUSES = ("CURRENT", "PLANNING", "REPEATING")
+    MEDIA_LIST_FIELDS = """
+                    status
+                    progress
+                    updatedAt
+                    media {
+                        id
+                        title {
+                            romaji
+                            english
+                            native
+                        }
+                        synonyms
+                        coverImage {
+                            extraLarge
+                            large
+                            medium
+                        }
+                        nextAiringEpisode {
+                            episode
+                            airingAt
+                            timeUntilAiring
+                        }
+                        genres
+                        averageScore
+                        siteUrl
+                    }
+    """
+    LIST_PAGE_QUERY = """
+        query ($userId: Int, $statuses: [MediaListStatus], $page: Int, $perPage: Int) {
+            Page(page: $page, perPage: $perPage) {
+                pageInfo {
+                    hasNextPage
+                }
+                mediaList(userId: $userId, type: ANIME, status_in: $statuses, sort: [MEDIA_ID]) {
+%s
+                }
+            }
+        }
+    """ % MEDIA_LIST_FIELDS
+    VIEWER_QUERY = """
+    query {
+        Viewer {
+            id
+            name
+            avatar {
+                large
+                medium
+            }
+            statistics {
+                anime {
+                    count
+                    episodesWatched
+                }
+            }
+        }
+    }
+    """
+    VIEWER_CACHE_TTL_SEC = 3600.0
+    DEFAULT_LIST_CACHE_TTL_SEC = 120.0
+    # Granularity of cancellation checks while pacing or backing off.
+    ABORT_POLL_SEC = 0.1
     
     def __init__(self):
         self._token: Optional[str] = None
@@ -28,15 +107,44 @@ class AniListService:
             0.0,
             self._env_float("AIRINGDECK_ANILIST_MIN_INTERVAL_SEC", self.DEFAULT_MIN_INTERVAL_SEC),
         )
+        self._pool_size = max(
+            1,
+            int(self._env_float("AIRINGDECK_ANILIST_POOL_SIZE", self.DEFAULT_POOL_SIZE)),
+        )
+        self._transport_retries = max(
+            0,
+            int(self._env_float("AIRINGDECK_ANILIST_TRANSPORT_RETRIES", self.DEFAULT_TRANSPORT_RETRIES)),
+        )
+        self._page_size = min(
+            self.MAX_PAGE_SIZE,
+            max(1, int(self._env_float("AIRINGDECK_ANILIST_PAGE_SIZE", self.DEFAULT_PAGE_SIZE))),
+        )
+        self._page_burst = max(
+            0,
+            int(self._env_float("AIRINGDECK_ANILIST_PAGE_BURST", self.DEFAULT_PAGE_BURST)),
+        )
+        self._list_cache_ttl = max(
+            0.0,
+            self._env_float("AIRINGDECK_ANILIST_CACHE_TTL_SEC", self.DEFAULT_LIST_CACHE_TTL_SEC),
+        )
+        self._response_cache: Optional[ResponseCache] = None
+        self._cache_namespace = ""
+        self._session: Optional[requests.Session] = None
+        self._session_lock = threading.Lock()
         self._last_request_monotonic = 0.0
+        self._burst_left = 0
+        self._rate_limit_remaining: Optional[int] = None
+        self._cancel_check: Callable[[], bool] = lambda: False
         self._user_agent = os.getenv(
             "AIRINGDECK_USER_AGENT",
             f"AiringDeck/{APP_VERSION} (+https://github.com/Pankyop/AiringDeck)",
         )
         logger.info(
-            "AniList client configured (timeout=%.1fs, min_interval=%.2fs)",
+            "AniList client configured (timeout=%.1fs, min_interval=%.2fs, pool=%d, transport_retries=%d)",
             self._request_timeout,
             self._min_request_interval,
+            self._pool_size,
+            self._transport_retries,
         )
 
     @staticmethod
@@ -52,20 +160,121 @@ class AniListService:
     def set_token(self, token: str):
         """Imposta access token"""
         self._token = token
+        # Scope cached responses to the account so tokens never share entries.
+        self._cache_namespace = hashlib.sha256(token.encode("utf-8")).hexdigest()[:16] if token else ""
+
+    def set_response_cache(self, cache: Optional[ResponseCache]):
+        """Attach (or detach with ``None``) the on-disk GraphQL response cache."""
+        self._response_cache = cache
+
+    def clear_response_cache(self):
+        if self._response_cache is not None:
+            self._response_cache.purge()
+
+    def _cache_ttl_for(self, query: str) -> float:
+        if query == self.VIEWER_QUERY:
+            return self.VIEWER_CACHE_TTL_SEC
+        if query == self.LIST_PAGE_QUERY:
+            return self._list_cache_ttl
+        return 0.0
+
+    def _read_cached(self, query: str, variables: Optional[Dict] = None) -> Optional[Dict[str, Any]]:
+        """Return a cached response even if stale; ``None`` on miss or without a cache."""
+        if self._response_cache is None or not self._cache_namespace:
+            return None
+        hit = self._response_cache.get(
+            ResponseCache.make_key(query, variables, self._cache_namespace),
+            allow_stale=True,
+        )
+        return hit.payload if hit is not None else None
+
+    def _build_session(self) -> requests.Session:
+        """Create a keep-alive session with a bounded connection pool.
+
+        Transport retries only cover connection setup failures; HTTP status
+        handling (429/5xx) stays in ``_query`` so pacing rules still apply.
+        """
+        retry = Retry(
+            total=self._transport_retries,
+            connect=self._transport_retries,
+            read=0,
+            status=0,
+            redirect=0,
+            backoff_factor=0.25,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=self._pool_size,
+            max_retries=retry,
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.headers.update({
+            'Accept': 'application/json',
+            'Connection': 'keep-alive',
+            'User-Agent': self._user_agent,
+        })
+        return session
+
+    def _get_session(self) -> requests.Session:
+        with self._session_lock:
+            if self._session is None:
+                self._session = self._build_session()
+            return self._session
+
+    def close(self):
+        """Close pooled connections; a new session is created on the next query."""
+        with self._session_lock:
+            session = self._session
+            self._session = None
+        if session is not None:
+            session.close()
+
+    def set_cancel_check(self, check: Optional[Callable[[], bool]]):
+        """Install a predicate polled on the calling thread before each request and during waits.
+
+        When it returns True the current query raises ``RequestAborted``: no
+        further pages, retries or rate-limit waits run for a superseded sync.
+        A request already on the wire finishes (or times out) first.
+        """
+        self._cancel_check = check or (lambda: False)
+
+    def _raise_if_aborted(self):
+        if self._cancel_check():
+            raise RequestAborted("RequestAborted: superseded by a newer request")
+
+    def _sleep(self, seconds: float):
+        deadline = time.monotonic() + seconds
+        while True:
+            self._raise_if_aborted()
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            time.sleep(min(self.ABORT_POLL_SEC, remaining))
 
     def _sleep_backoff(self, attempt_index: int):
         """Small linear backoff between transient retries."""
-        time.sleep(1 * (attempt_index + 1))
+        self._sleep(1 * (attempt_index + 1))
 
     def _wait_for_request_slot(self):
-        """Apply conservative pacing to stay below AniList rate limits."""
+        """Apply conservative pacing to stay below AniList rate limits.
+
+        Inside a page burst (see ``iter_watching_anime_pages``) the wait is
+        skipped while the last response reported enough remaining requests.
+        """
         if self._min_request_interval <= 0:
             return
+        if self._burst_left > 0 and (
+            self._rate_limit_remaining is None or self._rate_limit_remaining > self.RATE_LIMIT_RESERVE
+        ):
+            self._burst_left -= 1
+            return
         now = time.monotonic()
         elapsed = now - self._last_request_monotonic
         wait_time = self._min_request_interval - elapsed
         if wait_time > 0:
-            time.sleep(wait_time)
+            self._sleep(wait_time)
 
     @staticmethod
     def _header_int(headers: Any, key: str) -> Optional[int]:
@@ -97,11 +306,22 @@ class AniListService:
         return 5.0
     
     def _query(self, query: str, variables: Optional[Dict] = None, retries: int = 3) -> Dict[str, Any]:
-        """Esegui query GraphQL con retry su errori transienti e timeout."""
+        """Esegui query GraphQL con retry su errori transienti e timeout.
+
+        Always goes to the network. Cacheable responses are written through
+        to the response cache, which only the cold-start ``get_cached_*``
+        helpers read, so a sync never mixes cached and fresh pages.
+        """
         if not self._token:
             raise Exception("Not authenticated")
         retries = max(1, int(retries))
 
+        cache = self._response_cache
+        cache_ttl = self._cache_ttl_for(query) if cache is not None else 0.0
+        cache_key = ""
+        if cache_ttl > 0:
+            cache_key = ResponseCache.make_key(query, variables, self._cache_namespace)
+
         headers = {
             'Authorization': f'Bearer {self._token}',
             'Content-Type': 'application/json',
@@ -111,15 +331,19 @@ class AniListService:
         
         last_error = None
         for attempt in range(retries):
+            self._raise_if_aborted()
             try:
                 self._wait_for_request_slot()
                 self._last_request_monotonic = time.monotonic()
-                response = requests.post(
+                response = self._get_session().post(
                     self.API_URL,
                     json={'query': query, 'variables': variables or {}},
                     headers=headers,
                     timeout=self._request_timeout,
                 )
+                self._rate_limit_remaining = self._header_int(
+                    getattr(response, "headers", None), "X-RateLimit-Remaining"
+                )
                 response.raise_for_status()
                 data = response.json()
                 if not isinstance(data, dict):
@@ -131,7 +355,10 @@ class AniListService:
                         raise Exception("HTTP429: Rate limit exceeded")
                     raise Exception(message)
 
-                return data.get('data', {})
+                payload = data.get('data', {})
+                if cache_key:
+                    cache.put(cache_key, payload, cache_ttl)
+                return payload
             except ValueError:
                 last_error = Exception("InvalidResponse: AniList returned invalid JSON")
                 logger.warning("API attempt %d/%d failed: invalid JSON payload", attempt + 1, retries)
@@ -155,7 +382,7 @@ class AniListService:
                         wait_seconds,
                     )
                     if attempt < retries - 1:
-                        time.sleep(wait_seconds)
+                        self._sleep(wait_seconds)
                         continue
                 elif code is not None and code >= 500:
                     last_error = Exception(f"HTTP{code}: AniList request failed")
@@ -176,68 +403,190 @@ class AniListService:
     
     def get_viewer_info(self) -> Dict[str, Any]:
         """Ottieni informazioni utente corrente"""
-        query = """
-        query {
-            Viewer {
-                id
-                name
-                avatar {
-                    large
-                    medium
-                }
-                statistics {
-                    anime {
-                        count
-                        episodesWatched
-                    }
-                }
-            }
-        }
-        """
-        
-        data = self._query(query)
+        data = self._query(self.VIEWER_QUERY)
         return data['Viewer']
+
+    def get_cached_viewer_info(self) -> Optional[Dict[str, Any]]:
+        """Last cached Viewer payload (possibly stale), without network access."""
+        data = self._read_cached(self.VIEWER_QUERY)
+        return (data or {}).get('Viewer')
+
     
     def get_watching_anime(self, user_id: int) -> List[Dict[str, Any]]:
         """Ottieni lista anime "Watching" dell'utente"""
+        entries: List[Dict[str, Any]] = []
+        for page in self.iter_watching_anime_pages(user_id):
+            entries.extend(page)
+        return entries
+
+    def get_cached_watching_anime(self, user_id: int) -> Optional[List[Dict[str, Any]]]:
+        """Rebuild the list from cached pages; ``None`` unless every page is cached."""
+        status_list = list(self.DEFAULT_LIST_STATUSES)
+        entries: List[Dict[str, Any]] = []
+        page_number = 1
+        while True:
+            data = self._read_cached(self.LIST_PAGE_QUERY, {
+                'userId': user_id,
+                'statuses': status_list,
+                'page': page_number,
+                'perPage': self._page_size,
+            })
+            if data is None:
+                return None
+            page_data = data.get('Page') or {}
+            chunk = page_data.get('mediaList') or []
+            entries.extend(chunk)
+            if not chunk or not (page_data.get('pageInfo') or {}).get('hasNextPage'):
+                return entries
+            page_number += 1
+
+    def iter_watching_anime_pages(
+        self,
+        user_id: int,
+        statuses: Optional[Iterable[str]] = None,
+        per_page: Optional[int] = None,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Yield MediaList entries page by page; return the full list when exhausted.
+
+        With the default 2.1 s pacing every page would cost ~2 s, about 42 s
+        per 1000 entries. The first ``DEFAULT_PAGE_BURST`` follow-up pages are
+        therefore sent back to back, within AniList's burst allowance and only
+        while the rate-limit headers leave headroom; later pages are paced as
+        usual, so long lists still stay under the per-minute limit.
+        """
+        query = self.LIST_PAGE_QUERY
+        status_list = list(statuses or self.DEFAULT_LIST_STATUSES)
+        page_size = self._page_size if per_page is None else min(self.MAX_PAGE_SIZE, max(1, int(per_page)))
+
+        entries: List[Dict[str, Any]] = []
+        page_number = 1
+        try:
+            while True:
+                data = self._query(query, {
+                    'userId': user_id,
+                    'statuses': status_list,
+                    'page': page_number,
+                    'perPage': page_size,
+                })
+                if page_number == 1:
+                    self._burst_left = self._page_burst
+                page_data = data.get('Page') or {}
+                chunk = page_data.get('mediaList') or []
+                if not chunk:
+                    break
+                entries.extend(chunk)
+                yield chunk
+                if not (page_data.get('pageInfo') or {}).get('hasNextPage'):
+                    break
+                page_number += 1
+        finally:
+            self._burst_left = 0
+        return entries
+
+    def get_watching_anime_delta(
+        self,
+        user_id: int,
+        updated_since: int,
+        stale_media_ids: Iterable[int] = (),
+        statuses: Optional[Iterable[str]] = None,
+    ) -> Dict[str, Any]:
+        """Fetch only list entries updated at or after ``updated_since``.
+
+        Returns ``changed`` entries, the full set of ``media_ids`` still on the
+        list (to detect removals) and refreshed ``airing`` data for media whose
+        next episode already aired, since airing schedules move without touching
+        the user's ``MediaList.updatedAt``.
+        """
+        status_list = list(statuses or self.DEFAULT_LIST_STATUSES)
+        changed_query = """
+        query ($userId: Int, $statuses: [MediaListStatus], $page: Int, $perPage: Int) {
+            Page(page: $page, perPage: $perPage) {
+                pageInfo {
+                    hasNextPage
+                }
+                mediaList(userId: $userId, type: ANIME, status_in: $statuses, sort: [UPDATED_TIME_DESC]) {
+%s
+                }
+            }
+        }
+        """ % self.MEDIA_LIST_FIELDS
+
+        changed: List[Dict[str, Any]] = []
+        page_number = 1
+        while True:
+            data = self._query(changed_query, {
+                'userId': user_id,
+                'statuses': status_list,
+                'page': page_number,
+                'perPage': self._page_size,
+            })
+            page_data = data.get('Page') or {}
+            chunk = page_data.get('mediaList') or []
+            # Inclusive: edits in the watermark's second may not have been seen yet;
+            # re-sending an already merged entry is harmless.
+            fresh = [entry for entry in chunk if int(entry.get('updatedAt') or 0) >= updated_since]
+            changed.extend(fresh)
+            if len(fresh) < len(chunk) or not chunk:
+                break
+            if not (page_data.get('pageInfo') or {}).get('hasNextPage'):
+                break
+            page_number += 1
+
+        return {
+            'changed': changed,
+            'media_ids': self.get_watching_media_ids(user_id, status_list),
+            'airing': self.get_next_airing_episodes(stale_media_ids),
+        }
+
+    def get_watching_media_ids(self, user_id: int, statuses: Optional[Iterable[str]] = None) -> List[int]:
+        """Id-only list query, cheap enough to run on every delta sync."""
         query = """
-        query ($userId: Int, $status: MediaListStatus) {
-            MediaListCollection(userId: $userId, type: ANIME, status: $status) {
+        query ($userId: Int, $statuses: [MediaListStatus]) {
+            MediaListCollection(userId: $userId, type: ANIME, status_in: $statuses) {
                 lists {
                     entries {
-                        media {
-                            id
-                            title {
-                                romaji
-                                english
-                                native
-                            }
-                            coverImage {
-                                extraLarge
-                                large
-                                medium
-                            }
-                            nextAiringEpisode {
-                                episode
-                                airingAt
-                                timeUntilAiring
-                            }
-                            genres
-                            averageScore
-                            siteUrl
-                        }
-                        progress
+                        mediaId
                     }
                 }
             }
         }
         """
-        
         data = self._query(query, {
             'userId': user_id,
-            'status': 'CURRENT'
+            'statuses': list(statuses or self.DEFAULT_LIST_STATUSES),
         })
-        
-        if data['MediaListCollection']['lists']:
-            return data['MediaListCollection']['lists'][0]['entries']
-        return []
+        lists = (data.get('MediaListCollection') or {}).get('lists') or []
+        return [
+            int(entry['mediaId'])
+            for group in lists
+            for entry in (group.get('entries') or [])
+            if entry.get('mediaId') is not None
+        ]
+
+    def get_next_airing_episodes(self, media_ids: Iterable[int]) -> Dict[int, Optional[Dict[str, Any]]]:
+        """Return ``{media_id: nextAiringEpisode}`` for the given media."""
+        ids = sorted({int(media_id) for media_id in media_ids})
+        if not ids:
+            return {}
+        query = """
+        query ($ids: [Int], $perPage: Int) {
+            Page(page: 1, perPage: $perPage) {
+                media(id_in: $ids, type: ANIME) {
+                    id
+                    nextAiringEpisode {
+                        episode
+                        airingAt
+                        timeUntilAiring
+                    }
+                }
+            }
+        }
+        """
+        airing: Dict[int, Optional[Dict[str, Any]]] = {}
+        for start in range(0, len(ids), self.MAX_PAGE_SIZE):
+            batch = ids[start:start + self.MAX_PAGE_SIZE]
+            data = self._query(query, {'ids': batch, 'perPage': len(batch)})
+            for media in (data.get('Page') or {}).get('media') or []:
+                if media.get('id') is not None:
+                    airing[int(media['id'])] = media.get('nextAiringEpisode')
+        return airing
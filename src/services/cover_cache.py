@@ -0,0 +1,177 @@
+import hashlib
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+import requests
+
+
+logger = logging.getLogger("airingdeck.covers")
+
+
+class CoverCache:
+    """Content-addressed on-disk store for cover art and its thumbnails.
+
+    Files are named by the SHA-256 of the image URL (AniList never reuses a
+    cover URL for different content) plus a variant: ``""`` is the original
+    download, other variants are downscaled thumbnails. The directory is
+    bounded by ``max_bytes`` with least-recently-used eviction, using file
+    mtimes (refreshed on every read) as the access time.
+    """
+
+    DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+    DEFAULT_TIMEOUT_SEC = 15.0
+    MAX_DOWNLOAD_BYTES = 16 * 1024 * 1024
+
+    def __init__(
+        self,
+        root: Path,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        session_factory: Optional[Callable[[], requests.Session]] = None,
+        timeout_sec: float = DEFAULT_TIMEOUT_SEC,
+    ):
+        self._root = Path(root)
+        self._max_bytes = max(1, int(max_bytes))
+        self._timeout_sec = max(1.0, float(timeout_sec))
+        self._session_factory = session_factory or requests.Session
+        self._session: Optional[requests.Session] = None
+        self._session_lock = threading.Lock()
+        self._lock = threading.Lock()
+        # path -> (size, last access); loaded from disk on first use.
+        self._index: Optional[Dict[Path, Tuple[int, float]]] = None
+        self._total_bytes = 0
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    @property
+    def total_bytes(self) -> int:
+        with self._lock:
+            self._load_index()
+            return self._total_bytes
+
+    @staticmethod
+    def make_key(url: str) -> str:
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def path_for(self, url: str, variant: str = "") -> Path:
+        key = self.make_key(url)
+        folder = variant or "originals"
+        return self._root / folder / key[:2] / key
+
+    def _load_index(self):
+        if self._index is not None:
+            return
+        index: Dict[Path, Tuple[int, float]] = {}
+        total = 0
+        if self._root.exists():
+            for path in self._root.rglob("*"):
+                if not path.is_file() or path.name.endswith(".tmp"):
+                    continue
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                index[path] = (stat.st_size, stat.st_mtime)
+                total += stat.st_size
+        self._index = index
+        self._total_bytes = total
+
+    def contains(self, url: str, variant: str = "") -> bool:
+        return self.path_for(url, variant).exists()
+
+    def load(self, url: str, variant: str = "") -> Optional[bytes]:
+        if not url:
+            return None
+        path = self.path_for(url, variant)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        now = time.time()
+        try:
+            os.utime(path, (now, now))
+        except OSError:
+            pass
+        with self._lock:
+            self._load_index()
+            if path in self._index:
+                self._index[path] = (self._index[path][0], now)
+        return data
+
+    def store(self, url: str, data: bytes, variant: str = ""):
+        if not url or not data or len(data) > self._max_bytes:
+            return
+        path = self.path_for(url, variant)
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            logger.warning("Cover cache write failed: %s", exc)
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            return
+        with self._lock:
+            self._load_index()
+            previous = self._index.get(path)
+            if previous is not None:
+                self._total_bytes -= previous[0]
+            self._index[path] = (len(data), time.time())
+            self._total_bytes += len(data)
+            self._evict_locked()
+
+    def _evict_locked(self):
+        if self._total_bytes <= self._max_bytes:
+            return
+        for path, (size, _) in sorted(self._index.items(), key=lambda item: item[1][1]):
+            if self._total_bytes <= self._max_bytes:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as exc:
+                logger.warning("Cover cache eviction failed: %s", exc)
+                continue
+            del self._index[path]
+            self._total_bytes -= size
+
+    def _get_session(self) -> requests.Session:
+        with self._session_lock:
+            if self._session is None:
+                self._session = self._session_factory()
+            return self._session
+
+    def fetch(self, url: str) -> Optional[bytes]:
+        """Original image bytes, downloaded once and served from disk afterwards."""
+        data = self.load(url)
+        if data is not None:
+            return data
+        if not url.startswith(("https://", "http://")):
+            return None
+        try:
+            response = self._get_session().get(url, timeout=self._timeout_sec)
+            response.raise_for_status()
+            data = response.content
+        except requests.exceptions.RequestException as exc:
+            logger.info("Cover download failed for %s: %s", url, exc)
+            return None
+        if not data or len(data) > self.MAX_DOWNLOAD_BYTES:
+            return None
+        self.store(url, data)
+        return data
+
+    def close(self):
+        with self._session_lock:
+            session = self._session
+            self._session = None
+        if session is not None:
+            session.close()
@@ -0,0 +1,190 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+logger = logging.getLogger("airingdeck.cache")
+
+
+def default_cache_dir() -> Path:
+    """Per-user local cache directory (``AIRINGDECK_CACHE_DIR`` overrides it)."""
+    override = os.getenv("AIRINGDECK_CACHE_DIR", "").strip()
+    if override:
+        return Path(override)
+    base = os.getenv("LOCALAPPDATA") or os.getenv("XDG_CACHE_HOME")
+    if base:
+        return Path(base) / "AiringDeck"
+    return Path.home() / ".cache" / "AiringDeck"
+
+
+@dataclass(frozen=True)
+class CacheHit:
+    payload: Any
+    fresh: bool
+    age_sec: float
+
+
+class ResponseCache:
+    """Content-addressed GraphQL response cache stored in one SQLite file.
+
+    Entries are keyed by a digest of namespace + query text + variables.
+    Reads within ``ttl`` are fresh; older reads are still served as stale
+    until ``max_stale_sec`` so the UI can render while a refresh runs.
+    The file is bounded by ``max_bytes`` using least-recently-used eviction.
+    """
+
+    DEFAULT_MAX_BYTES = 8 * 1024 * 1024
+    DEFAULT_MAX_STALE_SEC = 7 * 24 * 3600
+
+    def __init__(
+        self,
+        path: Path,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_stale_sec: float = DEFAULT_MAX_STALE_SEC,
+    ):
+        self._path = Path(path)
+        self._max_bytes = max(1, int(max_bytes))
+        self._max_stale_sec = max(0.0, float(max_stale_sec))
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @staticmethod
+    def make_key(query: str, variables: Optional[Dict[str, Any]] = None, namespace: str = "") -> str:
+        material = json.dumps(
+            [namespace, " ".join(query.split()), variables or {}],
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        directory = self._path.parent
+        if not directory.exists():
+            directory.mkdir(parents=True, exist_ok=True)
+            try:
+                os.chmod(directory, 0o700)
+            except OSError:
+                pass
+        created = not self._path.exists()
+        conn = sqlite3.connect(str(self._path), timeout=5.0)
+        if created:
+            try:
+                os.chmod(self._path, 0o600)
+            except OSError:
+                pass
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " payload BLOB NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " stored_at REAL NOT NULL,"
+            " expires_at REAL NOT NULL,"
+            " last_access REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS responses_lru ON responses(last_access)")
+        return conn
+
+    def get(self, key: str, allow_stale: bool = True) -> Optional[CacheHit]:
+        if not self._path.exists():
+            return None
+        now = time.time()
+        with self._lock:
+            try:
+                conn = self._connect()
+            except sqlite3.Error as exc:
+                logger.warning("Response cache unavailable: %s", exc)
+                return None
+            try:
+                row = conn.execute(
+                    "SELECT payload, stored_at, expires_at FROM responses WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is None:
+                    return None
+                payload_raw, stored_at, expires_at = row
+                fresh = now < expires_at
+                if now - expires_at > self._max_stale_sec:
+                    conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    conn.commit()
+                    return None
+                if not fresh and not allow_stale:
+                    return None
+                conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+                conn.commit()
+            except sqlite3.Error as exc:
+                logger.warning("Response cache read failed: %s", exc)
+                return None
+            finally:
+                conn.close()
+        try:
+            payload = json.loads(payload_raw)
+        except (TypeError, ValueError):
+            return None
+        return CacheHit(payload=payload, fresh=fresh, age_sec=max(0.0, now - stored_at))
+
+    def put(self, key: str, payload: Any, ttl_sec: float):
+        blob = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        if len(blob) > self._max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            try:
+                conn = self._connect()
+            except sqlite3.Error as exc:
+                logger.warning("Response cache unavailable: %s", exc)
+                return
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses(key, payload, size, stored_at, expires_at, last_access)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, blob, len(blob), now, now + max(0.0, float(ttl_sec)), now),
+                )
+                self._evict(conn, now)
+                conn.commit()
+            except sqlite3.Error as exc:
+                logger.warning("Response cache write failed: %s", exc)
+            finally:
+                conn.close()
+
+    def _evict(self, conn: sqlite3.Connection, now: float):
+        conn.execute("DELETE FROM responses WHERE expires_at < ?", (now - self._max_stale_sec,))
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self._max_bytes:
+            return
+        for key, size in conn.execute("SELECT key, size FROM responses ORDER BY last_access ASC").fetchall():
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            if total <= self._max_bytes:
+                break
+
+    def total_bytes(self) -> int:
+        if not self._path.exists():
+            return 0
+        with self._lock:
+            conn = self._connect()
+            try:
+                return int(conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0])
+            finally:
+                conn.close()
+
+    def purge(self):
+        """Delete every cached response together with the database file."""
+        with self._lock:
+            for suffix in ("", "-journal", "-wal", "-shm"):
+                candidate = self._path.with_name(self._path.name + suffix)
+                try:
+                    candidate.unlink()
+                except FileNotFoundError:
+                    continue
+                except OSError as exc:
+                    logger.warning("Failed to remove cache file %s: %s", candidate, exc)
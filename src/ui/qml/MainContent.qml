@@ -20,7 +20,8 @@ FocusScope {
         { label: mainContent.tr("Ordina: Uscita", "Sort: Airing"), value: "airing_time" },
         { label: mainContent.tr("Ordina: Titolo", "Sort: Title"), value: "title" },
         { label: mainContent.tr("Ordina: Progresso", "Sort: Progress"), value: "progress" },
-        { label: mainContent.tr("Ordina: Voto", "Sort: Score"), value: "score" }
+        { label: mainContent.tr("Ordina: Voto", "Sort: Score"), value: "score" },
+        { label: mainContent.tr("Ordina: Pertinenza", "Sort: Relevance"), value: "relevance" }
     ]
 
     function tr(itText, enText) {
@@ -32,7 +33,12 @@ FocusScope {
             return ""
         }
         var cover = selectedAnime.media.coverImage
-        return cover.extraLarge || cover.large || cover.medium || ""
+        return mainContent.cachedImageSource(cover.extraLarge || cover.large || cover.medium || "", "sidebar")
+    }
+
+    // Images go through the local cover cache (image://covers/<variant>/<url>).
+    function cachedImageSource(url, variant) {
+        return url ? "image://covers/" + variant + "/" + encodeURIComponent(url) : ""
     }
 
     function refreshSidebarCoverSource() {
@@ -61,6 +67,15 @@ FocusScope {
         return 0
     }
 
+    function genreOptionLabel(value) {
+        var label = mainContent.genreLabel(value)
+        var counts = appController.genreCounts
+        if (value && value !== "All genres" && counts && counts[value] !== undefined) {
+            return label + " (" + counts[value] + ")"
+        }
+        return label
+    }
+
     function genreLabel(value) {
         if (!value || value === "All genres") {
             return mainContent.tr("Tutti i generi", "All genres")
@@ -358,7 +373,7 @@ FocusScope {
 
                                     Image {
                                         anchors.fill: parent
-                                        source: appController.userAvatar
+                                        source: mainContent.cachedImageSource(appController.userAvatar, "avatar")
                                         fillMode: Image.PreserveAspectCrop
                                         asynchronous: true
                                     }
@@ -433,7 +448,7 @@ FocusScope {
                                 width: parent.width
                                 highlighted: genreCombo.highlightedIndex === index
                                 contentItem: Text {
-                                    text: mainContent.genreLabel(modelData)
+                                    text: mainContent.genreOptionLabel(modelData)
                                     color: highlighted ? "#ffffff" : "#e5e7eb"
                                     elide: Text.ElideRight
                                     verticalAlignment: Text.AlignVCenter
@@ -22,7 +22,9 @@ Item {
         if (!anime || !anime.coverImage) {
             return ""
         }
-        return anime.coverImage.extraLarge || anime.coverImage.large || anime.coverImage.medium || ""
+        var url = anime.coverImage.extraLarge || anime.coverImage.large || anime.coverImage.medium || ""
+        // Served from the local cover cache as a card-sized thumbnail.
+        return url ? "image://covers/card/" + encodeURIComponent(url) : ""
     }
     
     // Supports both model roles and direct property (for flexibility)
@@ -704,6 +704,26 @@ Dialog {
                         wrapMode: Text.WordWrap
                     }
 
+                    Text {
+                        Layout.fillWidth: true
+                        Layout.bottomMargin: 10
+                        visible: appController.devProfileMode
+                        property var stats: appController.pipelineStats
+                        text: "Filter: debounce " + stats.debounce.debounceMs + " ms"
+                              + " · p95 " + stats.debounce.p95Ms + " ms"
+                              + " · last " + stats.debounce.lastMs + " ms"
+                              + " · view cache " + stats.viewCache.hits + "/" + stats.viewCache.misses
+                              + " · refined " + stats.refined + "/" + stats.rescanned
+                              + "\nTasks: queued " + stats.scheduler.queued
+                              + " · running " + stats.scheduler.running
+                              + " · avg run " + stats.scheduler.avgRunMs + " ms"
+                              + " · avg wait " + stats.scheduler.avgWaitMs + " ms"
+                        color: "#8ea4bf"
+                        font.pixelSize: 11
+                        font.family: "monospace"
+                        wrapMode: Text.WordWrap
+                    }
+
                     Rectangle {
                         Layout.fillWidth: true
                         Layout.preferredHeight: 1
@@ -829,6 +849,9 @@ Dialog {
                         Image {
                             anchors.fill: parent
                             source: appController.userAvatar
+                                    ? "image://covers/avatar/" + encodeURIComponent(appController.userAvatar)
+                                    : ""
+                            asynchronous: true
                             fillMode: Image.PreserveAspectCrop
                         }
                     }
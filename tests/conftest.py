@@ -1,6 +1,7 @@
 import sys
 from pathlib import Path
 
+import pytest
 from PySide6.QtWidgets import QApplication
 
 
@@ -17,3 +18,10 @@ def pytest_sessionstart(session):
     global _APP
     if QApplication.instance() is None:
         _APP = QApplication([])
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache_dir(monkeypatch, tmp_path):
+    # Controllers open (and logout purges) the response cache, list snapshot
+    # and cover cache; keep them out of the developer's real cache directory.
+    monkeypatch.setenv("AIRINGDECK_CACHE_DIR", str(tmp_path))
@@ -0,0 +1,35 @@
+from core.adaptive_debounce import AdaptiveDebounce
+
+
+def test_without_samples_list_size_decides():
+    debounce = AdaptiveDebounce()
+
+    assert debounce.interval_ms(50) == 0
+    assert debounce.interval_ms(5_000) == AdaptiveDebounce.DEFAULT_WINDOW_MS
+
+
+def test_fast_updates_apply_immediately():
+    debounce = AdaptiveDebounce()
+    for _ in range(10):
+        debounce.record(0.002)
+
+    assert debounce.interval_ms(5_000) == 0
+
+
+def test_window_follows_p95_within_bounds():
+    debounce = AdaptiveDebounce(samples=20)
+    for _ in range(19):
+        debounce.record(0.010)
+    debounce.record(0.090)
+
+    assert debounce.p95_ms() == 10.0
+    assert debounce.interval_ms(5_000) == AdaptiveDebounce.MIN_WINDOW_MS
+
+    for _ in range(20):
+        debounce.record(0.120)
+    assert debounce.interval_ms(5_000) == 240
+
+    for _ in range(20):
+        debounce.record(1.0)
+    assert debounce.interval_ms(5_000) == AdaptiveDebounce.MAX_WINDOW_MS
+    assert debounce.stats(5_000)["debounceMs"] == AdaptiveDebounce.MAX_WINDOW_MS
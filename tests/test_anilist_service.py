@@ -1,6 +1,6 @@
 import requests
 
-from services.anilist_service import AniListService
+from services.anilist_service import AniListService, RequestAborted
 
 
 class _Response:
@@ -18,6 +18,13 @@ class _Response:
         return self._payload
 
 
+def _session_post(fake_post):
+    def _post(self, url, json, headers, timeout):
+        return fake_post(url, json=json, headers=headers, timeout=timeout)
+
+    return _post
+
+
 def test_query_raises_when_not_authenticated():
     svc = AniListService()
     try:
@@ -35,7 +42,7 @@ def test_query_success(monkeypatch):
         assert "Authorization" in headers
         return _Response({"data": {"Viewer": {"id": 1}}})
 
-    monkeypatch.setattr("services.anilist_service.requests.post", fake_post)
+    monkeypatch.setattr("services.anilist_service.requests.Session.post", _session_post(fake_post))
     out = svc._query("query { Viewer { id } }")
     assert out == {"Viewer": {"id": 1}}
 
@@ -50,7 +57,7 @@ def test_query_retries_then_timeout(monkeypatch):
         attempts["n"] += 1
         raise requests.exceptions.Timeout("boom")
 
-    monkeypatch.setattr("services.anilist_service.requests.post", fake_post)
+    monkeypatch.setattr("services.anilist_service.requests.Session.post", _session_post(fake_post))
     monkeypatch.setattr(svc, "_sleep_backoff", lambda *_: None)
 
     try:
@@ -68,7 +75,7 @@ def test_query_maps_http_status(monkeypatch):
     def fake_post(url, json, headers, timeout):
         return _Response({}, status_code=429)
 
-    monkeypatch.setattr("services.anilist_service.requests.post", fake_post)
+    monkeypatch.setattr("services.anilist_service.requests.Session.post", _session_post(fake_post))
     monkeypatch.setattr(svc, "_sleep_backoff", lambda *_: None)
 
     try:
@@ -83,7 +90,7 @@ def test_get_watching_anime_handles_empty_lists(monkeypatch):
     monkeypatch.setattr(
         svc,
         "_query",
-        lambda query, variables=None, retries=3: {"MediaListCollection": {"lists": []}},
+        lambda query, variables=None, retries=3: {"Page": {"pageInfo": {"hasNextPage": False}, "mediaList": []}},
     )
 
     out = svc.get_watching_anime(10)
@@ -100,13 +107,13 @@ def test_get_viewer_info_returns_viewer_payload(monkeypatch):
     assert out["name"] == "ketou"
 
 
-def test_get_watching_anime_returns_first_list_entries(monkeypatch):
+def test_get_watching_anime_returns_single_page_entries(monkeypatch):
     svc = AniListService()
     entries = [{"media": {"id": 1}, "progress": 3}]
     monkeypatch.setattr(
         svc,
         "_query",
-        lambda query, variables=None, retries=3: {"MediaListCollection": {"lists": [{"entries": entries}]}},
+        lambda query, variables=None, retries=3: {"Page": {"pageInfo": {"hasNextPage": False}, "mediaList": entries}},
     )
 
     out = svc.get_watching_anime(99)
@@ -114,6 +121,35 @@ def test_get_watching_anime_returns_first_list_entries(monkeypatch):
     assert out == entries
 
 
+def test_iter_watching_anime_pages_streams_all_pages(monkeypatch):
+    svc = AniListService()
+    pages = {
+        1: {"pageInfo": {"hasNextPage": True}, "mediaList": [{"media": {"id": 1}}, {"media": {"id": 2}}]},
+        2: {"pageInfo": {"hasNextPage": False}, "mediaList": [{"media": {"id": 3}}]},
+    }
+    seen_variables = []
+
+    def fake_query(query, variables=None, retries=3):
+        seen_variables.append(dict(variables))
+        return {"Page": pages[variables["page"]]}
+
+    monkeypatch.setattr(svc, "_query", fake_query)
+
+    generator = svc.iter_watching_anime_pages(5, per_page=2)
+    streamed = []
+    try:
+        while True:
+            streamed.append(next(generator))
+    except StopIteration as stop:
+        full = stop.value
+
+    assert [[e["media"]["id"] for e in page] for page in streamed] == [[1, 2], [3]]
+    assert [e["media"]["id"] for e in full] == [1, 2, 3]
+    assert seen_variables[0]["statuses"] == ["CURRENT", "PLANNING", "REPEATING"]
+    assert seen_variables[0]["perPage"] == 2
+    assert [v["page"] for v in seen_variables] == [1, 2]
+
+
 def test_query_retries_then_connection_error(monkeypatch):
     svc = AniListService()
     svc.set_token("tok")
@@ -124,7 +160,7 @@ def test_query_retries_then_connection_error(monkeypatch):
         attempts["n"] += 1
         raise requests.exceptions.ConnectionError("offline")
 
-    monkeypatch.setattr("services.anilist_service.requests.post", fake_post)
+    monkeypatch.setattr("services.anilist_service.requests.Session.post", _session_post(fake_post))
     monkeypatch.setattr(svc, "_sleep_backoff", lambda *_: None)
 
     try:
@@ -142,7 +178,7 @@ def test_query_raises_on_graphql_error_payload(monkeypatch):
     def fake_post(url, json, headers, timeout):
         return _Response({"errors": [{"message": "GraphQL exploded"}]})
 
-    monkeypatch.setattr("services.anilist_service.requests.post", fake_post)
+    monkeypatch.setattr("services.anilist_service.requests.Session.post", _session_post(fake_post))
 
     try:
         svc._query("query { Viewer { id } }", retries=1)
@@ -163,7 +199,7 @@ def test_query_recovers_after_single_timeout(monkeypatch):
             raise requests.exceptions.Timeout("temporary timeout")
         return _Response({"data": {"Viewer": {"id": 42}}})
 
-    monkeypatch.setattr("services.anilist_service.requests.post", fake_post)
+    monkeypatch.setattr("services.anilist_service.requests.Session.post", _session_post(fake_post))
     monkeypatch.setattr(svc, "_sleep_backoff", lambda *_: None)
 
     out = svc._query("query { Viewer { id } }", retries=3)
@@ -184,7 +220,7 @@ def test_query_recovers_after_single_http429(monkeypatch):
             return _Response({}, status_code=429)
         return _Response({"data": {"Viewer": {"id": 7}}})
 
-    monkeypatch.setattr("services.anilist_service.requests.post", fake_post)
+    monkeypatch.setattr("services.anilist_service.requests.Session.post", _session_post(fake_post))
     monkeypatch.setattr(svc, "_sleep_backoff", lambda *_: None)
 
     out = svc._query("query { Viewer { id } }", retries=3)
@@ -209,7 +245,7 @@ def test_query_recovers_after_invalid_json_payload(monkeypatch):
             return _BadJsonResponse({})
         return _Response({"data": {"Viewer": {"id": 9}}})
 
-    monkeypatch.setattr("services.anilist_service.requests.post", fake_post)
+    monkeypatch.setattr("services.anilist_service.requests.Session.post", _session_post(fake_post))
     monkeypatch.setattr(svc, "_sleep_backoff", lambda *_: None)
 
     out = svc._query("query { Viewer { id } }", retries=3)
@@ -228,7 +264,7 @@ def test_query_does_not_retry_http401(monkeypatch):
         attempts["n"] += 1
         return _Response({}, status_code=401)
 
-    monkeypatch.setattr("services.anilist_service.requests.post", fake_post)
+    monkeypatch.setattr("services.anilist_service.requests.Session.post", _session_post(fake_post))
     monkeypatch.setattr(svc, "_sleep_backoff", lambda *_: None)
 
     try:
@@ -256,3 +292,190 @@ def test_rate_limit_wait_seconds_uses_reset_header(monkeypatch):
 
     monkeypatch.setattr("services.anilist_service.time.time", lambda: 100.0)
     assert svc._rate_limit_wait_seconds(_Resp()) == 20.0
+
+
+def test_query_reuses_pooled_session(monkeypatch):
+    svc = AniListService()
+    svc.set_token("tok")
+    sessions = []
+
+    def fake_post(self, url, json, headers, timeout):
+        sessions.append(self)
+        return _Response({"data": {"Viewer": {"id": 1}}})
+
+    monkeypatch.setattr("services.anilist_service.requests.Session.post", fake_post)
+    monkeypatch.setattr(svc, "_wait_for_request_slot", lambda: None)
+
+    svc._query("query { Viewer { id } }")
+    svc._query("query { Viewer { id } }")
+
+    assert len(sessions) == 2
+    assert sessions[0] is sessions[1]
+    adapter = sessions[0].get_adapter(svc.API_URL)
+    assert adapter.max_retries.connect == svc._transport_retries
+
+
+def test_close_discards_session_and_recreates_lazily():
+    svc = AniListService()
+    first = svc._get_session()
+
+    svc.close()
+    svc.close()
+
+    assert svc._session is None
+    assert svc._get_session() is not first
+
+
+def test_get_watching_anime_delta_stops_at_watermark(monkeypatch):
+    svc = AniListService()
+    calls = []
+
+    def fake_query(query, variables=None, retries=3):
+        calls.append(variables)
+        if "UPDATED_TIME_DESC" in query:
+            return {
+                "Page": {
+                    "pageInfo": {"hasNextPage": True},
+                    "mediaList": [
+                        {"updatedAt": 300, "media": {"id": 3}},
+                        {"updatedAt": 200, "media": {"id": 2}},
+                        {"updatedAt": 100, "media": {"id": 1}},
+                    ],
+                }
+            }
+        if "MediaListCollection" in query:
+            return {"MediaListCollection": {"lists": [{"entries": [{"mediaId": 1}, {"mediaId": 3}]}]}}
+        return {"Page": {"media": [{"id": 1, "nextAiringEpisode": {"episode": 4, "airingAt": 999}}]}}
+
+    monkeypatch.setattr(svc, "_query", fake_query)
+
+    delta = svc.get_watching_anime_delta(5, updated_since=200, stale_media_ids=[1])
+
+    assert [e["media"]["id"] for e in delta["changed"]] == [3, 2]
+    assert delta["media_ids"] == [1, 3]
+    assert delta["airing"] == {1: {"episode": 4, "airingAt": 999}}
+    assert len(calls) == 3
+
+
+def test_get_next_airing_episodes_skips_query_without_ids(monkeypatch):
+    svc = AniListService()
+    monkeypatch.setattr(svc, "_query", lambda *a, **k: (_ for _ in ()).throw(AssertionError("no query")))
+
+    assert svc.get_next_airing_episodes([]) == {}
+
+
+def test_query_writes_through_cache_but_always_fetches(monkeypatch, tmp_path):
+    from services.response_cache import ResponseCache
+
+    svc = AniListService()
+    svc.set_token("tok")
+    svc.set_response_cache(ResponseCache(tmp_path / "cache.sqlite3"))
+    attempts = {"n": 0}
+
+    def fake_post(url, json, headers, timeout):
+        attempts["n"] += 1
+        return _Response({"data": {"Viewer": {"id": 5, "name": "ketou"}}})
+
+    monkeypatch.setattr("services.anilist_service.requests.Session.post", _session_post(fake_post))
+    monkeypatch.setattr(svc, "_wait_for_request_slot", lambda: None)
+
+    assert svc.get_viewer_info()["id"] == 5
+    assert svc.get_viewer_info()["id"] == 5
+    assert attempts["n"] == 2
+    assert svc.get_cached_viewer_info() == {"id": 5, "name": "ketou"}
+
+    other = AniListService()
+    other.set_token("other-token")
+    other.set_response_cache(ResponseCache(tmp_path / "cache.sqlite3"))
+    assert other.get_cached_viewer_info() is None
+
+
+def test_get_cached_watching_anime_requires_every_page(monkeypatch, tmp_path):
+    from services.response_cache import ResponseCache
+
+    svc = AniListService()
+    svc.set_token("tok")
+    cache = ResponseCache(tmp_path / "cache.sqlite3")
+    svc.set_response_cache(cache)
+    assert svc.get_cached_watching_anime(3) is None
+
+    def variables(page):
+        return {"userId": 3, "statuses": list(svc.DEFAULT_LIST_STATUSES), "page": page, "perPage": svc._page_size}
+
+    def key(page):
+        return ResponseCache.make_key(svc.LIST_PAGE_QUERY, variables(page), svc._cache_namespace)
+
+    cache.put(key(1), {"Page": {"pageInfo": {"hasNextPage": True}, "mediaList": [{"media": {"id": 1}}]}}, 60)
+    assert svc.get_cached_watching_anime(3) is None
+
+    cache.put(key(2), {"Page": {"pageInfo": {"hasNextPage": False}, "mediaList": [{"media": {"id": 2}}]}}, 60)
+    out = svc.get_cached_watching_anime(3)
+    assert [e["media"]["id"] for e in out] == [1, 2]
+
+
+def test_cancel_check_aborts_before_next_page(monkeypatch):
+    svc = AniListService()
+    svc.set_token("tok")
+    monkeypatch.setattr(svc, "_wait_for_request_slot", lambda: None)
+    cancelled = {"flag": False}
+    svc.set_cancel_check(lambda: cancelled["flag"])
+    calls = {"n": 0}
+
+    def fake_post(url, json, headers, timeout):
+        calls["n"] += 1
+        return _Response({"data": {"Page": {"pageInfo": {"hasNextPage": True}, "mediaList": [{"id": calls["n"]}]}}})
+
+    monkeypatch.setattr("services.anilist_service.requests.Session.post", _session_post(fake_post))
+    pages = svc.iter_watching_anime_pages(1)
+    assert next(pages) == [{"id": 1}]
+    cancelled["flag"] = True
+    try:
+        next(pages)
+        assert False, "Expected RequestAborted"
+    except RequestAborted:
+        pass
+    assert calls["n"] == 1
+
+
+def test_cancel_check_interrupts_backoff(monkeypatch):
+    svc = AniListService()
+    sleeps = []
+    monkeypatch.setattr("services.anilist_service.time.sleep", sleeps.append)
+    svc.set_cancel_check(lambda: len(sleeps) >= 2)
+
+    try:
+        svc._sleep_backoff(5)
+        assert False, "Expected RequestAborted"
+    except RequestAborted:
+        pass
+    assert len(sleeps) == 2 and max(sleeps) <= AniListService.ABORT_POLL_SEC
+
+
+def test_list_pages_skip_pacing_within_burst_allowance(monkeypatch):
+    monkeypatch.setenv("AIRINGDECK_ANILIST_PAGE_BURST", "2")
+    svc = AniListService()
+    svc.set_token("tok")
+    remaining = {"value": "60"}
+
+    def fake_post(url, json, headers, timeout):
+        response = _Response({"data": {"Page": {
+            "pageInfo": {"hasNextPage": json["variables"]["page"] < 5},
+            "mediaList": [{"media": {"id": json["variables"]["page"]}}],
+        }}})
+        response.headers = {"X-RateLimit-Remaining": remaining["value"]}
+        return response
+
+    waits = []
+    monkeypatch.setattr("services.anilist_service.requests.Session.post", _session_post(fake_post))
+    monkeypatch.setattr(svc, "_sleep", waits.append)
+
+    assert len(svc.get_watching_anime(1)) == 5
+    # Pages 2-3 burst; pages 4-5 are paced.
+    assert len(waits) == 2
+
+    waits.clear()
+    remaining["value"] = "3"
+    svc.get_watching_anime(1)
+    # No headroom: every page is paced, including the first after the last run.
+    assert len(waits) == 5
+    assert svc._burst_left == 0
@@ -39,3 +39,96 @@ def test_model_updates_data_without_structure_change():
     assert model.data(model.index(0, 0), model.DisplayTitleRole) == "ONE"
     assert model.data(model.index(1, 0), model.ProgressRole) == 8
 
+
+
+class _Recorder:
+    def __init__(self, model):
+        self.events = []
+        model.modelReset.connect(lambda: self.events.append(("reset",)))
+        model.rowsInserted.connect(lambda parent, first, last: self.events.append(("insert", first, last)))
+        model.rowsRemoved.connect(lambda parent, first, last: self.events.append(("remove", first, last)))
+        model.rowsMoved.connect(
+            lambda parent, start, end, dest, row: self.events.append(("move", start, row))
+        )
+        model.dataChanged.connect(
+            lambda tl, br, roles: self.events.append(("changed", tl.row(), br.row(), tuple(roles)))
+        )
+
+
+def _ids(model):
+    return [model.get_entry(i)["media"]["id"] for i in range(model.rowCount())]
+
+
+def test_model_diff_inserts_and_removes_without_reset():
+    model = AnimeModel()
+    a, b, c, d = _entry(1, "A"), _entry(2, "B"), _entry(3, "C"), _entry(4, "D")
+    model.update_data([a, b, c])
+    recorder = _Recorder(model)
+
+    model.update_data([a, c, d])
+
+    assert _ids(model) == [1, 3, 4]
+    assert recorder.events == [("remove", 1, 1), ("insert", 2, 2)]
+
+
+def test_model_diff_moves_rows_and_reports_changed_roles_only():
+    model = AnimeModel()
+    a, b, c = _entry(1, "A", airing="10:00"), _entry(2, "B"), _entry(3, "C")
+    model.update_data([a, b, c])
+    recorder = _Recorder(model)
+
+    a["airing_time_formatted"] = "09:59"
+    model.update_data([c, a, b])
+
+    assert _ids(model) == [3, 1, 2]
+    assert ("reset",) not in recorder.events
+    assert [e for e in recorder.events if e[0] == "move"]
+    assert [e for e in recorder.events if e[0] == "changed"] == [("changed", 1, 1, (model.AiringTimeRole,))]
+
+
+def test_model_diff_is_silent_when_nothing_changed():
+    model = AnimeModel()
+    entries = [_entry(1, "A"), _entry(2, "B")]
+    model.update_data(entries)
+    recorder = _Recorder(model)
+
+    model.update_data(list(entries))
+
+    assert recorder.events == []
+
+
+def test_model_diff_reaches_any_target_order():
+    import random
+
+    rng = random.Random(11)
+    pool = [_entry(i, f"T{i}") for i in range(12)]
+    model = AnimeModel()
+    for _ in range(60):
+        target = rng.sample(pool, rng.randint(0, len(pool)))
+        model.update_data(target)
+        assert _ids(model) == [e["media"]["id"] for e in target]
+        assert model.count == len(target)
+
+
+def test_model_diff_moves_single_row_to_end_with_one_move():
+    entries = [_entry(i, f"T{i}") for i in range(200)]
+    model = AnimeModel()
+    model.update_data(entries)
+    recorder = _Recorder(model)
+
+    model.update_data(entries[1:] + entries[:1])
+
+    assert _ids(model) == list(range(1, 200)) + [0]
+    assert recorder.events == [("move", 0, 200)]
+
+
+def test_model_diff_resets_when_reorder_needs_many_moves():
+    entries = [_entry(i, f"T{i}") for i in range(AnimeModel.MAX_ROW_MOVES * 3)]
+    model = AnimeModel()
+    model.update_data(entries)
+    recorder = _Recorder(model)
+
+    model.update_data(list(reversed(entries)))
+
+    assert _ids(model) == [e["media"]["id"] for e in reversed(entries)]
+    assert recorder.events == [("reset",)]
@@ -1,6 +1,6 @@
 from datetime import datetime, timedelta
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, Qt, Signal
 
 import core.app_controller as app_controller_module
 
@@ -88,3 +88,230 @@ def test_sort_by_progress_desc(monkeypatch):
     model = c.allAnimeModel
     ids = [model.get_entry(i)["media"]["id"] for i in range(model.rowCount())]
     assert ids == [2, 3, 1]
+
+
+def test_genre_counts_follow_list(monkeypatch):
+    c = _controller(monkeypatch)
+    data = [
+        _entry(1, "One", 0, ["Action", "Drama"], 80, 2),
+        _entry(2, "Two", 0, ["Drama"], 60, 4),
+        _entry(3, "Three", 1, ["Action"], 90, 1),
+    ]
+    c._on_anime_list_result(data)
+
+    assert c.genreCounts == {"Action": 2, "Drama": 2}
+
+
+def test_typo_query_matches_by_relevance(monkeypatch):
+    c = _controller(monkeypatch)
+    data = [
+        _entry(1, "Frieren", 0, ["Fantasy"], 80, 2),
+        _entry(2, "Dandadan", 0, ["Action"], 60, 4),
+    ]
+    c._on_anime_list_result(data)
+
+    c.setFilterText("freiren")
+    c._apply_pending_filter()
+
+    model = c.allAnimeModel
+    assert model.rowCount() == 1
+    assert model.get_entry(0)["media"]["id"] == 1
+
+
+def test_exact_query_ranks_only_for_relevance_sort(monkeypatch):
+    c = _controller(monkeypatch)
+    data = [
+        _entry(1, "Frieren", 0, ["Fantasy"], 80, 2),
+        _entry(2, "Dandadan", 0, ["Action"], 60, 4),
+    ]
+    data[1]["media"]["synonyms"] = ["Dan Da Dan"]
+    c._on_anime_list_result(data)
+    ranked = []
+    real_rank = app_controller_module.EntryTable.relevance
+    monkeypatch.setattr(
+        app_controller_module.EntryTable,
+        "relevance",
+        lambda table, query: ranked.append(query) or real_rank(table, query),
+    )
+
+    c.setFilterText("dan da dan")
+    c._apply_pending_filter()
+
+    assert [c.allAnimeModel.get_entry(i)["media"]["id"] for i in range(c.allAnimeModel.rowCount())] == [2]
+    assert ranked == []
+
+    c.sortField = "relevance"
+    c._apply_pending_filter()
+
+    assert ranked == ["dan da dan"]
+    assert c.allAnimeModel.rowCount() == 1
+
+
+def test_narrowing_filters_refine_previous_result(monkeypatch):
+    c = _controller(monkeypatch)
+    data = [
+        _entry(1, "Frieren", 0, ["Fantasy"], 80, 2),
+        _entry(2, "Fire Force", 1, ["Action"], 70, 4),
+        _entry(3, "Frieren Movie", 2, ["Fantasy"], 90, 1),
+    ]
+    c._on_anime_list_result(data)
+
+    c.setFilterText("fri")
+    c._apply_pending_filter()
+    c.setFilterText("frie")
+    c._apply_pending_filter()
+    c.minScore = 85
+    refined = c._filter_refiner.refined
+
+    assert refined >= 2
+    assert [c.allAnimeModel.get_entry(i)["media"]["id"] for i in range(c.allAnimeModel.rowCount())] == [3]
+
+    c.minScore = 0
+    assert c._filter_refiner.refined == refined
+    assert c.allAnimeModel.rowCount() == 2
+
+
+def test_recent_views_come_from_the_view_cache(monkeypatch):
+    c = _controller(monkeypatch)
+    data = [
+        _entry(1, "One", 0, ["Action"], 80, 2),
+        _entry(2, "Two", 0, ["Drama"], 60, 4),
+        _entry(3, "Three", 1, ["Action"], 90, 1),
+    ]
+    c._on_anime_list_result(data)
+    model = c.allAnimeModel
+
+    def ids():
+        return [model.get_entry(i)["media"]["id"] for i in range(model.rowCount())]
+
+    airing_order = ids()
+    c.sortField = "progress"
+    progress_order = ids()
+    hits = c._view_cache.hits
+
+    c.sortField = "airing_time"
+    assert ids() == airing_order
+    c.sortField = "progress"
+    assert ids() == progress_order
+    assert c._view_cache.hits == hits + 2
+    assert c.pipelineStats["viewCache"]["hits"] == hits + 2
+
+    c._on_anime_list_result(data[:2])
+    assert len(c._view_cache) == 1
+    assert 3 not in ids()
+
+
+def test_filter_debounce_adapts_to_measured_latency(monkeypatch):
+    c = _controller(monkeypatch)
+    c._on_anime_list_result([_entry(1, "Frieren", 0, ["Fantasy"], 80, 2)])
+
+    c.setFilterText("fri")
+    assert c.filterText == "fri"
+    assert not c._filter_update_timer.isActive()
+
+    for _ in range(10):
+        c._filter_debounce.record(0.1)
+    c.setFilterText("frie")
+    assert c.filterText == "fri"
+    assert c._filter_update_timer.isActive()
+    assert c._filter_update_timer.interval() == 200
+    assert c.pipelineStats["debounce"]["debounceMs"] == 200
+    c._filter_update_timer.stop()
+
+
+def test_countdown_tick_repaints_only_airing_time(monkeypatch):
+    c = _controller(monkeypatch)
+    data = [
+        _entry(1, "One", 0, ["Action"], 80, 2),
+        _entry(2, "Two", 1, ["Drama"], 60, 4),
+    ]
+    c._on_anime_list_result(data)
+    model = c.allAnimeModel
+    events = []
+    model.modelReset.connect(lambda: events.append("reset"))
+    model.rowsMoved.connect(lambda *args: events.append("move"))
+    model.dataChanged.connect(lambda tl, br, roles: events.append((tl.row(), br.row(), tuple(roles))))
+    revision = c._data_revision
+    monkeypatch.setattr(app_controller_module, "format_countdown", lambda airing_at, language, now=None: "soon")
+
+    c._update_countdowns()
+
+    assert events == [(0, 1, (model.AiringTimeRole,))]
+    assert c._data_revision == revision
+    assert model.data(model.index(1, 0), model.AiringTimeRole) == "soon"
+
+
+def test_countdown_deadlines_refresh_only_due_rows(monkeypatch):
+    c = _controller(monkeypatch)
+    soon = _entry(1, "Soon", 0, ["Action"], 80, 2)
+    later = _entry(2, "Later", 5, ["Drama"], 60, 4)
+    soon["media"]["nextAiringEpisode"]["airingAt"] = int(datetime.now().timestamp()) + 600
+    c._on_anime_list_result([soon, later])
+
+    queue = c._countdown_queue
+    assert c._countdown_timer.isActive()
+    assert 0 < queue.next_deadline() - datetime.now().timestamp() <= 61
+    calls = []
+    original = app_controller_module.format_countdown
+    monkeypatch.setattr(
+        app_controller_module,
+        "format_countdown",
+        lambda airing_at, language, now=None: calls.append(airing_at) or original(airing_at, language, now),
+    )
+    monkeypatch.setattr(queue, "pop_due", lambda now: [c._entry_table.row_by_id[1]])
+
+    c._on_countdown_deadline()
+
+    assert calls == [soon["media"]["nextAiringEpisode"]["airingAt"]]
+    assert 1 in c._entry_table.row_by_id and c._entry_table.row_by_id[1] in queue
+
+
+def test_countdown_timer_is_precise_and_rechecks_the_clock_often(monkeypatch):
+    c = _controller(monkeypatch)
+    c._on_anime_list_result([_entry(1, "Later", 5, ["Drama"], 60, 4)])
+
+    assert c._countdown_queue.next_deadline() - datetime.now().timestamp() > 60
+    assert c._countdown_timer.timerType() == Qt.PreciseTimer
+    assert 0 < c._countdown_timer.remainingTime() <= c._MAX_TIMER_WAIT_MS
+    c._countdown_timer.stop()
+
+
+class _FakeTray:
+    def __init__(self):
+        self.messages = []
+
+    def showMessage(self, summary, body, icon, timeout):  # noqa: N802
+        self.messages.append((summary, body))
+
+
+def test_notifications_batch_due_episodes_and_arm_next_deadline(monkeypatch):
+    c = _controller(monkeypatch)
+    c._tray_icon = _FakeTray()
+    c._notifications_enabled = True
+    c._notification_lead_minutes = 15
+    c._notification_extra_leads = [60]
+    now_ts = int(datetime.now().timestamp())
+    data = [
+        _entry(1, "One", 0, ["Action"], 80, 2),
+        _entry(2, "Two", 0, ["Drama"], 60, 4),
+        _entry(3, "Three", 0, ["Action"], 90, 1),
+    ]
+    data[0]["media"]["nextAiringEpisode"]["airingAt"] = now_ts + 600
+    data[1]["media"]["nextAiringEpisode"]["airingAt"] = now_ts + 620
+    data[2]["media"]["nextAiringEpisode"]["airingAt"] = now_ts + 2 * 3600
+
+    c._on_anime_list_result(data)
+
+    assert len(c._tray_icon.messages) == 1
+    summary, body = c._tray_icon.messages[0]
+    assert summary.startswith("2 ")
+    assert "One" in body and "Two" in body
+    assert c._notification_timer.isActive()
+    assert c._notification_timer.timerType() == Qt.PreciseTimer
+    assert c._notification_timer.remainingTime() <= c.NOTIFICATION_MAX_WAIT_MS
+    assert c._notification_schedule.next_deadline() == now_ts + 3600
+
+    c._check_episode_notifications()
+    assert len(c._tray_icon.messages) == 1
+    c._notification_timer.stop()
+    c._countdown_timer.stop()
@@ -3,6 +3,9 @@ from datetime import datetime, timedelta
 from PySide6.QtCore import QObject, Signal
 
 import core.app_controller as app_controller_module
+from core.cover_prefetch import CoverPrefetcher
+from core.task_scheduler import TaskPriority
+from core.worker import TaskTimeout, WorkerSignals
 
 
 class FakeSettings:
@@ -123,7 +126,8 @@ def _controller(monkeypatch):
     monkeypatch.setattr(app_controller_module.AppController, "_init_tray_icon", lambda self: None)
 
     c = app_controller_module.AppController(None)
-    c._update_timer.stop()
+    c._notification_timer.stop()
+    c._countdown_timer.stop()
     c._filter_update_timer.stop()
     c._sync_retry_timer.stop()
     c._is_authenticated = True
@@ -187,3 +191,149 @@ def test_ui_state_mutations_during_pending_sync_do_not_break_models(monkeypatch)
     assert len(c.dailyCounts) == 7
     assert c.allAnimeModel.rowCount() >= 1
     assert c._anilist_service.calls == 2
+
+
+def test_cover_prefetch_follows_latest_sync_and_budget(monkeypatch, tmp_path):
+    monkeypatch.setenv("AIRINGDECK_CACHE_DIR", str(tmp_path))
+    c = _controller(monkeypatch)
+    pool = c._thread_pool
+    first = [_entry(i, f"Show {i}", ["Action"], 80, 0, 1) for i in range(1, 5)]
+    for entry in first:
+        entry["media"]["coverImage"]["large"] = f"https://img.example/{entry['media']['id']}.jpg"
+
+    c._on_anime_list_result(first)
+    assert pool.pending() == CoverPrefetcher.DEFAULT_MAX_PARALLEL
+    generation = c._cover_prefetcher.generation
+
+    c._on_anime_list_result(first[:1])
+    assert c._cover_prefetcher.generation > generation
+    # The replaced run's jobs still hold both download slots.
+    assert c._cover_prefetcher.pending == 1
+    assert pool.pending() == CoverPrefetcher.DEFAULT_MAX_PARALLEL
+    # Jobs of the replaced run finish without downloading anything.
+    pool.run_at(0)
+    assert c._cover_prefetcher.pending == 0
+
+    c.coverPrefetchBudgetMb = 0
+    assert FakeSettings._store["cover_prefetch_budget_mb"] == 0
+    pending = pool.pending()
+    c._on_anime_list_result(first)
+    assert pool.pending() == pending
+
+
+class CoverAniListService(SequenceAniListService):
+    def __init__(self):
+        super().__init__()
+        self.next_delta = {"changed": [], "media_ids": None, "airing": {}}
+
+    def get_watching_anime(self, user_id):
+        entries = [_entry(i, f"Show {i}", ["Action"], 80, 0, 1) for i in range(1, 5)]
+        for entry in entries:
+            entry["updatedAt"] = 100
+            entry["media"]["coverImage"]["large"] = f"https://img.example/{entry['media']['id']}.jpg"
+        return entries
+
+    def get_watching_anime_delta(self, user_id, updated_since, stale_media_ids=()):
+        return self.next_delta
+
+
+def test_synced_lists_queue_cover_prefetch(monkeypatch, tmp_path):
+    monkeypatch.setenv("AIRINGDECK_CACHE_DIR", str(tmp_path))
+    c = _controller(monkeypatch)
+    c._anilist_service = CoverAniListService()
+    pool = c._thread_pool
+    prefetcher = c._cover_prefetcher
+
+    def prefetch_jobs():
+        return sum(1 for task in c._scheduler._running.values() if task.priority == TaskPriority.PREFETCH)
+
+    c.syncAnimeList()
+    pool.run_at(0)
+    first_generation = prefetcher.generation
+    assert first_generation > 0
+    assert prefetch_jobs() == CoverPrefetcher.DEFAULT_MAX_PARALLEL
+    assert prefetcher.pending == 2
+
+    # A delta sync supersedes the running prefetch as soon as it starts.
+    changed = c._anilist_service.get_watching_anime(77)[0]
+    changed["updatedAt"] = 200
+    c._anilist_service.next_delta = {"changed": [changed], "media_ids": None, "airing": {}}
+    c.syncAnimeList()
+    assert prefetcher.generation > first_generation
+    assert prefetcher.pending == 0
+
+    pool.run_at(pool.pending() - 1)
+    assert c._anime_by_id[1]["updatedAt"] == 200
+    assert prefetcher.generation > first_generation + 1
+    assert prefetcher.pending == 4
+    # Jobs of the cancelled run download nothing and hand their slots over.
+    pool.run_at(0)
+    pool.run_at(0)
+    assert prefetch_jobs() == CoverPrefetcher.DEFAULT_MAX_PARALLEL
+    assert prefetcher.pending == 2
+
+
+def test_logout_cancels_pending_sync(monkeypatch):
+    c = _controller(monkeypatch)
+    pool = c._thread_pool
+    monkeypatch.setattr(c, "_clear_offline_cache", lambda: None)
+
+    c.syncAnimeList()
+    assert c._scheduler.stats()["running"] == 1
+    c.logout()
+    assert c._sync_in_progress is False
+
+    pool.run_all()
+
+    assert c.allAnimeModel.rowCount() == 0
+    assert c._scheduler.stats()["cancelled"] == 1
+    assert c._scheduler.running == 0
+
+
+def test_user_sync_supersedes_slow_background_sync(monkeypatch):
+    c = _controller(monkeypatch)
+    pool = c._thread_pool
+
+    assert c._request_sync(user_visible=False) is True
+    background_generation = c._sync_generation
+    assert c._request_sync(user_visible=True) is True
+    assert c._sync_generation > background_generation
+    assert c._sync_queued is False and pool.pending() == 2
+
+    # The background worker was cancelled before it ran: no request, no result.
+    pool.run_at(0)
+    assert c._anilist_service.calls == 0
+    pool.run_all()
+
+    assert c._anilist_service.calls == 1
+    assert c.allAnimeModel.rowCount() == 2
+    assert c._sync_in_progress is False
+
+
+def test_results_tagged_with_old_generation_are_discarded(monkeypatch):
+    c = _controller(monkeypatch)
+    pool = c._thread_pool
+    c.syncAnimeList()
+    pool.run_all()
+    assert c.allAnimeModel.rowCount() == 2
+
+    stale = WorkerSignals()
+    stale.setProperty("syncGeneration", c._sync_generation - 1)
+    stale.result.connect(c._on_sync_worker_result)
+    stale.error.connect(c._on_sync_worker_error)
+    stale.result.emit([])
+    stale.error.emit((RuntimeError, RuntimeError("old"), ""))
+
+    assert c.allAnimeModel.rowCount() == 2
+    assert c._sync_retry_attempts == 0
+
+
+def test_queue_timeout_is_not_retried_as_transient(monkeypatch):
+    c = _controller(monkeypatch)
+
+    c.syncAnimeList()
+    c._on_sync_worker_error((TaskTimeout, TaskTimeout("Task deadline exceeded before start"), ""))
+
+    assert c._sync_retry_attempts == 0
+    assert c._sync_retry_timer.isActive() is False
+    assert c._sync_in_progress is False
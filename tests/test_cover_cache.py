@@ -0,0 +1,78 @@
+import os
+
+import requests
+
+from services.cover_cache import CoverCache
+
+
+class _FakeResponse:
+    def __init__(self, content, status=200):
+        self.content = content
+        self.status_code = status
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"HTTP {self.status_code}")
+
+
+class _FakeSession:
+    def __init__(self, responses):
+        self.responses = responses
+        self.calls = []
+
+    def get(self, url, timeout=None):
+        self.calls.append(url)
+        response = self.responses.get(url)
+        if response is None:
+            raise requests.exceptions.ConnectionError("offline")
+        return response
+
+    def close(self):
+        pass
+
+
+def test_store_and_load_are_content_addressed(tmp_path):
+    cache = CoverCache(tmp_path)
+    url = "https://img.example/cover/1.jpg"
+
+    cache.store(url, b"original")
+    cache.store(url, b"thumb", variant="card")
+
+    assert cache.load(url) == b"original"
+    assert cache.load(url, "card") == b"thumb"
+    assert cache.path_for(url).name == CoverCache.make_key(url)
+    assert cache.load("https://img.example/other.jpg") is None
+    assert cache.total_bytes == len(b"original") + len(b"thumb")
+
+
+def test_lru_eviction_keeps_recently_read_files(tmp_path):
+    cache = CoverCache(tmp_path, max_bytes=10)
+    cache.store("https://a", b"aaaa")
+    cache.store("https://b", b"bbbb")
+    old = 1_000_000
+    os.utime(cache.path_for("https://b"), (old, old))
+
+    # The index is rebuilt from file mtimes when the directory is reopened.
+    reopened = CoverCache(tmp_path, max_bytes=10)
+    assert reopened.load("https://a") == b"aaaa"
+    reopened.store("https://c", b"cccc")
+
+    assert reopened.load("https://b") is None
+    assert reopened.load("https://a") == b"aaaa"
+    assert reopened.load("https://c") == b"cccc"
+    assert reopened.total_bytes <= 10
+
+
+def test_fetch_downloads_once_then_serves_from_disk(tmp_path):
+    url = "https://img.example/cover/2.jpg"
+    session = _FakeSession({url: _FakeResponse(b"jpeg-bytes")})
+    cache = CoverCache(tmp_path, session_factory=lambda: session)
+
+    assert cache.fetch(url) == b"jpeg-bytes"
+    assert cache.fetch(url) == b"jpeg-bytes"
+    assert session.calls == [url]
+
+    offline = CoverCache(tmp_path, session_factory=lambda: _FakeSession({}))
+    assert offline.fetch(url) == b"jpeg-bytes"
+    assert offline.fetch("https://img.example/missing.jpg") is None
+    assert cache.fetch("file:///etc/passwd") is None
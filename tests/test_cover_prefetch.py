@@ -0,0 +1,139 @@
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QImage
+
+from core.cover_prefetch import CoverPrefetcher, prefetch_order
+from core.cover_provider import encode_thumbnail
+from core.entry_table import EntryTable
+from services.cover_cache import CoverCache
+
+
+class _DeferredPool:
+    def __init__(self):
+        self.queue = []
+
+    def maxThreadCount(self):
+        return 4
+
+    def start(self, worker):
+        self.queue.append(worker)
+
+    def run_next(self):
+        self.queue.pop(0).run()
+
+
+class _Response:
+    def __init__(self, content):
+        self.content = content
+
+    def raise_for_status(self):
+        pass
+
+
+class _Session:
+    def __init__(self, content):
+        self.content = content
+        self.calls = []
+
+    def get(self, url, timeout=None):
+        self.calls.append(url)
+        return _Response(self.content)
+
+
+def _jpeg():
+    image = QImage(460, 650, QImage.Format_RGB32)
+    image.fill(Qt.darkGreen)
+    return encode_thumbnail(image)
+
+
+def _entry(media_id, day, url):
+    return {
+        "media": {"id": media_id, "coverImage": {"extraLarge": url, "large": "", "medium": ""}},
+        "calendar_day": day,
+        "display_title": str(media_id),
+    }
+
+
+def test_prefetch_order_starts_today_and_dedupes():
+    table = EntryTable.from_entries([
+        _entry(1, 0, "https://img/monday.jpg"),
+        _entry(2, 3, "https://img/thursday.jpg"),
+        _entry(3, 4, "https://img/friday.jpg"),
+        _entry(4, 4, "https://img/thursday.jpg"),
+        _entry(5, 5, ""),
+    ])
+
+    assert prefetch_order(table, 3) == [
+        "https://img/thursday.jpg",
+        "https://img/friday.jpg",
+        "https://img/monday.jpg",
+    ]
+
+
+def test_prefetch_runs_bounded_and_warms_thumbnails(tmp_path):
+    session = _Session(_jpeg())
+    cache = CoverCache(tmp_path, session_factory=lambda: session)
+    pool = _DeferredPool()
+    prefetcher = CoverPrefetcher(cache, max_parallel=2)
+    urls = [f"https://img/{i}.jpg" for i in range(4)]
+
+    prefetcher.start(urls, 10 * 1024 * 1024, pool)
+    assert len(pool.queue) == 2 and prefetcher.pending == 2
+
+    while pool.queue:
+        pool.run_next()
+
+    assert prefetcher.warmed == 4
+    assert all(cache.contains(url, "card") for url in urls)
+    assert prefetcher.used_bytes == 4 * len(session.content)
+
+
+def test_newer_start_drops_previous_generation(tmp_path):
+    session = _Session(_jpeg())
+    cache = CoverCache(tmp_path, session_factory=lambda: session)
+    pool = _DeferredPool()
+    prefetcher = CoverPrefetcher(cache, max_parallel=1)
+
+    prefetcher.start(["https://img/old-1.jpg", "https://img/old-2.jpg"], 10 * 1024 * 1024, pool)
+    stale = pool.queue.pop(0)
+    prefetcher.start(["https://img/new.jpg"], 10 * 1024 * 1024, pool)
+    stale.run()
+
+    assert session.calls == []
+    assert prefetcher.warmed == 0
+    pool.run_next()
+    assert session.calls == ["https://img/new.jpg"]
+    assert not pool.queue
+
+
+def test_budget_stops_the_queue(tmp_path):
+    session = _Session(_jpeg())
+    cache = CoverCache(tmp_path, session_factory=lambda: session)
+    pool = _DeferredPool()
+    prefetcher = CoverPrefetcher(cache, max_parallel=1)
+
+    prefetcher.start([f"https://img/{i}.jpg" for i in range(3)], 1, pool)
+    pool.run_next()
+
+    assert session.calls == ["https://img/0.jpg"]
+    assert prefetcher.pending == 0 and not pool.queue
+    assert prefetcher.start(["https://img/x.jpg"], 0, pool) and not pool.queue
+
+
+def test_restart_keeps_parallelism_bounded_across_generations(tmp_path):
+    session = _Session(_jpeg())
+    cache = CoverCache(tmp_path, session_factory=lambda: session)
+    pool = _DeferredPool()
+    prefetcher = CoverPrefetcher(cache, max_parallel=2)
+
+    prefetcher.start([f"https://img/a{i}.jpg" for i in range(3)], 10 * 1024 * 1024, pool)
+    prefetcher.start([f"https://img/b{i}.jpg" for i in range(3)], 10 * 1024 * 1024, pool)
+    assert len(pool.queue) == 2 and prefetcher.pending == 3
+
+    pool.run_next()
+    assert len(pool.queue) == 2 and prefetcher.pending == 2
+    while pool.queue:
+        assert len(pool.queue) <= 2
+        pool.run_next()
+
+    assert session.calls == [f"https://img/b{i}.jpg" for i in range(3)]
+    assert prefetcher.warmed == 3
@@ -0,0 +1,81 @@
+from PySide6.QtCore import QSize, Qt
+from PySide6.QtGui import QImage
+
+from core.cover_provider import (
+    THUMBNAIL_SIZES,
+    _CoverJob,
+    _CoverResponse,
+    encode_thumbnail,
+    load_cover_image,
+    parse_cover_id,
+    scale_cover,
+)
+from core.decoded_image_cache import DecodedImageCache
+from services.cover_cache import CoverCache
+
+
+def _image(width, height):
+    image = QImage(width, height, QImage.Format_RGB32)
+    image.fill(Qt.darkBlue)
+    return image
+
+
+def test_parse_cover_id_decodes_url():
+    assert parse_cover_id("card/https%3A%2F%2Fimg.example%2Fa.jpg") == ("card", "https://img.example/a.jpg")
+    assert parse_cover_id("avatar/https://img.example/b.png") == ("avatar", "https://img.example/b.png")
+
+
+def test_scale_cover_crops_cards_and_fits_sidebar():
+    card = scale_cover(_image(460, 650), "card")
+    sidebar = scale_cover(_image(460, 650), "sidebar")
+
+    assert card.size() == THUMBNAIL_SIZES["card"]
+    assert sidebar.height() == 450 and sidebar.width() < 800
+    assert scale_cover(_image(100, 100), "card").size() == QSize(100, 100)
+
+
+def test_load_cover_image_stores_thumbnail_for_next_time(tmp_path):
+    url = "https://img.example/c.jpg"
+    cache = CoverCache(tmp_path, session_factory=lambda: None)
+    cache.store(url, encode_thumbnail(_image(460, 650)))
+
+    image, error = load_cover_image(cache, "card", url)
+
+    assert error == ""
+    assert image.size() == THUMBNAIL_SIZES["card"]
+    assert cache.contains(url, "card")
+
+    cache.path_for(url).unlink()
+    again, error = load_cover_image(cache, "card", url)
+    assert error == "" and again.size() == THUMBNAIL_SIZES["card"]
+
+
+def test_load_cover_image_reports_errors(tmp_path):
+    cache = CoverCache(tmp_path, session_factory=lambda: None)
+
+    assert load_cover_image(cache, "poster", "https://img.example/d.jpg")[1]
+    cache.store("https://img.example/e.jpg", b"not an image")
+    image, error = load_cover_image(cache, "card", "https://img.example/e.jpg")
+    assert image.isNull() and "decoded" in error
+
+
+def test_repeat_requests_come_from_the_decoded_cache(tmp_path):
+    url = "https://img.example/f.jpg"
+    cache = CoverCache(tmp_path, session_factory=lambda: None)
+    cache.store(url, encode_thumbnail(_image(460, 650)))
+    decoded = DecodedImageCache()
+    image_id = "sidebar/https%3A%2F%2Fimg.example%2Ff.jpg"
+
+    def request():
+        response = _CoverResponse()
+        _CoverJob(cache, decoded, response, image_id, QSize(800, 450)).run()
+        return response
+
+    first = request()
+    cache.path_for(url).unlink()
+    cache.path_for(url, "sidebar").unlink()
+    second = request()
+
+    assert first.errorString() == "" and second.errorString() == ""
+    assert (decoded.hits, decoded.misses) == (1, 1)
+    assert second._image.size() == first._image.size()
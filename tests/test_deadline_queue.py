@@ -0,0 +1,27 @@
+from core.deadline_queue import DeadlineQueue
+
+
+def test_pop_due_returns_keys_in_deadline_order():
+    queue = DeadlineQueue()
+    queue.schedule("b", 20)
+    queue.schedule("a", 10)
+    queue.schedule("c", 30)
+
+    assert queue.next_deadline() == 10
+    assert queue.pop_due(25) == ["a", "b"]
+    assert len(queue) == 1
+    assert queue.next_deadline() == 30
+
+
+def test_reschedule_and_discard_skip_stale_items():
+    queue = DeadlineQueue()
+    queue.schedule("a", 10)
+    queue.schedule("b", 15)
+    queue.schedule("a", 40)
+    queue.discard("b")
+
+    assert "b" not in queue
+    assert queue.next_deadline() == 40
+    assert queue.pop_due(30) == []
+    assert queue.pop_due(40) == ["a"]
+    assert queue.next_deadline() is None
@@ -0,0 +1,46 @@
+from PySide6.QtGui import QImage
+
+from core.decoded_image_cache import DecodedImageCache
+
+
+def _image(width, height):
+    image = QImage(width, height, QImage.Format_RGB32)
+    image.fill(0)
+    return image
+
+
+def test_pixel_budget_evicts_least_recently_used():
+    cache = DecodedImageCache(max_pixels=300)
+    cache.put("a", _image(10, 10))
+    cache.put("b", _image(10, 10))
+    cache.put("c", _image(10, 10))
+
+    assert cache.get("a") is not None
+    cache.put("d", _image(10, 10))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("d") is not None
+    assert cache.pixels == 300 and len(cache) == 3
+
+
+def test_large_images_cost_more_than_small_ones():
+    cache = DecodedImageCache(max_pixels=10_000)
+    for key in range(5):
+        cache.put(key, _image(10, 10))
+    cache.put("sidebar", _image(96, 100))
+
+    assert cache.get("sidebar") is not None
+    assert cache.get(0) is None and cache.get(1) is not None
+    assert cache.pixels == 9_600 + 4 * 100
+
+
+def test_replacing_and_rejecting_images():
+    cache = DecodedImageCache(max_pixels=100)
+    cache.put("a", _image(5, 5))
+    cache.put("a", _image(10, 10))
+    cache.put("huge", _image(20, 20))
+    cache.put("null", QImage())
+
+    assert cache.pixels == 100
+    assert cache.get("huge") is None and cache.get("null") is None
+    assert (cache.hits, cache.misses) == (0, 2)
@@ -0,0 +1,144 @@
+from core.entry_table import NO_AIRING_AT, EntryTable
+
+
+def _entry(media_id, title, day, airing_at, genres=(), score=None, progress=0):
+    return {
+        "media": {
+            "id": media_id,
+            "genres": list(genres),
+            "averageScore": score,
+            "nextAiringEpisode": {"episode": progress + 1, "airingAt": airing_at} if airing_at else None,
+        },
+        "display_title": title,
+        "_search_blob": title.lower(),
+        "calendar_day": day,
+        "progress": progress,
+        "rating_sort_score": float(score) if score else -1.0,
+    }
+
+
+def _table():
+    return EntryTable.from_entries([
+        _entry(10, "Beta", 2, 2_000, ["Drama", "Action"], 70, 4),
+        _entry(11, "alpha", 2, 1_000, ["Comedy"], 90, 1),
+        _entry(12, "Gamma", -1, None, ["Action"], None, 7),
+        _entry(13, "Delta", 5, 1_500, [], 80, 2),
+    ])
+
+
+def test_columns_and_buckets():
+    table = _table()
+
+    assert len(table) == 4
+    assert list(table.ids) == [10, 11, 12, 13]
+    assert list(table.airing_at) == [2_000, 1_000, NO_AIRING_AT, 1_500]
+    assert list(table.episode) == [5, 2, 0, 3]
+    assert list(table.weekday) == [2, 2, -1, 5]
+    assert list(table.score) == [70, 90, -1, 80]
+    assert list(table.day_rows[2]) == [0, 1]
+    assert list(table.day_rows[5]) == [3]
+    assert list(table.airing_rows) == [0, 1, 3]
+    assert table.daily_counts() == [0, 0, 2, 0, 0, 1, 0]
+    assert table.row_by_id == {10: 0, 11: 1, 12: 2, 13: 3}
+    assert table.genres == ["Action", "Comedy", "Drama"]
+
+
+def test_genre_mask_bits():
+    table = _table()
+    action = table.genre_mask_for("action")
+    drama = table.genre_mask_for("drama")
+
+    assert table.genre_mask[0] == action | drama
+    assert table.genre_mask[2] == action
+    assert table.genre_mask[3] == 0
+    assert table.genre_mask_for("all genres") is None
+    assert table.genre_mask_for("") is None
+    assert table.genre_mask_for("horror") == 0
+
+
+def test_sort_rows_by_field():
+    table = _table()
+    rows = table.airing_rows
+
+    assert table.sort_rows(rows, "airing_time", True) == [1, 3, 0]
+    assert table.sort_rows(rows, "title", True) == [1, 0, 3]
+    assert table.sort_rows(rows, "progress", False) == [0, 3, 1]
+    assert table.sort_rows(rows, "score", False) == [1, 3, 0]
+
+
+def test_refresh_titles_follows_entries():
+    table = _table()
+    table.entries[1]["display_title"] = "Zeta"
+
+    table.refresh_titles()
+
+    assert table.sort_rows(table.airing_rows, "title", True) == [0, 3, 1]
+
+
+def test_title_rank_is_casefolded_and_keeps_ties_stable():
+    table = EntryTable.from_entries([
+        _entry(1, "Straße", 0, 100),
+        _entry(2, "STRASSE", 0, 200),
+        _entry(3, "alpha", 0, 300),
+    ])
+
+    assert list(table.title_rank) == [1, 1, 0]
+    assert table.sort_rows([1, 0, 2], "title", True) == [2, 1, 0]
+    assert table.sort_rows([0, 1, 2], "title", False) == [0, 1, 2]
+
+
+def test_snapshot_is_frozen_and_rebuilt_after_title_refresh():
+    table = _table()
+    snapshot = table.freeze()
+
+    assert table.snapshot is snapshot
+    assert snapshot.weekday.readonly and list(snapshot.weekday) == list(table.weekday)
+    assert list(snapshot.sort_key("title")) == list(table.title_rank)
+    assert list(snapshot.sort_key("relevance")) == list(table.airing_at)
+
+    table.entries[1]["display_title"] = "Zeta"
+    table.refresh_titles()
+
+    assert table.snapshot is not snapshot
+    assert list(table.snapshot.sort_key("title")) == list(table.title_rank)
+
+
+def test_genre_counts_use_masks():
+    table = _table()
+
+    assert table.genre_counts() == {"Action": 2, "Comedy": 1, "Drama": 1}
+    assert table.genre_counts(table.airing_rows) == {"Action": 1, "Comedy": 1, "Drama": 1}
+
+
+def test_wide_genre_sets_fall_back_to_python_ints():
+    entries = [_entry(i, f"T{i}", 0, 1_000 + i, [f"G{i:02d}"]) for i in range(70)]
+    table = EntryTable.from_entries(entries)
+
+    assert not table.genre_index.fits_native
+    assert table.genre_mask[69] == 1 << 69
+    assert table.genre_counts()["G69"] == 1
+
+
+def _titled(media_id, romaji, english=None, synonyms=(), airing_at=1_000):
+    entry = _entry(media_id, romaji, 1, airing_at)
+    entry["media"]["title"] = {"romaji": romaji, "english": english, "native": None}
+    entry["media"]["synonyms"] = list(synonyms)
+    entry["_search_blob"] = f"{romaji} {english or ''}".lower()
+    return entry
+
+
+def test_relevance_prefers_exact_matches_and_falls_back_to_fuzzy():
+    table = EntryTable.from_entries([
+        _titled(1, "Sousou no Frieren", synonyms=["Beyond Journey's End"], airing_at=3_000),
+        _titled(2, "Frieren Special", airing_at=2_000),
+        _titled(3, "Kusuriya no Hitorigoto", english="The Apothecary Diaries"),
+    ])
+
+    exact = table.relevance("frieren")
+    assert sorted(exact) == [0, 1]
+    assert exact[1] > exact[0]
+    assert table.sort_rows(table.airing_rows, "relevance", True, "frieren") == [1, 0, 2]
+    assert table.sort_rows(table.airing_rows, "relevance", False, "frieren") == [2, 0, 1]
+
+    assert list(table.relevance("apothacary")) == [2]
+    assert list(table.relevance("journey end")) == [0]
@@ -0,0 +1,42 @@
+from core.filter_refinement import FilterConstraints, FilterRefiner
+
+
+def _constraints(query="", genre_mask=None, min_score=0, only_today=False, today=2):
+    return FilterConstraints(query, genre_mask, min_score, only_today, today)
+
+
+def test_tighter_constraints_narrow():
+    base = _constraints("fri")
+
+    assert _constraints("frie").narrows(base, exact_query=True)
+    assert _constraints("fri", genre_mask=4, min_score=70, only_today=True).narrows(base, exact_query=True)
+    assert _constraints("frieren").narrows(_constraints(), exact_query=False)
+
+
+def test_looser_or_different_constraints_rescan():
+    base = _constraints("frie", genre_mask=4, min_score=70, only_today=True)
+
+    assert not _constraints("fri", genre_mask=4, min_score=70, only_today=True).narrows(base, True)
+    assert not _constraints("frie", genre_mask=8, min_score=70, only_today=True).narrows(base, True)
+    assert not _constraints("frie", genre_mask=None, min_score=70, only_today=True).narrows(base, True)
+    assert not _constraints("frie", genre_mask=4, min_score=60, only_today=True).narrows(base, True)
+    assert not _constraints("frie", genre_mask=4, min_score=70, only_today=False).narrows(base, True)
+    assert not _constraints("frie", genre_mask=4, min_score=70, only_today=True, today=3).narrows(base, True)
+    # No exact hit means a fuzzy search over every row.
+    assert not _constraints("friex", genre_mask=4, min_score=70, only_today=True).narrows(base, False)
+
+
+def test_refiner_reuses_rows_for_same_revision_only():
+    refiner = FilterRefiner()
+    all_rows = [0, 1, 2, 3, 4]
+
+    assert refiner.base_rows(1, _constraints("fr"), all_rows, True) is all_rows
+    refiner.remember(1, _constraints("fr"), [3, 1])
+
+    assert list(refiner.base_rows(1, _constraints("fri"), all_rows, True)) == [1, 3]
+    assert refiner.base_rows(2, _constraints("fri"), all_rows, True) is all_rows
+    assert refiner.base_rows(1, _constraints("f"), all_rows, True) is all_rows
+    assert (refiner.refined, refiner.rescanned) == (1, 3)
+
+    refiner.clear()
+    assert refiner.base_rows(1, _constraints("fri"), all_rows, True) is all_rows
@@ -7,15 +7,31 @@ import core.native_accel as native_accel
     blobs=st.lists(st.text(min_size=0, max_size=30), min_size=0, max_size=40),
     query=st.text(min_size=0, max_size=10),
 )
-def test_filter_entries_matches_reference_python(blobs, query):
-    old_native = native_accel._native
-    native_accel._native = None
-    entries = [{"_search_blob": b} for b in blobs]
-
-    try:
-        expected = [entry for entry in entries if query in entry.get("_search_blob", "")]
-        actual = native_accel.filter_entries(entries, query)
-    finally:
-        native_accel._native = old_native
-
-    assert actual == expected
+def test_filter_sort_buckets_query_matches_reference_python(blobs, query):
+    from core.entry_table import EntryTable
+
+    table = EntryTable.from_entries([
+        {"_search_blob": blob, "calendar_day": 0, "media": {"id": row}} for row, blob in enumerate(blobs)
+    ])
+    stripped = query.strip()
+    expected = [row for row, blob in enumerate(blobs) if stripped in blob]
+
+    _, combined, _ = native_accel.filter_sort_buckets(table, table.airing_rows, query, "", 0, False, 0)
+
+    assert list(combined) == expected
+
+
+@given(
+    texts=st.lists(
+        st.lists(st.text(alphabet="abcd ", max_size=14), min_size=1, max_size=3).map("\x1f".join),
+        max_size=30,
+    ),
+    query=st.text(alphabet="abcd ", min_size=1, max_size=9),
+)
+def test_fuzzy_rank_native_matches_python(texts, query):
+    if not native_accel.is_native_available():
+        return
+    query = query.strip()
+    expected = native_accel._fuzzy_rank_python(texts, query) if query else []
+
+    assert native_accel.fuzzy_rank(texts, query) == expected
@@ -167,7 +167,8 @@ def _make_controller(
     monkeypatch.setattr(app_controller_module.AppController, "_init_tray_icon", lambda self: None)
 
     c = app_controller_module.AppController(None)
-    c._update_timer.stop()
+    c._notification_timer.stop()
+    c._countdown_timer.stop()
     c._filter_update_timer.stop()
     c._sync_retry_timer.stop()
     return c
@@ -212,7 +213,7 @@ def test_integration_http401_error_triggers_logout(monkeypatch):
     assert c.isAuthenticated is False
     assert c.allAnimeModel.rowCount() == 0
     assert c._full_anime_list == []
-    assert c._full_airing_entries == []
+    assert len(c._entry_table.airing_rows) == 0
     assert c.userInfo == {}
     assert "Disconnesso" in c.statusMessage
 
@@ -394,3 +395,122 @@ def test_integration_start_update_install_no_url(monkeypatch):
 
     assert launched["count"] == 0
     assert "Link aggiornamento non disponibile" in c.statusMessage
+
+
+class PagedAniListService(FakeAniListService):
+    def iter_watching_anime_pages(self, user_id):
+        entries = FakeAniListService.get_watching_anime(self, user_id)
+        yield entries[:1]
+        yield entries[1:]
+        return entries
+
+
+def test_integration_first_sync_fills_models_progressively(monkeypatch):
+    c = _make_controller(monkeypatch, service_cls=PagedAniListService)
+    painted_rows = []
+    c.animeListChanged.connect(lambda: painted_rows.append(c.allAnimeModel.rowCount()))
+
+    c._on_auth_completed("token-123")
+
+    assert painted_rows[:2] == [1, 2]
+    assert c.allAnimeModel.rowCount() == 2
+    assert "Sincronizzati 2 anime" in c.statusMessage
+
+
+def test_integration_resync_does_not_stream_partial_pages(monkeypatch):
+    c = _make_controller(monkeypatch, service_cls=PagedAniListService)
+    c._on_auth_completed("token-123")
+    painted_rows = []
+    c.animeListChanged.connect(lambda: painted_rows.append(c.allAnimeModel.rowCount()))
+
+    c.syncAnimeList()
+
+    assert 1 not in painted_rows
+    assert c.allAnimeModel.rowCount() == 2
+
+
+class DeltaAniListService(FakeAniListService):
+    def __init__(self):
+        super().__init__()
+        self.delta_calls = []
+        self.next_delta = {"changed": [], "media_ids": [1, 2], "airing": {}}
+
+    def get_watching_anime(self, user_id):
+        entries = super().get_watching_anime(user_id)
+        for entry in entries:
+            entry["updatedAt"] = 100
+        return entries
+
+    def get_watching_anime_delta(self, user_id, updated_since, stale_media_ids=()):
+        self.delta_calls.append(updated_since)
+        return self.next_delta
+
+
+def test_integration_delta_sync_merges_changes_and_removals(monkeypatch):
+    c = _make_controller(monkeypatch, service_cls=DeltaAniListService)
+    c._on_auth_completed("token-123")
+    svc = c._anilist_service
+    assert c._list_sync_watermark == 100
+    untouched = c._anime_by_id[1]
+
+    changed = svc.get_watching_anime(77)[1]
+    changed["updatedAt"] = 250
+    changed["progress"] = 9
+    svc.next_delta = {"changed": [changed], "media_ids": [2], "airing": {}}
+
+    c.syncAnimeList()
+
+    assert svc.delta_calls == [100]
+    assert c._list_sync_watermark == 250
+    assert 1 not in c._anime_by_id
+    assert c._anime_by_id[2]["progress"] == 9
+    assert c._anime_by_id[2]["display_title"] == "Oshi no Ko"
+    assert c.allAnimeModel.rowCount() == 1
+    assert untouched not in c._full_anime_list
+
+
+def test_integration_delta_sync_without_changes_keeps_models(monkeypatch):
+    c = _make_controller(monkeypatch, service_cls=DeltaAniListService)
+    c._on_auth_completed("token-123")
+    revision = c._data_revision
+
+    c.syncAnimeList()
+
+    assert c._anilist_service.delta_calls == [100]
+    assert c._data_revision == revision
+    assert "Sincronizzati 2 anime" in c.statusMessage
+
+
+def test_integration_cold_start_renders_from_list_snapshot(monkeypatch, tmp_path):
+    monkeypatch.setenv("AIRINGDECK_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("AIRINGDECK_ANILIST_CACHE_ENABLED", "1")
+    first = _make_controller(monkeypatch)
+    first._on_auth_completed("token-123")
+    assert first._snapshot_path.exists()
+
+    c = _make_controller(monkeypatch, initial_store=dict(FakeSettings._store))
+    c._load_offline_cache()
+
+    assert c.isAuthenticated is True
+    assert c.allAnimeModel.rowCount() == 2
+    assert sorted(c._anime_by_id) == [1, 2]
+    assert c._anime_by_id[2]["display_title"] == "Oshi no Ko"
+    assert c._anime_by_id[2]["airing_time_formatted"] != ""
+    assert "Drama" in c.availableGenres
+
+
+def test_integration_sync_result_rederives_when_title_setting_changed(monkeypatch):
+    from core.list_processing import prepare_anime_list
+
+    c = _make_controller(monkeypatch)
+    c._is_authenticated = True
+    c._user_info = {"id": 77, "name": "ketou"}
+    entries = FakeAniListService().get_watching_anime(77)
+    entries[0]["media"]["title"]["english"] = "One Piece EN"
+    prepared = prepare_anime_list(entries, use_english_title=False, language="it")
+    c._use_english_title = True
+
+    c._on_sync_worker_result(prepared)
+
+    assert c._anime_by_id[1]["display_title"] == "One Piece EN"
+    assert c.allAnimeModel.rowCount() == 2
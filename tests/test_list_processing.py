@@ -0,0 +1,123 @@
+from datetime import datetime, timedelta
+
+from hypothesis import given, strategies as st
+
+from core.list_processing import (
+    PreparedList,
+    fetch_prepared_delta,
+    fetch_prepared_list,
+    format_countdown,
+    next_countdown_change,
+    prepare_anime_list,
+)
+
+
+def _entry(media_id, romaji, english, day_offset=None, genres=(), score=None, updated_at=0):
+    media = {
+        "id": media_id,
+        "title": {"romaji": romaji, "english": english},
+        "genres": list(genres),
+        "averageScore": score,
+        "nextAiringEpisode": None,
+    }
+    if day_offset is not None:
+        airing_at = int((datetime.now() + timedelta(days=day_offset, hours=1)).timestamp())
+        media["nextAiringEpisode"] = {"episode": 2, "airingAt": airing_at}
+    return {"media": media, "progress": 1, "updatedAt": updated_at}
+
+
+def _drain(generator):
+    pages = []
+    while True:
+        try:
+            pages.append(next(generator))
+        except StopIteration as stop:
+            return pages, stop.value
+
+
+def test_prepare_anime_list_derives_and_buckets():
+    entries = [
+        _entry(1, "Shingeki", "Attack on Titan", 0, ["Action"], 85, updated_at=10),
+        _entry(2, "Frieren", None, 1, ["Fantasy", "Drama"], 0, updated_at=30),
+        _entry(3, "Planned", None, None, ["Action"]),
+    ]
+    today = (datetime.now() + timedelta(hours=1)).weekday()
+
+    prepared = prepare_anime_list(entries, use_english_title=True, language="en", today_weekday=today)
+
+    assert prepared.entries[0]["display_title"] == "Attack on Titan"
+    assert prepared.entries[0]["_search_blob"] == "shingeki attack on titan"
+    assert prepared.entries[0]["rating_display"] == "85/100"
+    assert prepared.entries[0]["is_today"] is True
+    assert prepared.entries[1]["rating_display"] == "--"
+    assert prepared.entries[2]["calendar_day"] == -1
+    assert prepared.entries[2]["airing_time_formatted"] == "TBA"
+    assert sum(prepared.daily_counts) == 2
+    assert list(prepared.table.airing_rows) == [0, 1]
+    assert sorted(prepared.by_id) == [1, 2, 3]
+    assert prepared.genres == ["Action", "Drama", "Fantasy"]
+    assert prepared.watermark == 30
+
+
+def test_fetch_prepared_list_relays_derived_pages():
+    def fetch_pages(user_id):
+        first = [_entry(1, "One", None, 0)]
+        second = [_entry(2, "Two", None, 2)]
+        yield first
+        yield second
+        return first + second
+
+    pages, prepared = _drain(fetch_prepared_list(fetch_pages, 7, False, "it"))
+
+    assert [p[0]["display_title"] for p in pages] == ["One", "Two"]
+    assert isinstance(prepared, PreparedList)
+    assert sorted(prepared.by_id) == [1, 2]
+    assert prepared.language == "it"
+
+
+def test_fetch_prepared_list_accepts_plain_fetchers():
+    pages, prepared = _drain(fetch_prepared_list(lambda user_id: [_entry(5, "Five", None, 0)], 7, False, "en"))
+
+    assert pages == []
+    assert prepared.entries[0]["display_title"] == "Five"
+
+
+def test_fetch_prepared_delta_derives_changed_entries():
+    def fetch_delta(user_id, since, stale):
+        assert (user_id, since, stale) == (3, 100, [9])
+        return {"changed": [_entry(1, "One", "ONE", 0)], "media_ids": [1], "airing": {}}
+
+    delta = fetch_prepared_delta(fetch_delta, 3, 100, [9], True, "en")
+
+    assert delta["changed"][0]["display_title"] == "ONE"
+    assert delta["use_english_title"] is True
+    assert delta["language"] == "en"
+
+
+def test_format_countdown_transitions():
+    now = datetime(2026, 1, 5, 12, 0, 0)
+    ts = lambda **kw: int((now + timedelta(**kw)).timestamp())  # noqa: E731
+
+    assert format_countdown(ts(minutes=30), "en", now) == "12:30 (in 30m)"
+    assert format_countdown(ts(hours=2, minutes=5), "en", now) == "14:05 (in 2h 5m)"
+    assert format_countdown(ts(days=1, hours=3), "en", now) == "15:00 (in 1d 3h)"
+    assert format_countdown(ts(minutes=-10), "en", now) == "Airing now"
+    assert format_countdown(ts(hours=-2), "it", now) == "Già uscito alle 10:00"
+
+
+@given(
+    offset=st.integers(min_value=-4000, max_value=10 * 86400),
+)
+def test_next_countdown_change_matches_format_boundaries(offset):
+    airing_at = 1_900_000_000
+    now_ts = airing_at - offset
+    deadline = next_countdown_change(airing_at, now_ts)
+    text = format_countdown(airing_at, "en", datetime.fromtimestamp(now_ts))
+
+    if deadline is None:
+        assert text.startswith("Aired at")
+        return
+    assert deadline > now_ts
+    # Unchanged until just before the deadline, different once it passes.
+    assert format_countdown(airing_at, "en", datetime.fromtimestamp(deadline - 1)) == text
+    assert format_countdown(airing_at, "en", datetime.fromtimestamp(deadline)) != text
@@ -0,0 +1,107 @@
+import struct
+
+import core.list_snapshot as list_snapshot
+from core.list_snapshot import read_snapshot, snapshot_variant, write_snapshot
+
+
+def _entry(media_id, title, day, score):
+    return {
+        "status": "CURRENT",
+        "progress": 4,
+        "updatedAt": 1700000000 + media_id,
+        "media": {
+            "id": media_id,
+            "title": {"romaji": title, "english": None, "native": "推しの子"},
+            "coverImage": {"extraLarge": "https://img/x.jpg", "large": None, "medium": None},
+            "nextAiringEpisode": {"episode": 5, "airingAt": 1900000000, "timeUntilAiring": 0},
+            "genres": ["Drama", "Idol"],
+            "averageScore": score,
+            "siteUrl": f"https://anilist.co/anime/{media_id}",
+        },
+        "display_title": title,
+        "_search_blob": f"{title.lower()} ",
+        "calendar_day": day,
+        "rating_display": f"{score}/100" if score else "--",
+        "rating_sort_score": float(score) if score else -1.0,
+    }
+
+
+def test_snapshot_round_trip_preserves_derived_rows(tmp_path):
+    path = tmp_path / "list.snapshot"
+    entries = [_entry(1, "Oshi no Ko", 2, 91), _entry(2, "Frieren", 4, None)]
+
+    write_snapshot(path, entries, user_id=77, variant=snapshot_variant(False, "it"))
+    out = read_snapshot(path, user_id=77, variant=snapshot_variant(False, "it"))
+
+    assert [e["display_title"] for e in out] == ["Oshi no Ko", "Frieren"]
+    assert out[0]["_search_blob"] == "oshi no ko "
+    assert out[0]["calendar_day"] == 2
+    assert out[0]["rating_sort_score"] == 91.0
+    assert out[0]["media"]["title"]["native"] == "推しの子"
+    assert out[0]["media"]["genres"] == ["Drama", "Idol"]
+    assert out[0]["media"]["nextAiringEpisode"]["airingAt"] == 1900000000
+    assert out[1]["media"]["averageScore"] is None
+    assert out[1]["rating_display"] == "--"
+    assert out[1]["rating_value"] is None
+
+
+def test_snapshot_round_trips_lone_surrogates(tmp_path):
+    path = tmp_path / "list.snapshot"
+    entries = [_entry(1, "Bad \ud800 title", 1, 70), _entry(2, "Next", 2, 80)]
+
+    write_snapshot(path, entries, user_id=77, variant=0)
+    out = read_snapshot(path, user_id=77, variant=0)
+
+    assert [e["display_title"] for e in out] == ["Bad \ud800 title", "Next"]
+
+
+def test_snapshot_keeps_a_zero_sort_score(tmp_path):
+    path = tmp_path / "list.snapshot"
+    zero = _entry(1, "Zero", 0, 0)
+    zero["rating_sort_score"] = 0.0
+    missing = _entry(2, "Missing", 0, None)
+    missing["rating_sort_score"] = None
+
+    write_snapshot(path, [zero, missing], user_id=77, variant=0)
+    out = read_snapshot(path, user_id=77, variant=0)
+
+    assert out[0]["rating_sort_score"] == 0.0
+    assert out[1]["rating_sort_score"] == -1.0
+
+
+def test_snapshot_rejects_other_user_variant_or_version(tmp_path, monkeypatch):
+    path = tmp_path / "list.snapshot"
+    write_snapshot(path, [_entry(1, "One", 0, 80)], user_id=77, variant=0)
+
+    assert read_snapshot(path, user_id=78, variant=0) is None
+    assert read_snapshot(path, user_id=77, variant=1) is None
+
+    monkeypatch.setattr(list_snapshot, "FORMAT_VERSION", list_snapshot.FORMAT_VERSION + 1)
+    assert read_snapshot(path, user_id=77, variant=0) is None
+
+
+def test_snapshot_ignores_missing_and_truncated_files(tmp_path):
+    path = tmp_path / "list.snapshot"
+    assert read_snapshot(path, user_id=1, variant=0) is None
+
+    write_snapshot(path, [_entry(1, "One", 0, 80)], user_id=1, variant=0)
+    data = path.read_bytes()
+    path.write_bytes(data[:-3])
+    assert read_snapshot(path, user_id=1, variant=0) is None
+
+    path.write_bytes(b"")
+    assert read_snapshot(path, user_id=1, variant=0) is None
+
+    path.write_bytes(struct.pack("<4s", b"JUNK") + data[4:])
+    assert read_snapshot(path, user_id=1, variant=0) is None
+
+
+def test_snapshot_keeps_synonyms(tmp_path):
+    path = tmp_path / "list.snapshot"
+    entry = _entry(1, "Oshi no Ko", 2, 91)
+    entry["media"]["synonyms"] = ["My Star", "OnK"]
+
+    write_snapshot(path, [entry], user_id=77, variant=0)
+    out = read_snapshot(path, user_id=77, variant=0)
+
+    assert out[0]["media"]["synonyms"] == ["My Star", "OnK"]
@@ -1,93 +1,127 @@
+import random
+from array import array
+
 import core.native_accel as native_accel
 
 
-def _entries():
-    return [
-        {"_search_blob": "one piece"},
-        {"_search_blob": "oshi no ko"},
-        {"_search_blob": "jujutsu kaisen"},
-    ]
+def _table():
+    from core.entry_table import EntryTable
+
+    return EntryTable.from_entries([
+        {"_search_blob": "one piece", "calendar_day": 1, "media": {"id": 1, "genres": ["Action"], "averageScore": 82}},
+        {"_search_blob": "oshi no ko", "calendar_day": 2, "media": {"id": 2, "genres": ["Drama"], "averageScore": 91}},
+        {"_search_blob": "kaiju no 8", "calendar_day": 2, "media": {"id": 3, "genres": ["Action"], "averageScore": 75}},
+    ])
 
 
-def test_filter_entries_python_fallback(monkeypatch):
+def test_filter_sort_buckets_python_fallback_filters(monkeypatch):
     monkeypatch.setattr(native_accel, "_native", None)
-    data = _entries()
+    table = _table()
 
-    out = native_accel.filter_entries(data, "ko")
+    def combined(query, genre, score, only_today):
+        return list(native_accel.filter_sort_buckets(table, table.airing_rows, query, genre, score, only_today, 2)[1])
 
-    assert len(out) == 1
-    assert out[0]["_search_blob"] == "oshi no ko"
+    assert combined("no", "", 0, False) == [1, 2]
+    assert combined("", "Action", 80, False) == [0]
+    assert combined("", "", 0, True) == [1, 2]
+    assert combined("", "Horror", 0, False) == []
 
 
-def test_filter_entries_native_path(monkeypatch):
-    class FakeNative:
-        @staticmethod
-        def filter_contains_indices(entries, query):
-            assert query == "ju"
-            return [2]
+def test_filter_sort_buckets_matches_per_day_filtering(monkeypatch):
+    monkeypatch.setattr(native_accel, "_native", None)
+    table = _table()
+
+    days, combined, counts = native_accel.filter_sort_buckets(
+        table, table.airing_rows, "", "", 0, False, 2, "score", descending=True
+    )
 
-    monkeypatch.setattr(native_accel, "_native", FakeNative())
-    data = _entries()
+    assert list(combined) == [1, 0, 2]
+    assert list(days[1]) == [0] and list(days[2]) == [1, 2]
+    assert counts == [0, 1, 2, 0, 0, 0, 0]
+    for day in range(7):
+        assert list(days[day]) == table.sort_rows(table.day_rows[day], "score", False)
+    assert list(native_accel.filter_sort_buckets(table, [2, 0, 1], "", "", 0, True, 2)[1]) == [2, 1]
+    assert native_accel.filter_sort_buckets(table, table.airing_rows, "", "Horror", 0, False, 2)[2] == [0] * 7
+
+
+def test_filter_sort_buckets_native_returns_int32_buffers(monkeypatch):
+    if not native_accel.is_native_available():
+        return
+    table = _table()
+    cases = [
+        ("no", "", 0, False, "airing_time", False),
+        ("", "action", 0, False, "score", True),
+        ("", "", 80, True, None, False),
+        ("", "drama", 0, False, "title", True),
+    ]
+    native_out = [
+        native_accel.filter_sort_buckets(table, table.airing_rows, q, g, s, t, 2, field, d)
+        for q, g, s, t, field, d in cases
+    ]
+    days, combined, _ = native_out[1]
+    assert isinstance(combined, memoryview) and combined.format == "i" and combined.readonly
+    assert all(isinstance(day, memoryview) for day in days)
+
+    monkeypatch.setattr(native_accel, "_native", None)
+    python_out = [
+        native_accel.filter_sort_buckets(table, table.airing_rows, q, g, s, t, 2, field, d)
+        for q, g, s, t, field, d in cases
+    ]
 
-    out = native_accel.filter_entries(data, "ju")
+    def as_lists(result):
+        days, combined, counts = result
+        return [list(day) for day in days], list(combined), counts
 
-    assert len(out) == 1
-    assert out[0]["_search_blob"] == "jujutsu kaisen"
+    assert [as_lists(out) for out in native_out] == [as_lists(out) for out in python_out]
 
 
-def test_filter_entries_advanced_python_fallback(monkeypatch):
+def test_sort_rows_by_key_is_stable_in_both_directions(monkeypatch):
     monkeypatch.setattr(native_accel, "_native", None)
-    data = [
-        {
-            "_search_blob": "one piece",
-            "calendar_day": 1,
-            "media": {"genres": ["Action"], "averageScore": 82},
-        },
-        {
-            "_search_blob": "oshi no ko",
-            "calendar_day": 2,
-            "media": {"genres": ["Drama"], "averageScore": 91},
-        },
+    keys = array("q", [5, 1, 5, 3, 1])
+
+    assert native_accel.sort_rows_by_key([0, 1, 2, 3, 4], keys) == [1, 4, 3, 0, 2]
+    assert native_accel.sort_rows_by_key([4, 3, 2, 1, 0], keys, descending=True) == [2, 0, 3, 4, 1]
+    assert native_accel.sort_rows_by_key([3], keys) == [3]
+
+
+def test_sort_rows_by_key_native_matches_python(monkeypatch):
+    if not native_accel.is_native_available():
+        return
+    rng = random.Random(11)
+    columns = [
+        array("q", [rng.choice([1_700_000_000 + rng.randrange(50), 1 << 62]) for _ in range(300)]),
+        array("i", [rng.randrange(20) for _ in range(300)]),
+        array("d", [rng.choice([-1.0, 7.5, 8.25, 9.0]) for _ in range(300)]),
     ]
+    rows = array("i", rng.sample(range(300), 200))
+    cases = [(column, descending) for column in columns for descending in (False, True)]
+    native_out = [native_accel.sort_rows_by_key(rows, column, descending) for column, descending in cases]
 
-    out = native_accel.filter_entries_advanced(
-        data,
-        query="ko",
-        selected_genre="drama",
-        min_score=90,
-        only_today=True,
-        today_weekday=2,
-    )
+    monkeypatch.setattr(native_accel, "_native", None)
+    python_out = [native_accel.sort_rows_by_key(rows, column, descending) for column, descending in cases]
 
-    assert len(out) == 1
-    assert out[0]["_search_blob"] == "oshi no ko"
-
-
-def test_filter_entries_advanced_native_path(monkeypatch):
-    class FakeNative:
-        @staticmethod
-        def filter_advanced_indices(entries, query, selected_genre, min_score, only_today, today_weekday):
-            assert query == "one"
-            assert selected_genre == "action"
-            assert min_score == 70
-            assert only_today == 0
-            assert today_weekday == 1
-            return [0]
-
-    monkeypatch.setattr(native_accel, "_native", FakeNative())
-    data = [
-        {"_search_blob": "one piece", "calendar_day": 1, "media": {"genres": ["Action"], "averageScore": 80}},
-        {"_search_blob": "jujutsu kaisen", "calendar_day": 1, "media": {"genres": ["Action"], "averageScore": 95}},
+    assert native_out == python_out
+
+
+def test_fuzzy_rank_orders_substring_subsequence_and_typos(monkeypatch):
+    monkeypatch.setattr(native_accel, "_native", None)
+    texts = [
+        "frieren\x1fsousou no frieren",
+        "oshi no ko\x1f推しの子",
+        "jujutsu kaisen",
+        "fire force",
     ]
 
-    out = native_accel.filter_entries_advanced(
-        data,
-        query="one",
-        selected_genre="action",
-        min_score=70,
-        only_today=False,
-        today_weekday=1,
-    )
+    assert native_accel.fuzzy_rank(texts, "frieren") == [(0, 1050)]
+    assert [row for row, _ in native_accel.fuzzy_rank(texts, "freiren")] == [0]
+    assert native_accel.fuzzy_rank(texts, "推し") == [(1, 1050)]
+    assert [row for row, _ in native_accel.fuzzy_rank(texts, "jjk")] == [2]
+    assert native_accel.fuzzy_rank(texts, "zzzz") == []
+    assert len(native_accel.fuzzy_rank(texts, "f", limit=1)) == 1
+
 
-    assert len(out) == 1
-    assert out[0]["_search_blob"] == "one piece"
+def test_fuzzy_max_errors_grow_with_query():
+    assert native_accel.fuzzy_max_errors(3) == 0
+    assert native_accel.fuzzy_max_errors(5) == 1
+    assert native_accel.fuzzy_max_errors(12) == 2
+    assert native_accel.fuzzy_max_errors(40) == 0
@@ -94,7 +94,8 @@ def _make_controller(monkeypatch, initial_store=None):
     monkeypatch.setattr(app_controller_module, "UpdateService", _FakeUpdateService)
     monkeypatch.setattr(app_controller_module.AppController, "_init_tray_icon", lambda self: None)
     controller = app_controller_module.AppController(None)
-    controller._update_timer.stop()
+    controller._notification_timer.stop()
+    controller._countdown_timer.stop()
     controller._filter_update_timer.stop()
     controller._sync_retry_timer.stop()
     return controller
@@ -160,3 +161,27 @@ def test_open_selected_anime_on_anilist_uses_site_url(monkeypatch):
     c.openSelectedAnimeOnAniList()
 
     assert opened["url"] == "https://anilist.co/anime/123"
+
+
+def test_response_cache_disabled_by_default_and_purged(monkeypatch, tmp_path):
+    monkeypatch.setenv("AIRINGDECK_CACHE_DIR", str(tmp_path))
+    monkeypatch.delenv("AIRINGDECK_ANILIST_CACHE_ENABLED", raising=False)
+    stale = tmp_path / "anilist_responses.sqlite3"
+    stale.write_bytes(b"old")
+
+    c = _make_controller(monkeypatch)
+
+    assert c._anilist_cache_enabled is False
+    assert not stale.exists()
+
+
+def test_logout_purges_enabled_response_cache(monkeypatch, tmp_path):
+    monkeypatch.setenv("AIRINGDECK_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("AIRINGDECK_ANILIST_CACHE_ENABLED", "1")
+    c = _make_controller(monkeypatch)
+    c._response_cache.put("k", {"Viewer": {"id": 7}}, ttl_sec=60)
+    assert c._response_cache.path.exists()
+
+    c.logout()
+
+    assert not c._response_cache.path.exists()
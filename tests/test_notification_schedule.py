@@ -0,0 +1,74 @@
+from core.notification_schedule import EpisodeAlert, NotificationSchedule
+
+
+NOW = 1_900_000_000
+
+
+def test_future_leads_are_scheduled_and_passed_leads_collapse():
+    schedule = NotificationSchedule()
+    # 20 minutes away: the 30 and 60 minute leads already passed, 15 and 5 are ahead.
+    schedule.update([(1, 3, NOW + 1200)], [5, 15, 30, 60], NOW)
+
+    assert len(schedule) == 3
+    assert schedule.next_deadline() == NOW + 1200 - 30 * 60
+    assert schedule.pop_due(NOW) == [EpisodeAlert(1, 3, NOW + 1200, 30)]
+    assert schedule.next_deadline() == NOW + 1200 - 15 * 60
+
+
+def test_update_is_incremental_and_skips_sent_alerts():
+    schedule = NotificationSchedule()
+    schedule.update([(1, 3, NOW + 600), (2, 7, NOW + 7200)], [15], NOW)
+    assert [a.media_id for a in schedule.pop_due(NOW)] == [1]
+
+    schedule.update([(1, 3, NOW + 600), (2, 7, NOW + 7200)], [15], NOW + 5)
+    assert len(schedule) == 1
+    assert schedule.pop_due(NOW + 60) == []
+
+    schedule.update([], [15], NOW + 10)
+    assert len(schedule) == 0
+    assert schedule.next_deadline() is None
+
+
+def test_pop_due_coalesces_window_and_one_alert_per_episode():
+    schedule = NotificationSchedule()
+    schedule.update(
+        [(1, 1, NOW + 900), (2, 1, NOW + 930), (3, 1, NOW + 4000)],
+        [15],
+        NOW,
+    )
+
+    batch = schedule.pop_due(NOW, coalesce_sec=60)
+
+    assert [a.media_id for a in batch] == [1, 2]
+    assert schedule.next_deadline() == NOW + 4000 - 900
+
+
+def test_sent_memory_is_bounded():
+    schedule = NotificationSchedule(max_remembered=2)
+    schedule.update([(i, 1, NOW + 60) for i in range(1, 4)], [5], NOW)
+    schedule.pop_due(NOW)
+
+    assert not schedule.was_sent(EpisodeAlert(1, 1, NOW + 60, 5))
+    assert schedule.was_sent(EpisodeAlert(3, 1, NOW + 60, 5))
+
+
+def test_late_alerts_within_grace_are_delivered_not_dropped():
+    schedule = NotificationSchedule(late_grace_sec=900)
+    schedule.update([(1, 1, NOW + 400), (2, 1, NOW + 700)], [15], NOW)
+
+    # Woken up after both episodes aired; a sync sees them before the timer does.
+    schedule.update([(1, 1, NOW + 400), (2, 1, NOW + 700)], [15], NOW + 1400)
+    assert len(schedule) == 1
+    assert schedule.pop_due(NOW + 1400) == [EpisodeAlert(2, 1, NOW + 700, 15)]
+
+    # An aired episode never gains new alerts.
+    schedule.update([(3, 1, NOW + 1300)], [15], NOW + 1400)
+    assert len(schedule) == 0
+
+
+def test_late_alerts_past_grace_are_dropped():
+    schedule = NotificationSchedule(late_grace_sec=900)
+    schedule.update([(1, 1, NOW + 600)], [15], NOW)
+
+    assert schedule.pop_due(NOW + 1600) == []
+    assert schedule.was_sent(EpisodeAlert(1, 1, NOW + 600, 15))
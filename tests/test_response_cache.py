@@ -0,0 +1,80 @@
+import os
+
+from services.response_cache import ResponseCache, default_cache_dir
+
+
+def test_make_key_is_stable_and_scoped():
+    a = ResponseCache.make_key("query { Viewer { id } }", {"b": 1, "a": 2}, "ns1")
+    b = ResponseCache.make_key("query {\n  Viewer { id }\n}", {"a": 2, "b": 1}, "ns1")
+    c = ResponseCache.make_key("query { Viewer { id } }", {"a": 2, "b": 1}, "ns2")
+
+    assert a == b
+    assert a != c
+
+
+def test_put_get_fresh_then_stale(tmp_path, monkeypatch):
+    cache = ResponseCache(tmp_path / "cache.sqlite3")
+    now = {"t": 1000.0}
+    monkeypatch.setattr("services.response_cache.time.time", lambda: now["t"])
+
+    cache.put("k", {"Viewer": {"id": 1}}, ttl_sec=60)
+    hit = cache.get("k")
+    assert hit.fresh is True
+    assert hit.payload == {"Viewer": {"id": 1}}
+
+    now["t"] += 120
+    assert cache.get("k", allow_stale=False) is None
+    stale = cache.get("k")
+    assert stale.fresh is False
+    assert stale.payload == {"Viewer": {"id": 1}}
+
+
+def test_entries_expire_after_stale_window(tmp_path, monkeypatch):
+    cache = ResponseCache(tmp_path / "cache.sqlite3", max_stale_sec=10)
+    now = {"t": 1000.0}
+    monkeypatch.setattr("services.response_cache.time.time", lambda: now["t"])
+
+    cache.put("k", [1, 2, 3], ttl_sec=5)
+    now["t"] += 30
+
+    assert cache.get("k") is None
+    assert cache.total_bytes() == 0
+
+
+def test_lru_eviction_keeps_recently_used(tmp_path, monkeypatch):
+    cache = ResponseCache(tmp_path / "cache.sqlite3", max_bytes=250)
+    now = {"t": 1000.0}
+    monkeypatch.setattr("services.response_cache.time.time", lambda: now["t"])
+    blob = "x" * 100
+
+    cache.put("a", blob, ttl_sec=60)
+    now["t"] += 1
+    cache.put("b", blob, ttl_sec=60)
+    now["t"] += 1
+    assert cache.get("a") is not None
+    now["t"] += 1
+    cache.put("c", blob, ttl_sec=60)
+
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+    assert cache.total_bytes() <= 250
+
+
+def test_purge_removes_database_file(tmp_path):
+    path = tmp_path / "nested" / "cache.sqlite3"
+    cache = ResponseCache(path)
+    cache.put("k", {"a": 1}, ttl_sec=60)
+    assert path.exists()
+    if os.name != "nt":
+        assert (path.stat().st_mode & 0o077) == 0
+
+    cache.purge()
+
+    assert not path.exists()
+    assert cache.get("k") is None
+
+
+def test_default_cache_dir_honours_override(monkeypatch, tmp_path):
+    monkeypatch.setenv("AIRINGDECK_CACHE_DIR", str(tmp_path))
+    assert default_cache_dir() == tmp_path
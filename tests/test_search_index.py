@@ -0,0 +1,45 @@
+from hypothesis import given, strategies as st
+
+from core.search_index import SearchIndex
+
+
+BLOBS = ["one piece", "oshi no ko", "jujutsu kaisen", "kaiju no 8", "dandadan"]
+
+
+def test_candidates_narrow_by_trigrams():
+    index = SearchIndex(BLOBS)
+
+    assert index.candidates("kai") == [2, 3]
+    assert index.candidates("xyz") == []
+    assert index.candidates("ko") is None
+
+
+def test_search_refines_previous_matches(monkeypatch):
+    index = SearchIndex(BLOBS)
+    assert index.search("no") == [1, 3]
+
+    def fail(query):
+        raise AssertionError("refinement should reuse previous matches")
+
+    monkeypatch.setattr(SearchIndex, "candidates", lambda self, query: fail(query))
+    assert index.search("no k") == [1]
+    assert index.search("no k") == [1]
+
+
+def test_restrict_keeps_row_order():
+    index = SearchIndex(BLOBS)
+
+    assert index.restrict([4, 3, 2, 1], "kai") == [3, 2]
+    assert index.restrict([4, 3], "") == [4, 3]
+
+
+@given(
+    blobs=st.lists(st.text(alphabet="abc ", max_size=12), max_size=30),
+    queries=st.lists(st.text(alphabet="abc ", max_size=5), max_size=6),
+)
+def test_search_matches_linear_scan(blobs, queries):
+    index = SearchIndex(blobs)
+    for query in queries:
+        expected = [row for row, blob in enumerate(blobs) if query in blob]
+        result = index.search(query)
+        assert (result if result is not None else list(range(len(blobs)))) == expected
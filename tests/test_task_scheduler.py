@@ -0,0 +1,178 @@
+import time
+
+from core.task_scheduler import TaskPriority, TaskScheduler
+from core.worker import TaskTimeout, Worker
+
+
+class _DeferredPool:
+    def __init__(self, threads=2):
+        self.queue = []
+        self._threads = threads
+
+    def maxThreadCount(self):
+        return self._threads
+
+    def start(self, worker):
+        self.queue.append(worker)
+
+    def run_next(self):
+        self.queue.pop(0).run()
+
+
+def _worker(log, name, value=None):
+    worker = Worker(lambda: value if value is not None else name)
+    worker.signals.result.connect(lambda result: log.append((name, result)))
+    worker.signals.finished.connect(lambda: log.append((name, "finished")))
+    return worker
+
+
+def test_higher_priority_runs_first_and_low_priority_keeps_a_thread_free():
+    pool = _DeferredPool(threads=2)
+    scheduler = TaskScheduler(pool)
+    log = []
+
+    scheduler.start(_worker(log, "prefetch-1"), TaskPriority.PREFETCH)
+    scheduler.start(_worker(log, "prefetch-2"), TaskPriority.PREFETCH)
+    scheduler.start(_worker(log, "update"), TaskPriority.UPDATE_CHECK)
+    assert len(pool.queue) == 1 and scheduler.queued == 2
+
+    scheduler.start(_worker(log, "sync"), TaskPriority.USER_SYNC)
+    assert len(pool.queue) == 2
+
+    pool.run_next()
+    pool.run_next()
+    assert [name for name, value in log if value == "finished"] == ["prefetch-1", "sync"]
+    # The update check was queued after the first prefetch but outranks the second.
+    assert pool.queue[0].fn() == "update"
+
+
+def test_identical_in_flight_tasks_are_coalesced():
+    pool = _DeferredPool()
+    scheduler = TaskScheduler(pool)
+    log = []
+
+    first = scheduler.start(_worker(log, "a", value=42), TaskPriority.UPDATE_CHECK, key="update-check")
+    second = scheduler.start(_worker(log, "b"), TaskPriority.UPDATE_CHECK, key="update-check")
+
+    assert second is first
+    assert len(pool.queue) == 1 and scheduler.coalesced == 1
+    pool.run_next()
+    assert ("a", 42) in log and ("b", 42) in log
+    assert ("b", "finished") in log
+
+    scheduler.start(_worker(log, "c"), TaskPriority.UPDATE_CHECK, key="update-check")
+    assert len(pool.queue) == 1
+
+
+def test_cancelled_tasks_skip_result_but_still_finish():
+    pool = _DeferredPool(threads=1)
+    scheduler = TaskScheduler(pool)
+    log = []
+
+    running = scheduler.start(_worker(log, "running"), TaskPriority.USER_SYNC)
+    scheduler.start(_worker(log, "queued"), TaskPriority.BACKGROUND_SYNC, key="bg")
+
+    assert scheduler.cancel("bg")
+    assert log == [("queued", "finished")]
+    running.cancel()
+    pool.run_next()
+
+    assert ("running", "running") not in log
+    assert ("running", "finished") in log
+    assert scheduler.stats()["cancelled"] == 2
+    assert scheduler.running == 0 and scheduler.queued == 0
+
+
+def test_deadline_reports_timeout_and_stats_track_queue():
+    pool = _DeferredPool(threads=1)
+    scheduler = TaskScheduler(pool)
+    log = []
+    errors = []
+
+    scheduler.start(_worker(log, "slow"), TaskPriority.USER_SYNC)
+    late = _worker(log, "late")
+    late.signals.error.connect(errors.append)
+    scheduler.start(late, TaskPriority.USER_SYNC, timeout_sec=0.01)
+
+    stats = scheduler.stats()
+    assert stats["queued"] == 1 and stats["running"] == 1
+    assert stats["queuedByPriority"]["USER_SYNC"] == 1
+
+    time.sleep(0.02)
+    pool.run_next()
+
+    assert errors and errors[0][0] is TaskTimeout
+    assert ("late", "finished") in log and ("late", "late") not in log
+    stats = scheduler.stats()
+    assert stats["timedOut"] == 1 and stats["completed"] == 1
+    assert stats["avgRunMs"] >= 0 and stats["queued"] == 0
+
+
+def test_lane_starts_workers_at_its_priority():
+    pool = _DeferredPool(threads=3)
+    scheduler = TaskScheduler(pool)
+    lane = scheduler.lane(TaskPriority.PREFETCH)
+    log = []
+
+    for index in range(3):
+        lane.start(_worker(log, f"cover-{index}"))
+
+    assert lane.maxThreadCount() == 3
+    assert len(pool.queue) == 2 and scheduler.queued == 1
+
+
+def test_deadline_does_not_discard_a_started_task():
+    pool = _DeferredPool(threads=1)
+    scheduler = TaskScheduler(pool)
+    log = []
+    errors = []
+
+    worker = _worker(log, "sync", value=7)
+    worker.signals.error.connect(errors.append)
+    scheduler.start(worker, TaskPriority.USER_SYNC, timeout_sec=0.01)
+    time.sleep(0.02)
+    pool.run_next()
+
+    assert ("sync", 7) in log and errors == []
+    assert scheduler.stats()["timedOut"] == 0
+
+
+def test_keyed_start_from_a_result_slot_is_not_merged_into_the_settled_task():
+    pool = _DeferredPool()
+    scheduler = TaskScheduler(pool)
+    log = []
+    restarted = []
+
+    first = _worker(log, "first", value=1)
+    second = _worker(log, "second", value=2)
+    first.signals.result.connect(
+        lambda _: restarted.append(scheduler.start(second, TaskPriority.UPDATE_CHECK, key="update-check"))
+    )
+    task = scheduler.start(first, TaskPriority.UPDATE_CHECK, key="update-check")
+    pool.run_next()
+
+    assert restarted and restarted[0] is not task
+    assert scheduler.coalesced == 0 and len(pool.queue) == 1
+    pool.run_next()
+    assert ("second", 2) in log
+
+
+def test_overdue_task_behind_the_queue_head_is_reported_on_next_dispatch():
+    pool = _DeferredPool(threads=1)
+    scheduler = TaskScheduler(pool)
+    log = []
+    errors = []
+
+    scheduler.start(_worker(log, "sync"), TaskPriority.USER_SYNC)
+    scheduler.start(_worker(log, "update"), TaskPriority.UPDATE_CHECK)
+    late = _worker(log, "prefetch")
+    late.signals.error.connect(errors.append)
+    scheduler.start(late, TaskPriority.PREFETCH, timeout_sec=0.01)
+    time.sleep(0.02)
+
+    # Any dispatch sweeps the queue, even though "update" is still ahead.
+    scheduler.start(_worker(log, "background"), TaskPriority.BACKGROUND_SYNC)
+
+    assert errors and errors[0][0] is TaskTimeout
+    assert ("prefetch", "finished") in log
+    assert scheduler.queued == 2 and scheduler.stats()["timedOut"] == 1
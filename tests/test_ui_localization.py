@@ -80,7 +80,8 @@ def _controller(monkeypatch):
     monkeypatch.setattr(app_controller_module, "AniListService", DummyAniListService)
     monkeypatch.setattr(app_controller_module.AppController, "_init_tray_icon", lambda self: None)
     c = app_controller_module.AppController(None)
-    c._update_timer.stop()
+    c._notification_timer.stop()
+    c._countdown_timer.stop()
     c._filter_update_timer.stop()
     c._sync_retry_timer.stop()
     return c
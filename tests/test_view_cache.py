@@ -0,0 +1,24 @@
+from core.view_cache import ViewCache
+
+
+def test_lru_evicts_least_recently_used():
+    cache = ViewCache(capacity=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+def test_clear_keeps_counters():
+    cache = ViewCache()
+    cache.put("a", 1)
+    cache.get("a")
+    cache.clear()
+
+    assert cache.get("a") is None
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 0, "capacity": ViewCache.DEFAULT_CAPACITY}
@@ -37,3 +37,58 @@ def test_worker_emits_error_and_finished():
     assert got["error"][0] is RuntimeError
     assert "boom" in str(got["error"][1])
     assert got["finished"] == 1
+
+
+def test_worker_streams_generator_progress_and_returns_value():
+    got = {"result": None, "progress": []}
+
+    def fn():
+        yield [1, 2]
+        yield [3]
+        return [1, 2, 3]
+
+    worker = Worker(fn)
+    worker.signals.result.connect(lambda value: got.__setitem__("result", value))
+    worker.signals.progress.connect(lambda chunk: got["progress"].append(chunk))
+
+    worker.run()
+
+    assert got["progress"] == [[1, 2], [3]]
+    assert got["result"] == [1, 2, 3]
+
+
+def test_worker_cancelled_between_pages_stops_generator():
+    got = {"pages": [], "result": None, "error": None, "finished": 0, "closed": False}
+
+    def fn():
+        try:
+            yield [1]
+            yield [2]
+            return [1, 2]
+        finally:
+            got["closed"] = True
+
+    worker = Worker(fn)
+    worker.signals.progress.connect(lambda page: (got["pages"].append(page), worker.token.cancel()))
+    worker.signals.result.connect(lambda value: got.__setitem__("result", value))
+    worker.signals.error.connect(lambda err: got.__setitem__("error", err))
+    worker.signals.finished.connect(lambda: got.__setitem__("finished", got["finished"] + 1))
+
+    worker.run()
+
+    assert got["pages"] == [[1]]
+    assert got["closed"] is True
+    assert got["result"] is None and got["error"] is None
+    assert got["finished"] == 1
+
+
+def test_worker_past_deadline_still_emits_result():
+    got = {"result": None, "error": None}
+    worker = Worker(lambda: 1)
+    worker.token.deadline = 0.0
+    worker.signals.result.connect(lambda value: got.__setitem__("result", value))
+    worker.signals.error.connect(lambda err: got.__setitem__("error", err))
+
+    worker.run()
+
+    assert got["result"] == 1 and got["error"] is None